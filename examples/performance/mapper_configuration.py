@@ -0,0 +1,65 @@
+"""This series of tests illustrates the time taken to declare and configure
+a large number of mapped classes, which is the primary contributor to
+application startup time for applications with large models.
+
+Each class refers to the previously declared class by a many-to-one
+relationship with a backref, referred to by string name, so that both
+the declarative class registry as well as the relationship configuration
+process are exercised.
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import clear_mappers
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm import relationship
+from . import Profiler
+
+
+Profiler.init("mapper_configuration", num=500)
+
+
+def _declare_classes(Base, n):
+    # the declarative registry refers to classes weakly, so hold
+    # onto them here
+    classes = []
+    for i in range(n):
+        attrs = {
+            "__tablename__": "t%d" % i,
+            "id": Column(Integer, primary_key=True),
+            "name": Column(String(50)),
+            "data": Column(String(50)),
+        }
+        if i:
+            attrs["parent_id"] = Column(ForeignKey("t%d.id" % (i - 1)))
+            attrs["parent"] = relationship(
+                "C%d" % (i - 1), backref="children"
+            )
+        classes.append(type("C%d" % i, (Base,), attrs))
+    return classes
+
+
+@Profiler.setup
+def setup(dburl, echo, num):
+    clear_mappers()
+
+
+@Profiler.profile
+def test_declare_classes(n):
+    """Declare classes only, without configuring mappers."""
+    _declare_classes(declarative_base(), n)
+
+
+@Profiler.profile
+def test_declare_and_configure(n):
+    """Declare classes and run configure_mappers()."""
+    classes = _declare_classes(declarative_base(), n)
+    configure_mappers()
+    return classes
+
+
+if __name__ == "__main__":
+    Profiler.main()
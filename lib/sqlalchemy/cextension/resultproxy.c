@@ -668,9 +668,114 @@ static PyTypeObject BaseRowProxyType = {
     0                                   /* tp_new */
 };
 
+/**********************
+ * process_tuple_rows *
+ **********************/
+
+static PyObject *
+process_tuple_rows(PyObject *self, PyObject *args)
+{
+    PyObject *cls, *processors, *rows;
+    PyObject *processors_fastseq, *rows_fastseq, *row_fastseq;
+    PyObject *result, *row, *value, *func;
+    PyObject **valueptr, **funcptr;
+    PyTypeObject *type;
+    Py_ssize_t num_rows, num_processors, num_values, i, j;
+
+    if (!PyArg_ParseTuple(args, "OOO", &cls, &processors, &rows))
+        return NULL;
+
+    if (!PyType_Check(cls) ||
+            !PyType_IsSubtype((PyTypeObject *)cls, &PyTuple_Type)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "cls must be a subclass of tuple");
+        return NULL;
+    }
+    type = (PyTypeObject *)cls;
+
+    processors_fastseq = PySequence_Fast(processors,
+                                         "processors must be a sequence");
+    if (processors_fastseq == NULL)
+        return NULL;
+
+    rows_fastseq = PySequence_Fast(rows, "rows must be a sequence");
+    if (rows_fastseq == NULL) {
+        Py_DECREF(processors_fastseq);
+        return NULL;
+    }
+
+    num_processors = PySequence_Fast_GET_SIZE(processors_fastseq);
+    num_rows = PySequence_Fast_GET_SIZE(rows_fastseq);
+
+    result = PyList_New(num_rows);
+    if (result == NULL)
+        goto error;
+
+    for (i = 0; i < num_rows; i++) {
+        row_fastseq = PySequence_Fast(
+            PySequence_Fast_GET_ITEM(rows_fastseq, i),
+            "row must be a sequence");
+        if (row_fastseq == NULL)
+            goto error;
+
+        num_values = PySequence_Fast_GET_SIZE(row_fastseq);
+        if (num_values != num_processors) {
+            PyErr_Format(PyExc_RuntimeError,
+                "number of values in row (%d) differ from number of column "
+                "processors (%d)",
+                (int)num_values, (int)num_processors);
+            Py_DECREF(row_fastseq);
+            goto error;
+        }
+
+        /* allocate the tuple subclass directly, as tuple.__new__ would,
+           rather than calling the class */
+        row = type->tp_alloc(type, num_values);
+        if (row == NULL) {
+            Py_DECREF(row_fastseq);
+            goto error;
+        }
+
+        valueptr = PySequence_Fast_ITEMS(row_fastseq);
+        funcptr = PySequence_Fast_ITEMS(processors_fastseq);
+        for (j = 0; j < num_values; j++) {
+            func = *funcptr;
+            if (func != Py_None) {
+                value = PyObject_CallFunctionObjArgs(func, *valueptr, NULL);
+                if (value == NULL) {
+                    Py_DECREF(row);
+                    Py_DECREF(row_fastseq);
+                    goto error;
+                }
+            } else {
+                value = *valueptr;
+                Py_INCREF(value);
+            }
+            PyTuple_SET_ITEM(row, j, value);
+            valueptr++;
+            funcptr++;
+        }
+        Py_DECREF(row_fastseq);
+        PyList_SET_ITEM(result, i, row);
+    }
+
+    Py_DECREF(rows_fastseq);
+    Py_DECREF(processors_fastseq);
+    return result;
+
+error:
+    Py_XDECREF(result);
+    Py_DECREF(rows_fastseq);
+    Py_DECREF(processors_fastseq);
+    return NULL;
+}
+
 static PyMethodDef module_methods[] = {
     {"safe_rowproxy_reconstructor", safe_rowproxy_reconstructor, METH_VARARGS,
      "reconstruct a RowProxy instance from its pickled form."},
+    {"process_tuple_rows", process_tuple_rows, METH_VARARGS,
+     "apply result processors to a list of rows, returning a list of "
+     "instances of the given tuple subclass."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -2172,6 +2172,7 @@ class MSDialect(default.DefaultDialect):
     execution_ctx_cls = MSExecutionContext
     use_scope_identity = True
     max_identifier_length = 128
+    max_bind_parameters = 2100
     schema_name = "dbo"
 
     colspecs = {
@@ -2337,6 +2338,10 @@ class MSDialect(default.DefaultDialect):
             and "implicit_returning" not in self.__dict__
         ):
             self.implicit_returning = True
+        self.full_returning = self.server_version_info >= MS_2005_VERSION
+        self.supports_recursive_ctes = (
+            self.server_version_info >= MS_2005_VERSION
+        )
         if self.server_version_info >= MS_2008_VERSION:
             self.supports_multivalues_insert = True
         if self.deprecate_large_types is None:
@@ -2388,6 +2388,13 @@ class MySQLDialect(default.DefaultDialect):
             not self._is_mariadb and self.server_version_info >= (8,)
         )
 
+        if self._is_mariadb:
+            self.supports_recursive_ctes = (
+                self._mariadb_normalized_version_info >= (10, 2, 2)
+            )
+        else:
+            self.supports_recursive_ctes = self.server_version_info >= (8,)
+
         self._warn_for_known_db_issues()
 
     def _warn_for_known_db_issues(self):
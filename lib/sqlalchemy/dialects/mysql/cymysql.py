@@ -49,6 +49,7 @@ class MySQLDialect_cymysql(MySQLDialect_mysqldb):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_unicode_statements = True
+    supports_multistatement_batch = False
 
     colspecs = util.update_copy(MySQLDialect.colspecs, {BIT: _cymysqlBIT})
 
@@ -45,6 +45,8 @@ def _is_dev_environment():
 
 
 class MySQLDialect_gaerdbms(MySQLDialect_mysqldb):
+    supports_multistatement_batch = False
+
     @classmethod
     def dbapi(cls):
 
@@ -45,6 +45,19 @@ Server Side Cursors
 
 The mysqldb dialect supports server-side cursors. See :ref:`mysql_ss_cursors`.
 
+.. _mysqldb_execute_batch:
+
+Batched Execution
+-----------------
+
+mysqlclient enables the ``MULTI_STATEMENTS`` client flag on its
+connections, which allows several statements separated by semicolons to be
+executed at once.  The mysqldb dialect uses this for
+:meth:`.Connection.execute_batch`, sending consecutive statements
+in a single round trip and reading each result using ``cursor.nextset()``.
+
+.. versionadded:: 1.4
+
 """
 
 import re
@@ -80,6 +93,7 @@ class MySQLDialect_mysqldb(MySQLDialect):
     supports_unicode_statements = True
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = True
+    supports_multistatement_batch = True
 
     supports_native_decimal = True
 
@@ -38,6 +38,10 @@ class MySQLDialect_pymysql(MySQLDialect_mysqldb):
 
     description_encoding = None
 
+    # PyMySQL connections don't set the MULTI_STATEMENTS client flag
+    # by default
+    supports_multistatement_batch = False
+
     # generally, these two values should be both True
     # or both False.   PyMySQL unicode tests pass all the way back
     # to 0.4 either way.  See [ticket:3337]
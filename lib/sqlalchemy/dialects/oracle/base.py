@@ -1171,6 +1171,7 @@ class OracleDialect(default.DefaultDialect):
         self.implicit_returning = self.__dict__.get(
             "implicit_returning", self.server_version_info > (10,)
         )
+        self.supports_recursive_ctes = self.server_version_info >= (11, 2)
 
         if self._is_oracle_8:
             self.colspecs = self.colspecs.copy()
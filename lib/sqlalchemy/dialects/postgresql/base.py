@@ -2419,6 +2419,8 @@ class PGDialect(default.DefaultDialect):
             8,
             2,
         ) and self.__dict__.get("implicit_returning", True)
+        self.full_returning = self.server_version_info >= (8, 2)
+        self.supports_recursive_ctes = self.server_version_info >= (8, 4)
         self.supports_native_enum = self.server_version_info >= (8, 3)
         if not self.supports_native_enum:
             self.colspecs = self.colspecs.copy()
@@ -2786,13 +2788,101 @@ class PGDialect(default.DefaultDialect):
         )
         return view_def
 
-    @reflection.cache
-    def get_columns(self, connection, table_name, schema=None, **kw):
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        if self.server_version_info < (9, 0):
+            return None
 
-        table_oid = self.get_table_oid(
-            connection, table_name, schema, info_cache=kw.get("info_cache")
+        # the xmin of a catalog row changes whenever the row is updated,
+        # so aggregate the oid / xmin of each catalog row describing
+        # the tables in the schema
+        s = sql.text(
+            """
+            SELECT md5(coalesce(string_agg(x, ',' ORDER BY x), '')) FROM (
+              SELECT c.oid::text || ':' || c.xmin::text AS x
+              FROM pg_catalog.pg_class c
+              JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+              WHERE n.nspname = :schema
+              UNION ALL
+              SELECT a.attrelid::text || '.' || a.attnum::text || ':' ||
+                a.xmin::text
+              FROM pg_catalog.pg_attribute a
+              JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+              JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+              WHERE n.nspname = :schema
+              UNION ALL
+              SELECT d.oid::text || ':' || d.xmin::text
+              FROM pg_catalog.pg_attrdef d
+              JOIN pg_catalog.pg_class c ON c.oid = d.adrelid
+              JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+              WHERE n.nspname = :schema
+              UNION ALL
+              SELECT r.oid::text || ':' || r.xmin::text
+              FROM pg_catalog.pg_constraint r
+              JOIN pg_catalog.pg_namespace n ON n.oid = r.connamespace
+              WHERE n.nspname = :schema
+              UNION ALL
+              SELECT t.oid::text || ':' || t.xmin::text
+              FROM pg_catalog.pg_type t
+              JOIN pg_catalog.pg_namespace n ON n.oid = t.typnamespace
+              WHERE n.nspname = :schema
+              UNION ALL
+              SELECT e.oid::text || ':' || e.xmin::text
+              FROM pg_catalog.pg_enum e
+              JOIN pg_catalog.pg_type t ON t.oid = e.enumtypid
+              JOIN pg_catalog.pg_namespace n ON n.oid = t.typnamespace
+              WHERE n.nspname = :schema
+              UNION ALL
+              SELECT d.objoid::text || '.' || d.objsubid::text || ':' ||
+                d.xmin::text
+              FROM pg_catalog.pg_description d
+              JOIN pg_catalog.pg_class c ON c.oid = d.objoid
+              JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+              WHERE n.nspname = :schema
+            ) AS catalog_rows
+            """
+        ).bindparams(sql.bindparam("schema", type_=sqltypes.Unicode))
+        return connection.scalar(
+            s,
+            schema=schema if schema is not None else self.default_schema_name,
+        )
+
+    def _multi_table_criteria(self, schema, filter_names, table_alias="c"):
+        """Return SQL criteria, bound parameters and parameter values
+        against pg_class, given the alias `table_alias`, and pg_namespace
+        "n" for the tables considered by the get_multi_*() methods.
+
+        """
+        params = {}
+        bindparams = []
+        if schema is not None:
+            criteria = "n.nspname = :schema"
+            params["schema"] = util.text_type(schema)
+            bindparams.append(sql.bindparam("schema", type_=sqltypes.Unicode))
+        else:
+            criteria = "pg_catalog.pg_table_is_visible(%s.oid)" % table_alias
+        criteria += " AND %s.relkind IN ('r', 'v', 'm', 'f', 'p')" % (
+            table_alias
+        )
+        if filter_names is not None:
+            criteria += " AND %s.relname IN :filter_names" % table_alias
+            params["filter_names"] = [
+                util.text_type(name) for name in filter_names
+            ]
+            bindparams.append(
+                sql.bindparam(
+                    "filter_names", type_=sqltypes.Unicode, expanding=True
+                )
+            )
+        return criteria, bindparams, params
+
+    def _multi_table_names(self, connection, schema, filter_names, **kw):
+        if filter_names is not None:
+            return filter_names
+        return self.get_table_names(
+            connection, schema, info_cache=kw.get("info_cache")
         )
-        SQL_COLS = """
+
+    _columns_select = """
             SELECT a.attname,
               pg_catalog.format_type(a.atttypid, a.atttypmod),
               (SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
@@ -2801,7 +2891,17 @@ class PGDialect(default.DefaultDialect):
                AND a.atthasdef)
               AS DEFAULT,
               a.attnotnull, a.attnum, a.attrelid as table_oid,
-              pgd.description as comment
+              pgd.description as comment"""
+
+    @reflection.cache
+    def get_columns(self, connection, table_name, schema=None, **kw):
+
+        table_oid = self.get_table_oid(
+            connection, table_name, schema, info_cache=kw.get("info_cache")
+        )
+        SQL_COLS = (
+            self._columns_select
+            + """
             FROM pg_catalog.pg_attribute a
             LEFT JOIN pg_catalog.pg_description pgd ON (
                 pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
@@ -2809,6 +2909,7 @@ class PGDialect(default.DefaultDialect):
             AND a.attnum > 0 AND NOT a.attisdropped
             ORDER BY a.attnum
         """
+        )
         s = (
             sql.text(SQL_COLS)
             .bindparams(sql.bindparam("table_oid", type_=sqltypes.Integer))
@@ -2817,6 +2918,53 @@ class PGDialect(default.DefaultDialect):
         c = connection.execute(s, table_oid=table_oid)
         rows = c.fetchall()
 
+        domains, enums = self._load_column_types(connection)
+        return self._get_columns_info(rows, domains, enums, schema)
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        criteria, bindparams, params = self._multi_table_criteria(
+            schema, filter_names
+        )
+        SQL_COLS = (
+            self._columns_select
+            + """,
+              c.relname
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_catalog.pg_description pgd ON (
+                pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+            WHERE %s
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY c.relname, a.attnum
+        """
+            % criteria
+        )
+        s = (
+            sql.text(SQL_COLS)
+            .bindparams(*bindparams)
+            .columns(
+                attname=sqltypes.Unicode,
+                default=sqltypes.Unicode,
+                relname=sqltypes.Unicode,
+            )
+        )
+        rows_by_table = defaultdict(list)
+        for row in connection.execute(s, **params):
+            rows_by_table[row[-1]].append(row[:-1])
+
+        domains, enums = self._load_column_types(connection)
+        return dict(
+            (
+                table_name,
+                self._get_columns_info(rows, domains, enums, schema),
+            )
+            for table_name, rows in rows_by_table.items()
+        )
+
+    def _load_column_types(self, connection):
         # dictionary with (name, ) if default search path or (schema, name)
         # as keys
         domains = self._load_domains(connection)
@@ -2829,7 +2977,9 @@ class PGDialect(default.DefaultDialect):
             else ((rec["schema"], rec["name"]), rec)
             for rec in self._load_enums(connection, schema="*")
         )
+        return domains, enums
 
+    def _get_columns_info(self, rows, domains, enums, schema):
         # format columns
         columns = []
 
@@ -3057,6 +3207,61 @@ class PGDialect(default.DefaultDialect):
 
         return {"constrained_columns": cols, "name": name}
 
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 4):
+            return super(PGDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        criteria, bindparams, params = self._multi_table_criteria(
+            schema, filter_names
+        )
+        PK_SQL = (
+            """
+            SELECT c.relname, a.attname, r.conname
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN (
+                SELECT ix.indrelid, unnest(ix.indkey) attnum,
+                       generate_subscripts(ix.indkey, 1) ord
+                FROM pg_catalog.pg_index ix
+                WHERE ix.indisprimary
+                ) k ON k.indrelid = c.oid
+            JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = c.oid AND a.attnum = k.attnum
+            LEFT JOIN pg_catalog.pg_constraint r
+                ON r.conrelid = c.oid AND r.contype = 'p'
+            WHERE %s
+            ORDER BY c.relname, k.ord
+        """
+            % criteria
+        )
+        t = (
+            sql.text(PK_SQL)
+            .bindparams(*bindparams)
+            .columns(
+                relname=sqltypes.Unicode,
+                attname=sqltypes.Unicode,
+                conname=sqltypes.Unicode,
+            )
+        )
+
+        result = dict(
+            (table_name, {"constrained_columns": [], "name": None})
+            for table_name in self._multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+        for table_name, attname, conname in connection.execute(t, **params):
+            pk = result.setdefault(
+                table_name, {"constrained_columns": [], "name": None}
+            )
+            pk["constrained_columns"].append(attname)
+            pk["name"] = conname
+        return result
+
     @reflection.cache
     def get_foreign_keys(
         self,
@@ -3066,7 +3271,6 @@ class PGDialect(default.DefaultDialect):
         postgresql_ignore_search_path=False,
         **kw
     ):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
@@ -3085,24 +3289,90 @@ class PGDialect(default.DefaultDialect):
                 n.oid = c.relnamespace
           ORDER BY 1
         """
-        # http://www.postgresql.org/docs/9.0/static/sql-createtable.html
-        FK_REGEX = re.compile(
-            r"FOREIGN KEY \((.*?)\) REFERENCES (?:(.*?)\.)?(.*?)\((.*?)\)"
-            r"[\s]?(MATCH (FULL|PARTIAL|SIMPLE)+)?"
-            r"[\s]?(ON UPDATE "
-            r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
-            r"[\s]?(ON DELETE "
-            r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
-            r"[\s]?(DEFERRABLE|NOT DEFERRABLE)?"
-            r"[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?"
-        )
 
         t = sql.text(FK_SQL).columns(
             conname=sqltypes.Unicode, condef=sqltypes.Unicode
         )
         c = connection.execute(t, table=table_oid)
+        return self._get_foreign_keys_info(
+            c.fetchall(), schema, postgresql_ignore_search_path
+        )
+
+    def get_multi_foreign_keys(
+        self,
+        connection,
+        schema=None,
+        filter_names=None,
+        postgresql_ignore_search_path=False,
+        **kw
+    ):
+        criteria, bindparams, params = self._multi_table_criteria(
+            schema, filter_names
+        )
+        FK_SQL = (
+            """
+          SELECT c.relname, r.conname,
+                pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
+                rn.nspname as conschema
+          FROM pg_catalog.pg_class c
+          LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+          JOIN pg_catalog.pg_constraint r
+                ON r.conrelid = c.oid AND r.contype = 'f'
+          JOIN pg_catalog.pg_class rc ON rc.oid = r.confrelid
+          JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+          WHERE %s
+          ORDER BY c.relname, r.conname
+        """
+            % criteria
+        )
+        t = (
+            sql.text(FK_SQL)
+            .bindparams(*bindparams)
+            .columns(
+                relname=sqltypes.Unicode,
+                conname=sqltypes.Unicode,
+                condef=sqltypes.Unicode,
+            )
+        )
+        rows_by_table = dict(
+            (table_name, [])
+            for table_name in self._multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+        for row in connection.execute(t, **params):
+            rows_by_table.setdefault(row[0], []).append(row[1:])
+
+        return dict(
+            (
+                table_name,
+                self._get_foreign_keys_info(
+                    rows, schema, postgresql_ignore_search_path
+                ),
+            )
+            for table_name, rows in rows_by_table.items()
+        )
+
+    # http://www.postgresql.org/docs/9.0/static/sql-createtable.html
+    _fk_regex = re.compile(
+        r"FOREIGN KEY \((.*?)\) REFERENCES (?:(.*?)\.)?(.*?)\((.*?)\)"
+        r"[\s]?(MATCH (FULL|PARTIAL|SIMPLE)+)?"
+        r"[\s]?(ON UPDATE "
+        r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
+        r"[\s]?(ON DELETE "
+        r"(CASCADE|RESTRICT|NO ACTION|SET NULL|SET DEFAULT)+)?"
+        r"[\s]?(DEFERRABLE|NOT DEFERRABLE)?"
+        r"[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?"
+    )
+
+    def _get_foreign_keys_info(
+        self, rows, schema, postgresql_ignore_search_path
+    ):
+        preparer = self.identifier_preparer
+        FK_REGEX = self._fk_regex
+
         fkeys = []
-        for conname, condef, conschema in c.fetchall():
+        for conname, condef, conschema in rows:
             m = re.search(FK_REGEX, condef).groups()
 
             (
@@ -3267,11 +3537,82 @@ class PGDialect(default.DefaultDialect):
             relname=sqltypes.Unicode, attname=sqltypes.Unicode
         )
         c = connection.execute(t, table_oid=table_oid)
+        return self._get_indexes_info(c.fetchall())
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        criteria, bindparams, params = self._multi_table_criteria(
+            schema, filter_names, table_alias="t"
+        )
+        IDX_SQL = (
+            """
+              SELECT
+                  i.relname as relname,
+                  ix.indisunique, ix.indexprs, ix.indpred,
+                  a.attname, a.attnum, c.conrelid, ix.indkey::varchar,
+                  ix.indoption::varchar, i.reloptions, am.amname,
+                  t.relname as table_name
+              FROM
+                  pg_class t
+                        join pg_index ix on t.oid = ix.indrelid
+                        join pg_class i on i.oid = ix.indexrelid
+                        left outer join
+                            pg_namespace n
+                            on n.oid = t.relnamespace
+                        left outer join
+                            pg_attribute a
+                            on t.oid = a.attrelid and a.attnum = ANY(ix.indkey)
+                        left outer join
+                            pg_constraint c
+                            on (ix.indrelid = c.conrelid and
+                                ix.indexrelid = c.conindid and
+                                c.contype in ('p', 'u', 'x'))
+                        left outer join
+                            pg_am am
+                            on i.relam = am.oid
+              WHERE
+                  %s
+                  and ix.indisprimary = 'f'
+              ORDER BY
+                  t.relname,
+                  i.relname
+            """
+            % criteria
+        )
+        t = (
+            sql.text(IDX_SQL)
+            .bindparams(*bindparams)
+            .columns(
+                relname=sqltypes.Unicode,
+                attname=sqltypes.Unicode,
+                table_name=sqltypes.Unicode,
+            )
+        )
+        rows_by_table = dict(
+            (table_name, [])
+            for table_name in self._multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+        for row in connection.execute(t, **params):
+            rows_by_table.setdefault(row[-1], []).append(row[:-1])
+
+        return dict(
+            (table_name, self._get_indexes_info(rows))
+            for table_name, rows in rows_by_table.items()
+        )
 
+    def _get_indexes_info(self, rows):
         indexes = defaultdict(lambda: defaultdict(dict))
 
         sv_idx_name = None
-        for row in c.fetchall():
+        for row in rows:
             (
                 idx_name,
                 unique,
@@ -570,6 +570,7 @@ When using the per-:class:`.Engine` execution option, note that
 """  # noqa
 
 import datetime
+import hashlib
 import re
 
 from .json import JSON
@@ -999,6 +1000,15 @@ class SQLiteCompiler(compiler.SQLCompiler):
         # sqlite has no "FOR UPDATE" AFAICT
         return ""
 
+    def returning_clause(self, stmt, returning_cols):
+        # available as of SQLite 3.35
+        columns = [
+            self._label_select_column(None, c, True, False, {})
+            for c in sql.expression._select_iterables(returning_cols)
+        ]
+
+        return "RETURNING " + ", ".join(columns)
+
     def visit_is_distinct_from_binary(self, binary, operator, **kw):
         return "%s IS NOT %s" % (
             self.process(binary.left),
@@ -1396,6 +1406,9 @@ class SQLiteDialect(default.DefaultDialect):
     supports_multivalues_insert = True
     tuple_in_values = True
 
+    # SQLITE_MAX_VARIABLE_NUMBER default for SQLite versions prior to 3.32
+    max_bind_parameters = 999
+
     default_paramstyle = "qmark"
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
@@ -1472,6 +1485,14 @@ class SQLiteDialect(default.DefaultDialect):
                 6,
                 14,
             )
+            # https://www.sqlite.org/lang_returning.html
+            self.full_returning = self.dbapi.sqlite_version_info >= (3, 35)
+            # https://www.sqlite.org/lang_with.html
+            self.supports_recursive_ctes = self.dbapi.sqlite_version_info >= (
+                3,
+                8,
+                3,
+            )
 
     _isolation_lookup = {"READ UNCOMMITTED": 1, "SERIALIZABLE": 0}
 
@@ -1540,6 +1561,25 @@ class SQLiteDialect(default.DefaultDialect):
         rs = connection.execute(s)
         return [row[0] for row in rs]
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        if schema is not None:
+            qschema = self.identifier_preparer.quote_identifier(schema)
+            master = "%s.sqlite_master" % qschema
+        else:
+            master = "sqlite_master"
+        s = "SELECT type, name, tbl_name, sql FROM %s ORDER BY type, name" % (
+            master,
+        )
+        rs = connection.execute(s)
+
+        # the full text of the schema is typically small and is read
+        # from a single page, so hash it rather than relying upon
+        # "PRAGMA schema_version", which may be the same for two
+        # different database files
+        return hashlib.sha1(
+            util.text_type(list(map(tuple, rs))).encode("utf-8")
+        ).hexdigest()
+
     @reflection.cache
     def get_temp_table_names(self, connection, **kw):
         s = (
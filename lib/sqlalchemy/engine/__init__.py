@@ -414,6 +414,18 @@ def create_engine(*args, **kwargs):
 
         .. versionadded:: 1.2.3
 
+    :param prepared_statement_cache_size=0: when greater than zero, compiled
+        statements are executed as server-side prepared statements, keeping
+        up to this many prepared statements on each DBAPI connection.  Only
+        supported by some dialects, currently psycopg2; an
+        :class:`.ArgumentError` is raised otherwise.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :ref:`psycopg2_prepared_statements`
+
     :param strategy='plain': selects alternate engine implementations.
         Currently available are:
 
@@ -13,9 +13,12 @@ from .interfaces import Connectable
 from .interfaces import ExceptionContext
 from .util import _distill_params
 from .. import exc
+from .. import inspection
 from .. import interfaces
 from .. import log
 from .. import util
+from ..sql import ddl
+from ..sql import expression
 from ..sql import schema
 from ..sql import util as sql_util
 
@@ -311,6 +314,17 @@ class Connection(Connectable):
           of many DBAPIs.  The flag is currently understood only by the
           psycopg2, mysqldb and pymysql dialects.
 
+        :param pad_in_lists: Available on: Connection, Engine, statement.
+          When ``True``, the list of values passed to a bound parameter
+          that uses :paramref:`.bindparam.expanding` is padded to the next
+          power of two in length by repeating its last value, so that
+          lists of varying length produce a smaller number of distinct
+          SQL strings; this improves the hit rate of statement caches on
+          the database or driver side.   The result of the IN comparison
+          is unchanged.
+
+          .. versionadded:: 1.4
+
         :param schema_translate_map: Available on: Connection, Engine.
           A dictionary mapping schema names to schema names, that will be
           applied to the :paramref:`.Table.schema` element of each
@@ -324,6 +338,36 @@ class Connection(Connectable):
 
             :ref:`schema_translating`
 
+        :param tuple_rows: Available on: Connection, Engine, statement.
+          When ``True``, rows returned by the :class:`.ResultProxy` are
+          plain ``tuple`` subclasses, all of which share a single class per
+          result set, which supplies attribute access for each string
+          column name in the result.  Result processing for each column is
+          applied once when the row is fetched, rather than on each access
+          as is the case for :class:`.RowProxy`, and each row is a single
+          compact object; this reduces the time and memory used by large
+          fetches.  The rows don't support lookup by column name or
+          :class:`.Column` object using ``row[key]``, or the other mapping
+          methods of :class:`.RowProxy`; they support ``keys()`` and
+          ``_asdict()`` in the same way as the rows returned by
+          :class:`.Query`.   This option applies to Core statements only;
+          it is ignored by ORM queries which load entities, and for the
+          rows fetched internally by "implicit returning" and
+          :meth:`.ValuesBase.return_defaults`.
+
+          .. versionadded:: 1.4
+
+        :param prepare: Available on: Connection, Engine, statement.
+          When ``False``, the statement is not executed as a server-side
+          prepared statement even if the dialect was configured with
+          ``prepared_statement_cache_size``.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`psycopg2_prepared_statements`
+
         .. seealso::
 
             :meth:`.Engine.execution_options`
@@ -997,6 +1041,184 @@ class Connection(Connectable):
         else:
             return meth(self, multiparams, params)
 
+    def execute_batch(self, statements):
+        r"""Execute a sequence of statements, returning a list of
+        :class:`.ResultProxy` objects, one for each statement in order.
+
+        :param statements: a sequence where each element is either a
+         statement as accepted by :meth:`.Connection.execute`, or a tuple
+         of a statement and its bound parameter values, which may be a
+         dictionary or a list of dictionaries::
+
+            user_result, address_result = conn.execute_batch(
+                [
+                    select([users]).where(users.c.id == 5),
+                    (
+                        addresses.update().where(addresses.c.user_id == 5),
+                        {"email": "ed@example.com"},
+                    ),
+                ]
+            )
+
+        Where the dialect supports it, consecutive SQL expression constructs
+        that are executed with a single set of parameters are sent to the
+        database together in one round trip; currently this is the case
+        for the mysqlclient dialect.   Each statement is compiled and has its
+        parameters processed, including Python-side column defaults, before
+        any of them is executed, so the statements should not depend on
+        each other in that respect.   The rows of each result are fetched
+        before the results are returned.  If one of the statements fails,
+        an exception is raised, and the statements preceding it remain
+        executed.
+
+        For other dialects, and when :class:`.ConnectionEvents` are
+        associated with the connection, the statements are executed one at
+        a time using :meth:`.Connection.execute`.
+
+        .. versionadded:: 1.4
+
+        """
+        items = [
+            (stmt[0], stmt[1:]) if isinstance(stmt, tuple) else (stmt, ())
+            for stmt in statements
+        ]
+
+        dialect = self.dialect
+        if (
+            not dialect.supports_multistatement_batch
+            or not dialect.positional
+            or self._has_events
+            or self.engine._has_events
+            or dialect._has_events
+        ):
+            return [
+                self.execute(stmt, *multiparams) for stmt, multiparams in items
+            ]
+
+        results = []
+        batch = []
+        for stmt, multiparams in items:
+            if (
+                isinstance(stmt, expression.ClauseElement)
+                and stmt.supports_execution
+                and not isinstance(
+                    stmt, (expression.FunctionElement, ddl.DDLElement)
+                )
+            ):
+                context = self._batch_context(dialect, stmt, multiparams)
+                if (
+                    not context.executemany
+                    and not context._is_server_side
+                    and context._prepared_statements is None
+                ):
+                    batch.append(context)
+                    continue
+                results.extend(self._execute_batch_contexts(dialect, batch))
+                batch = []
+                results.append(
+                    self._execute_context(
+                        dialect,
+                        lambda *arg: context,
+                        context.statement,
+                        context.parameters,
+                    )
+                )
+            else:
+                results.extend(self._execute_batch_contexts(dialect, batch))
+                batch = []
+                results.append(self.execute(stmt, *multiparams))
+        results.extend(self._execute_batch_contexts(dialect, batch))
+        return results
+
+    def _batch_context(self, dialect, elem, multiparams):
+        """Create the execution context of a statement within
+        :meth:`.execute_batch`."""
+
+        distilled_params = _distill_params(multiparams, {})
+        compiled_sql = self._compile_clauseelement(elem, distilled_params)
+        try:
+            try:
+                conn = self.__connection
+            except AttributeError:
+                conn = None
+            if conn is None:
+                conn = self._revalidate_connection()
+
+            return dialect.execution_ctx_cls._init_compiled(
+                dialect, self, conn, compiled_sql, distilled_params
+            )
+        except BaseException as e:
+            self._handle_dbapi_exception(
+                e, util.text_type(compiled_sql), distilled_params, None, None
+            )
+
+    def _execute_batch_contexts(self, dialect, contexts):
+        """Execute the given contexts using a single
+        :meth:`.Dialect.do_execute_batch` call."""
+
+        if len(contexts) < 2:
+            return [
+                self._execute_context(
+                    dialect,
+                    lambda *arg: context,
+                    context.statement,
+                    context.parameters,
+                )
+                for context in contexts
+            ]
+
+        if self._root.__transaction and not self._root.__transaction.is_active:
+            self._raise_inactive_transaction()
+
+        for context in contexts:
+            context.pre_exec()
+
+        # all statements are sent on the cursor of the first context
+        cursor = contexts[0].cursor
+        for context in contexts[1:]:
+            self._safe_close_cursor(context.cursor)
+
+        statement = "; ".join(context.statement for context in contexts)
+        parameters = dialect.execute_sequence_format(
+            [value for context in contexts for value in context.parameters[0]]
+        )
+
+        if self._echo:
+            self.engine.logger.info(statement)
+            self.engine.logger.info(
+                "%r", sql_util._repr_params(parameters, batches=10)
+            )
+
+        try:
+            result_sets = dialect.do_execute_batch(
+                cursor, statement, parameters, contexts
+            )
+        except BaseException as e:
+            self._handle_dbapi_exception(
+                e, statement, parameters, cursor, contexts[0]
+            )
+        self._safe_close_cursor(cursor)
+
+        results = []
+        for context, result_set in zip(contexts, result_sets):
+            context.cursor = result_set
+            context.post_exec()
+
+            if context.is_crud or context.is_text:
+                result = context._setup_crud_result_proxy()
+            else:
+                result = context.get_result_proxy()
+                if result._metadata is None:
+                    result._soft_close()
+            results.append(result)
+
+        if self._root.__transaction is None and any(
+            context.should_autocommit for context in contexts
+        ):
+            self._root._commit_impl(autocommit=True)
+
+        return results
+
     def _execute_function(self, func, multiparams, params):
         """Execute a sql.FunctionElement object."""
 
@@ -1071,6 +1293,22 @@ class Connection(Connectable):
                 elem, multiparams, params = fn(self, elem, multiparams, params)
 
         distilled_params = _distill_params(multiparams, params)
+        compiled_sql = self._compile_clauseelement(elem, distilled_params)
+
+        dialect = self.dialect
+        ret = self._execute_context(
+            dialect,
+            dialect.execution_ctx_cls._init_compiled,
+            compiled_sql,
+            distilled_params,
+            compiled_sql,
+            distilled_params,
+        )
+        if self._has_events or self.engine._has_events:
+            self.dispatch.after_execute(self, elem, multiparams, params, ret)
+        return ret
+
+    def _compile_clauseelement(self, elem, distilled_params):
         if distilled_params:
             # ensure we don't retain a link to the view object for keys()
             # which links to the values, which we don't want to cache
@@ -1107,18 +1345,7 @@ class Connection(Connectable):
                 if not self.schema_for_object.is_default
                 else None,
             )
-
-        ret = self._execute_context(
-            dialect,
-            dialect.execution_ctx_cls._init_compiled,
-            compiled_sql,
-            distilled_params,
-            compiled_sql,
-            distilled_params,
-        )
-        if self._has_events or self.engine._has_events:
-            self.dispatch.after_execute(self, elem, multiparams, params, ret)
-        return ret
+        return compiled_sql
 
     def _execute_compiled(self, compiled, multiparams, params):
         """Execute a sql.Compiled object."""
@@ -1193,16 +1420,7 @@ class Connection(Connectable):
             )
 
         if self._root.__transaction and not self._root.__transaction.is_active:
-            raise exc.InvalidRequestError(
-                "This connection is on an inactive %stransaction.  "
-                "Please rollback() fully before proceeding."
-                % (
-                    "savepoint "
-                    if isinstance(self.__transaction, NestedTransaction)
-                    else ""
-                ),
-                code="8s2a",
-            )
+            self._raise_inactive_transaction()
         if context.compiled:
             context.pre_exec()
 
@@ -1305,6 +1523,18 @@ class Connection(Connectable):
                 result._autoclose_connection = True
         return result
 
+    def _raise_inactive_transaction(self):
+        raise exc.InvalidRequestError(
+            "This connection is on an inactive %stransaction.  "
+            "Please rollback() fully before proceeding."
+            % (
+                "savepoint "
+                if isinstance(self.__transaction, NestedTransaction)
+                else ""
+            ),
+            code="8s2a",
+        )
+
     def _cursor_execute(self, cursor, statement, parameters, context=None):
         """Execute a statement + params on the given cursor.
 
@@ -2379,3 +2609,9 @@ class OptionEngine(Engine):
         self.__dict__["_has_events"] = value
 
     _has_events = property(_get_has_events, _set_has_events)
+
+
+@inspection._inspects(Connectable)
+@util.dependencies("sqlalchemy.engine.reflection")
+def _inspect_connectable(reflection, bind):
+    return reflection.Inspector.from_engine(bind)
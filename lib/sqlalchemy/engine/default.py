@@ -14,12 +14,13 @@ as the base class for their own corresponding classes.
 """
 
 import codecs
+import collections
+import itertools
 import random
 import re
 import weakref
 
 from . import interfaces
-from . import reflection
 from . import result
 from .. import event
 from .. import exc
@@ -65,6 +66,8 @@ class DefaultDialect(interfaces.Dialect):
     preexecute_autoincrement_sequences = False
     postfetch_lastrowid = True
     implicit_returning = False
+    full_returning = False
+    supports_recursive_ctes = False
 
     supports_right_nested_joins = True
     cte_follows_insert = False
@@ -77,6 +80,20 @@ class DefaultDialect(interfaces.Dialect):
 
     tuple_in_values = False
 
+    # maximum number of bound parameters accepted
+    # by a single statement, if known
+    max_bind_parameters = None
+
+    # dialect renders server-side prepared statements using
+    # _prepared_statement_sql(), see prepared_statement_cache_size
+    supports_prepared_statements = False
+    prepared_statement_cache_size = 0
+
+    # DBAPI executes ";"-separated statements in one execute() call,
+    # delivering each result through cursor.nextset(); used with
+    # positional paramstyles only
+    supports_multistatement_batch = False
+
     engine_config_types = util.immutabledict(
         [
             ("convert_unicode", util.bool_or_str("force")),
@@ -87,6 +104,7 @@ class DefaultDialect(interfaces.Dialect):
             ("pool_size", util.asint),
             ("max_overflow", util.asint),
             ("pool_threadlocal", util.asbool),
+            ("prepared_statement_cache_size", util.asint),
         ]
     )
 
@@ -207,6 +225,7 @@ class DefaultDialect(interfaces.Dialect):
         supports_native_boolean=None,
         empty_in_strategy="static",
         label_length=None,
+        prepared_statement_cache_size=0,
         **kwargs
     ):
 
@@ -258,6 +277,14 @@ class DefaultDialect(interfaces.Dialect):
             )
         self.label_length = label_length
 
+        if prepared_statement_cache_size:
+            if not self.supports_prepared_statements:
+                raise exc.ArgumentError(
+                    "Dialect '%s' does not support prepared statements"
+                    % self.dialect_description
+                )
+            self.prepared_statement_cache_size = prepared_statement_cache_size
+
         if self.description_encoding == "use_encoding":
             self._description_decoder = (
                 processors.to_unicode_processor_factory
@@ -417,8 +444,10 @@ class DefaultDialect(interfaces.Dialect):
         """
         return sqltypes.adapt_type(typeobj, self.colspecs)
 
+    @util.dependencies("sqlalchemy.engine.reflection")
     def reflecttable(
         self,
+        reflection,
         connection,
         table,
         include_columns,
@@ -442,6 +471,56 @@ class DefaultDialect(interfaces.Dialect):
             )
         }
 
+    def _default_multi_reflect(
+        self, single_tbl_method, connection, schema, filter_names, **kw
+    ):
+        if filter_names is None:
+            filter_names = self.get_table_names(
+                connection, schema=schema, info_cache=kw.get("info_cache")
+            )
+
+        result = {}
+        for table_name in filter_names:
+            try:
+                result[table_name] = single_tbl_method(
+                    connection, table_name, schema=schema, **kw
+                )
+            except (exc.NoSuchTableError, exc.UnreflectableTableError):
+                # reported when the table is reflected individually
+                pass
+        return result
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._default_multi_reflect(
+            self.get_columns, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._default_multi_reflect(
+            self.get_pk_constraint, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._default_multi_reflect(
+            self.get_foreign_keys, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._default_multi_reflect(
+            self.get_indexes, connection, schema, filter_names, **kw
+        )
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        return None
+
     def validate_identifier(self, ident):
         if len(ident) > self.max_identifier_length:
             raise exc.IdentifierError(
@@ -549,7 +628,50 @@ class DefaultDialect(interfaces.Dialect):
         cursor.executemany(statement, parameters)
 
     def do_execute(self, cursor, statement, parameters, context=None):
+        if context is not None and context._prepared_statements is not None:
+            self._do_execute_prepared(
+                cursor, statement, parameters, context._prepared_statements
+            )
+        else:
+            cursor.execute(statement, parameters)
+
+    def _do_execute_prepared(self, cursor, statement, parameters, prepared):
+        execute_sql = prepared.get(statement)
+        if execute_sql is not None:
+            cursor.execute(execute_sql, parameters)
+        else:
+            name, deallocate = prepared.prepare()
+            prepare_sql, execute_sql = self._prepared_statement_sql(
+                name, statement, deallocate
+            )
+            try:
+                cursor.execute(prepare_sql, parameters)
+            except:
+                with util.safe_reraise():
+                    prepared.failed()
+
+            prepared.add(statement, name, execute_sql)
+
+    def do_execute_batch(self, cursor, statement, parameters, contexts):
         cursor.execute(statement, parameters)
+        result_sets = [_ResultSetCursor(cursor)]
+        for context in contexts[1:]:
+            cursor.nextset()
+            result_sets.append(_ResultSetCursor(cursor))
+        return result_sets
+
+    def _prepared_statement_sql(self, name, statement, deallocate):
+        """Return the SQL which prepares the given statement under the
+        given name and executes it, and the SQL which executes it once
+        prepared.
+
+        Both are executed with the parameters of the original statement.
+        ``deallocate`` is a list of names of prepared statements to be
+        released, or ``None`` to release all prepared statements, which
+        the first SQL string should also do.
+
+        """
+        raise NotImplementedError()
 
     def do_execute_no_params(self, cursor, statement, context=None):
         cursor.execute(statement)
@@ -602,6 +724,8 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     _expanded_parameters = util.immutabledict()
 
+    _prepared_statements = None
+
     @classmethod
     def _init_ddl(cls, dialect, connection, dbapi_connection, compiled_ddl):
         """Initialize execution context for a DDLElement construct."""
@@ -614,6 +738,12 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.compiled = compiled = compiled_ddl
         self.isddl = True
 
+        if dialect.prepared_statement_cache_size:
+            # DDL may change what prepared statements refer to
+            prepared = dbapi_connection.info.get("prepared_statements")
+            if prepared is not None:
+                prepared.discard()
+
         self.execution_options = compiled.execution_options
         if connection._execution_options:
             self.execution_options = dict(self.execution_options)
@@ -704,8 +834,12 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         if compiled.contains_expanding_parameters:
             positiontup = self._expand_in_parameters(compiled, processors)
+            if compiled.positional:
+                positional_processors = [
+                    (key, processors.get(key)) for key in positiontup
+                ]
         elif compiled.positional:
-            positiontup = self.compiled.positiontup
+            positional_processors = compiled._positional_bind_processors
 
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
@@ -713,12 +847,12 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         parameters = []
         if compiled.positional:
             for compiled_params in self.compiled_parameters:
-                param = []
-                for key in positiontup:
-                    if key in processors:
-                        param.append(processors[key](compiled_params[key]))
-                    else:
-                        param.append(compiled_params[key])
+                param = [
+                    proc(compiled_params[key])
+                    if proc is not None
+                    else compiled_params[key]
+                    for key, proc in positional_processors
+                ]
                 parameters.append(dialect.execute_sequence_format(param))
         else:
             encode = not dialect.supports_unicode_statements
@@ -735,22 +869,36 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                         for key in compiled_params
                     )
                 else:
-                    param = dict(
-                        (
-                            key,
-                            processors[key](compiled_params[key])
-                            if key in processors
-                            else compiled_params[key],
-                        )
-                        for key in compiled_params
-                    )
+                    param = dict(compiled_params)
+                    for key in processors:
+                        if key in param:
+                            param[key] = processors[key](param[key])
 
                 parameters.append(param)
 
         self.parameters = dialect.execute_sequence_format(parameters)
 
+        if (
+            dialect.prepared_statement_cache_size
+            and not self.executemany
+            and not self.is_text
+            and not self._is_server_side
+            and self.execution_options.get("prepare", True)
+        ):
+            self._prepared_statements = self._get_prepared_statements()
+
         return self
 
+    def _get_prepared_statements(self):
+        info = self._dbapi_connection.info
+        try:
+            return info["prepared_statements"]
+        except KeyError:
+            info["prepared_statements"] = prepared = _PreparedStatements(
+                self.dialect.prepared_statement_cache_size
+            )
+            return prepared
+
     def _expand_in_parameters(self, compiled, processors):
         """handle special 'expanding' parameters, IN tuples that are rendered
         on a per-parameter basis for an otherwise fixed SQL statement string.
@@ -776,8 +924,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         else:
             positiontup = None
 
-        replacement_expressions = {}
+        pad_in_lists = self.execution_options.get("pad_in_lists", False)
+
         to_update_sets = {}
+        statement_key = []
 
         for name in (
             self.compiled.positiontup
@@ -787,7 +937,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             parameter = self.compiled.binds[name]
             if parameter.expanding:
 
-                if name in replacement_expressions:
+                if name in to_update_sets:
                     to_update = to_update_sets[name]
                 else:
                     # we are removing the parameter from compiled_params
@@ -798,15 +948,19 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                     # param.
                     values = compiled_params.pop(name)
 
+                    if pad_in_lists and values:
+                        # repeat the last value up to the next power of
+                        # two, limiting the number of distinct statements
+                        # the database needs to prepare
+                        padded = 1 << (len(values) - 1).bit_length()
+                        values = list(values)
+                        values.extend(
+                            [values[-1]] * (padded - len(values))
+                        )
+
                     if not values:
                         to_update = to_update_sets[name] = []
-                        replacement_expressions[
-                            name
-                        ] = self.compiled.visit_empty_set_expr(
-                            parameter._expanding_in_types
-                            if parameter._expanding_in_types
-                            else [parameter.type]
-                        )
+                        statement_key.append((name, 0, None))
 
                     elif isinstance(values[0], (tuple, list)):
                         to_update = to_update_sets[name] = [
@@ -814,30 +968,15 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                             for i, tuple_element in enumerate(values, 1)
                             for j, value in enumerate(tuple_element, 1)
                         ]
-                        replacement_expressions[name] = (
-                            "VALUES " if self.dialect.tuple_in_values else ""
-                        ) + ", ".join(
-                            "(%s)"
-                            % ", ".join(
-                                self.compiled.bindtemplate
-                                % {
-                                    "name": to_update[
-                                        i * len(tuple_element) + j
-                                    ][0]
-                                }
-                                for j, value in enumerate(tuple_element)
-                            )
-                            for i, tuple_element in enumerate(values)
+                        statement_key.append(
+                            (name, len(values), len(values[0]))
                         )
                     else:
                         to_update = to_update_sets[name] = [
                             ("%s_%s" % (name, i), value)
                             for i, value in enumerate(values, 1)
                         ]
-                        replacement_expressions[name] = ", ".join(
-                            self.compiled.bindtemplate % {"name": key}
-                            for key, value in to_update
-                        )
+                        statement_key.append((name, len(values), None))
 
                 compiled_params.update(to_update)
                 processors.update(
@@ -853,14 +992,59 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             elif compiled.positional:
                 positiontup.append(name)
 
-        def process_expanding(m):
-            return replacement_expressions[m.group(1)]
+        statement_key = tuple(statement_key)
+        statement = compiled._expanded_statements.get(statement_key)
+        if statement is None:
+            statement = compiled._expanded_statements[
+                statement_key
+            ] = self._render_expanded_statement(compiled, statement_key)
 
-        self.statement = re.sub(
-            r"\[EXPANDING_(\S+)\]", process_expanding, self.statement
-        )
+        self.unicode_statement = statement
+        if not self.dialect.supports_unicode_statements:
+            self.statement = statement.encode(self.dialect.encoding)
+        else:
+            self.statement = statement
         return positiontup
 
+    def _render_expanded_statement(self, compiled, statement_key):
+        """Render the statement string for the given shape of "expanding"
+        parameters, joining the pieces of the compiled statement with the
+        individual bound parameters for each value.
+
+        """
+        bindtemplate = compiled.bindtemplate
+        replacement_expressions = {}
+        for name, length, width in statement_key:
+            if not length:
+                parameter = compiled.binds[name]
+                replacement_expressions[name] = compiled.visit_empty_set_expr(
+                    parameter._expanding_in_types
+                    if parameter._expanding_in_types
+                    else [parameter.type]
+                )
+            elif width is not None:
+                replacement_expressions[name] = (
+                    "VALUES " if self.dialect.tuple_in_values else ""
+                ) + ", ".join(
+                    "(%s)"
+                    % ", ".join(
+                        bindtemplate % {"name": "%s_%s_%s" % (name, i, j)}
+                        for j in range(1, width + 1)
+                    )
+                    for i in range(1, length + 1)
+                )
+            else:
+                replacement_expressions[name] = ", ".join(
+                    bindtemplate % {"name": "%s_%s" % (name, i)}
+                    for i in range(1, length + 1)
+                )
+
+        template = compiled._expanding_template
+        pieces = list(template)
+        for idx in range(1, len(template), 2):
+            pieces[idx] = replacement_expressions[template[idx]]
+        return "".join(pieces)
+
     @classmethod
     def _init_statement(
         cls, dialect, connection, dbapi_connection, statement, parameters
@@ -1122,6 +1306,11 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         result = self.get_result_proxy()
 
+        if self._is_implicit_returning:
+            # the returned row is consumed internally and looked up by
+            # Column, so it's never produced as a plain tuple
+            result._tuple_rows = False
+
         if self.isinsert:
             if self._is_implicit_returning:
                 row = result.fetchone()
@@ -1465,4 +1654,123 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         del self.current_parameters
 
 
+class _PreparedStatements(object):
+    """Track the server-side prepared statements of a DBAPI connection.
+
+    Statements are keyed on their SQL string.  Once more than ``capacity``
+    statements are prepared, the least recently used ones are handed out
+    to be deallocated along with the next statement prepared.
+
+    An instance is stored in the ``.info`` dictionary of the pooled
+    connection, so that it is discarded along with the DBAPI connection
+    when it's closed or invalidated.
+
+    """
+
+    __slots__ = (
+        "capacity",
+        "_statements",
+        "_deallocate",
+        "_deallocate_all",
+        "_counter",
+    )
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._statements = collections.OrderedDict()
+        self._deallocate = []
+        self._deallocate_all = False
+        self._counter = itertools.count(1)
+
+    def __len__(self):
+        return len(self._statements)
+
+    def get(self, statement):
+        try:
+            entry = self._statements.pop(statement)
+        except KeyError:
+            return None
+        else:
+            self._statements[statement] = entry
+            return entry[1]
+
+    def prepare(self):
+        """Return a new statement name, and the names of statements to
+        be deallocated, or None if all statements are to be deallocated."""
+
+        if self._deallocate_all:
+            self._deallocate_all = False
+            deallocate = None
+        else:
+            while len(self._statements) >= self.capacity:
+                self._deallocate.append(
+                    self._statements.popitem(last=False)[1][0]
+                )
+            deallocate, self._deallocate = self._deallocate, []
+        return "sqla_%d" % next(self._counter), deallocate
+
+    def add(self, statement, name, execute_sql):
+        self._statements[statement] = (name, execute_sql)
+
+    def discard(self):
+        """Forget all prepared statements, deallocating them along with
+        the next statement prepared."""
+
+        self._deallocate.extend(name for name, _ in self._statements.values())
+        self._statements.clear()
+
+    def failed(self):
+        """Forget all prepared statements after the SQL which prepares a
+        statement has failed, deallocating all of them along with the next
+        statement prepared.
+
+        The SQL may fail at any point, so it isn't known whether the
+        statements it deallocated and prepared took effect; releasing
+        them by name could then fail in turn.
+
+        """
+        self._statements.clear()
+        self._deallocate = []
+        self._deallocate_all = True
+
+
+class _ResultSetCursor(object):
+    """Hold one result set of a DBAPI cursor which executed several
+    statements at once, so that the cursor may move on to the next one.
+
+    Provides the portion of the DBAPI cursor interface used by
+    :class:`.ResultProxy` and the execution context.
+
+    """
+
+    __slots__ = "description", "rowcount", "lastrowid", "_rows"
+
+    def __init__(self, cursor):
+        self.description = cursor.description
+        self.rowcount = cursor.rowcount
+        self.lastrowid = getattr(cursor, "lastrowid", None)
+        if self.description is not None:
+            self._rows = collections.deque(cursor.fetchall())
+        else:
+            self._rows = collections.deque()
+
+    def fetchone(self):
+        if self._rows:
+            return self._rows.popleft()
+        else:
+            return None
+
+    def fetchmany(self, size=1):
+        rows = self._rows
+        return [rows.popleft() for _ in range(min(size, len(rows)))]
+
+    def fetchall(self):
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def close(self):
+        self._rows.clear()
+
+
 DefaultDialect.execution_ctx_cls = DefaultExecutionContext
@@ -79,6 +79,10 @@ class Dialect(object):
     max_identifier_length
       The maximum length of identifier names.
 
+    max_bind_parameters
+      The maximum number of bound parameters that may be passed along
+      with a single statement, or ``None`` if there is no known limit.
+
     supports_unicode_statements
       Indicate whether the DB-API can receive SQL statements as Python
       unicode strings
@@ -96,6 +100,12 @@ class Dialect(object):
       ``UPDATE`` and ``DELETE`` statements when executed via
       executemany.
 
+    supports_multistatement_batch
+      ``True`` if the DB-API can execute several statements separated by
+      semicolons in one ``cursor.execute()`` call and then deliver the
+      result of each using ``cursor.nextset()``; see
+      :meth:`.Dialect.do_execute_batch`.
+
     preexecute_autoincrement_sequences
       True if 'implicit' primary key functions must be executed separately
       in order to get their value.   This is currently oriented towards
@@ -109,6 +119,16 @@ class Dialect(object):
       the "implicit" functionality is not used and inserted_primary_key
       will not be available.
 
+    full_returning
+      ``True`` if the dialect supports RETURNING (or equivalent) for
+      UPDATE and DELETE statements which may affect multiple rows, so that
+      the values of each matched row may be delivered in the result.
+
+    supports_recursive_ctes
+      ``True`` if the dialect supports recursive common table expressions,
+      i.e. ``WITH RECURSIVE``, which may refer to themselves using
+      ``UNION``.
+
     colspecs
       A dictionary of TypeEngine classes from sqlalchemy.types mapped
       to subclasses that are specific to the dialect class.  This
@@ -307,6 +327,89 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about columns in all tables in `schema`.
+
+        Given a :class:`.Connection`, an optional string `schema` and an
+        optional list of table names `filter_names`, return a dictionary
+        mapping each table name to a list of column dictionaries as
+        returned by :meth:`.Dialect.get_columns`.  Tables not present in
+        the database are omitted.
+
+        The implementation in :class:`.DefaultDialect` calls upon
+        :meth:`.Dialect.get_columns` for each table; dialects may provide
+        an implementation which retrieves information for all tables at
+        once.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the primary key constraints of all
+        tables in `schema`.
+
+        As :meth:`.Dialect.get_multi_columns`, returning a dictionary
+        mapping each table name to a dictionary as returned by
+        :meth:`.Dialect.get_pk_constraint`.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about foreign keys in all tables in `schema`.
+
+        As :meth:`.Dialect.get_multi_columns`, returning a dictionary
+        mapping each table name to a list of dictionaries as returned by
+        :meth:`.Dialect.get_foreign_keys`.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about indexes in all tables in `schema`.
+
+        As :meth:`.Dialect.get_multi_columns`, returning a dictionary
+        mapping each table name to a list of dictionaries as returned by
+        :meth:`.Dialect.get_indexes`.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        """Return a string which changes whenever tables within `schema`
+        are created, altered or dropped.
+
+        The fingerprint should be obtainable using a single inexpensive
+        query; it's used to determine if previously reflected table
+        information is still current.   Returns None if the dialect
+        does not support fingerprinting.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
     def get_table_names(self, connection, schema=None, **kw):
         """Return a list of table names for `schema`."""
 
@@ -674,6 +777,22 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def do_execute_batch(self, cursor, statement, parameters, contexts):
+        """Execute several statements joined into a single string, as
+        used by :meth:`.Connection.execute_batch`.
+
+        ``parameters`` is the concatenation of the positional parameters
+        of each statement, and ``contexts`` the :class:`.ExecutionContext`
+        of each statement.  Returns a list with one cursor-like object per
+        statement, holding the description, rowcount, lastrowid and rows of
+        that statement's result.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
     def is_disconnect(self, e, connection, cursor):
         """Return True if the given DB-API error indicates an invalid
         connection"""
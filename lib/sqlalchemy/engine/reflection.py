@@ -25,9 +25,7 @@ methods such as get_table_names, get_columns, etc.
    'name' attribute..
 """
 
-from .base import Connectable
 from .. import exc
-from .. import inspection
 from .. import sql
 from .. import util
 from ..sql import operators
@@ -136,10 +134,6 @@ class Inspector(object):
             return bind.dialect.inspector(bind)
         return Inspector(bind)
 
-    @inspection._inspects(Connectable)
-    def _insp(bind):
-        return Inspector.from_engine(bind)
-
     @property
     def default_schema_name(self):
         """Return the default schema name presented by the dialect
@@ -567,6 +561,147 @@ class Inspector(object):
             self.bind, table_name, schema, info_cache=self.info_cache, **kw
         )
 
+    def get_multi_columns(self, schema=None, filter_names=None, **kw):
+        """Return information about columns in all tables in `schema`.
+
+        This is the multi-table form of :meth:`.Inspector.get_columns`,
+        which dialects may implement using a single query for all tables,
+        rather than one query per table.
+
+        :param schema: string schema name; if omitted, uses the default schema
+         of the database connection.  For special quoting,
+         use :class:`.quoted_name`.
+
+        :param filter_names: optional list of table names; if present,
+         only information for these tables is returned.  Otherwise,
+         all tables as returned by :meth:`.Inspector.get_table_names` are
+         included.
+
+        :return: a dictionary mapping each table name to a list of
+         dictionaries, each representing the definition of a database
+         column, as returned by :meth:`.Inspector.get_columns`.
+
+        .. versionadded:: 1.4
+
+        """
+
+        multi_col_defs = self.dialect.get_multi_columns(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+        for col_defs in multi_col_defs.values():
+            for col_def in col_defs:
+                coltype = col_def["type"]
+                if not isinstance(coltype, TypeEngine):
+                    col_def["type"] = coltype()
+        return multi_col_defs
+
+    def get_multi_pk_constraint(self, schema=None, filter_names=None, **kw):
+        """Return information about the primary key constraints of all
+        tables in `schema`.
+
+        This is the multi-table form of
+        :meth:`.Inspector.get_pk_constraint`; parameters are as those of
+        :meth:`.Inspector.get_multi_columns`.
+
+        :return: a dictionary mapping each table name to a dictionary
+         as returned by :meth:`.Inspector.get_pk_constraint`.
+
+        .. versionadded:: 1.4
+
+        """
+        return self.dialect.get_multi_pk_constraint(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_multi_foreign_keys(self, schema=None, filter_names=None, **kw):
+        """Return information about foreign keys in all tables in `schema`.
+
+        This is the multi-table form of
+        :meth:`.Inspector.get_foreign_keys`; parameters are as those of
+        :meth:`.Inspector.get_multi_columns`.
+
+        :return: a dictionary mapping each table name to a list of
+         dictionaries as returned by :meth:`.Inspector.get_foreign_keys`.
+
+        .. versionadded:: 1.4
+
+        """
+        return self.dialect.get_multi_foreign_keys(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_multi_indexes(self, schema=None, filter_names=None, **kw):
+        """Return information about indexes in all tables in `schema`.
+
+        This is the multi-table form of :meth:`.Inspector.get_indexes`;
+        parameters are as those of :meth:`.Inspector.get_multi_columns`.
+
+        :return: a dictionary mapping each table name to a list of
+         dictionaries as returned by :meth:`.Inspector.get_indexes`.
+
+        .. versionadded:: 1.4
+
+        """
+        return self.dialect.get_multi_indexes(
+            self.bind,
+            schema=schema,
+            filter_names=filter_names,
+            info_cache=self.info_cache,
+            **kw
+        )
+
+    def get_schema_fingerprint(self, schema=None, **kw):
+        """Return a string which changes whenever tables within `schema`
+        are created, altered or dropped, or None if the dialect does not
+        support schema fingerprints.
+
+        The fingerprint is used by the :mod:`sqlalchemy.ext.reflectioncache`
+        extension to determine if cached reflection results are current.
+
+        :param schema: string schema name; if omitted, uses the default schema
+         of the database connection.  For special quoting,
+         use :class:`.quoted_name`.
+
+        .. versionadded:: 1.4
+
+        """
+        return self.dialect.get_schema_fingerprint(
+            self.bind, schema, info_cache=self.info_cache, **kw
+        )
+
+    def _get_reflection_info(self, schema=None, filter_names=None, **kw):
+        """Fetch the information used by :meth:`.Inspector.reflecttable`
+        for many tables at once, for use by :meth:`.MetaData.reflect`."""
+
+        def keyed(info):
+            return dict(
+                ((schema, table_name), value)
+                for table_name, value in info.items()
+            )
+
+        return _ReflectionInfo(
+            columns=keyed(self.get_multi_columns(schema, filter_names, **kw)),
+            pk_constraint=keyed(
+                self.get_multi_pk_constraint(schema, filter_names, **kw)
+            ),
+            foreign_keys=keyed(
+                self.get_multi_foreign_keys(schema, filter_names, **kw)
+            ),
+            indexes=keyed(self.get_multi_indexes(schema, filter_names)),
+        )
+
     def reflecttable(
         self,
         table,
@@ -574,6 +709,7 @@ class Inspector(object):
         exclude_columns=(),
         resolve_fks=True,
         _extend_on=None,
+        _reflect_info=None,
     ):
         """Given a Table object, load its internal constructs based on
         introspection.
@@ -633,12 +769,19 @@ class Inspector(object):
             if isinstance(table_name, str):
                 table_name = table_name.decode(dialect.encoding)
 
+        if _reflect_info is None:
+            _reflect_info = _ReflectionInfo()
+
         found_table = False
         cols_by_orig_name = {}
 
-        for col_d in self.get_columns(
-            table_name, schema, **table.dialect_kwargs
-        ):
+        col_defs = _reflect_info.columns.get((schema, table_name))
+        if col_defs is None:
+            col_defs = self.get_columns(
+                table_name, schema, **table.dialect_kwargs
+            )
+
+        for col_d in col_defs:
             found_table = True
 
             self._reflect_column(
@@ -653,7 +796,12 @@ class Inspector(object):
             raise exc.NoSuchTableError(table.name)
 
         self._reflect_pk(
-            table_name, schema, table, cols_by_orig_name, exclude_columns
+            table_name,
+            schema,
+            table,
+            cols_by_orig_name,
+            exclude_columns,
+            _reflect_info,
         )
 
         self._reflect_fk(
@@ -665,6 +813,7 @@ class Inspector(object):
             resolve_fks,
             _extend_on,
             reflection_options,
+            _reflect_info,
         )
 
         self._reflect_indexes(
@@ -675,6 +824,7 @@ class Inspector(object):
             include_columns,
             exclude_columns,
             reflection_options,
+            _reflect_info,
         )
 
         self._reflect_unique_constraints(
@@ -770,11 +920,19 @@ class Inspector(object):
             colargs.append(sequence)
 
     def _reflect_pk(
-        self, table_name, schema, table, cols_by_orig_name, exclude_columns
+        self,
+        table_name,
+        schema,
+        table,
+        cols_by_orig_name,
+        exclude_columns,
+        _reflect_info,
     ):
-        pk_cons = self.get_pk_constraint(
-            table_name, schema, **table.dialect_kwargs
-        )
+        pk_cons = _reflect_info.pk_constraint.get((schema, table_name))
+        if pk_cons is None:
+            pk_cons = self.get_pk_constraint(
+                table_name, schema, **table.dialect_kwargs
+            )
         if pk_cons:
             pk_cols = [
                 cols_by_orig_name[pk]
@@ -799,10 +957,13 @@ class Inspector(object):
         resolve_fks,
         _extend_on,
         reflection_options,
+        _reflect_info,
     ):
-        fkeys = self.get_foreign_keys(
-            table_name, schema, **table.dialect_kwargs
-        )
+        fkeys = _reflect_info.foreign_keys.get((schema, table_name))
+        if fkeys is None:
+            fkeys = self.get_foreign_keys(
+                table_name, schema, **table.dialect_kwargs
+            )
         for fkey_d in fkeys:
             conname = fkey_d["name"]
             # look for columns by orig name in cols_by_orig_name,
@@ -828,6 +989,7 @@ class Inspector(object):
                         schema=referred_schema,
                         autoload_with=self.bind,
                         _extend_on=_extend_on,
+                        _reflect_info=_reflect_info,
                         **reflection_options
                     )
                 for column in referred_columns:
@@ -843,6 +1005,7 @@ class Inspector(object):
                         autoload_with=self.bind,
                         schema=sa_schema.BLANK_SCHEMA,
                         _extend_on=_extend_on,
+                        _reflect_info=_reflect_info,
                         **reflection_options
                     )
                 for column in referred_columns:
@@ -877,9 +1040,12 @@ class Inspector(object):
         include_columns,
         exclude_columns,
         reflection_options,
+        _reflect_info,
     ):
         # Indexes
-        indexes = self.get_indexes(table_name, schema)
+        indexes = _reflect_info.indexes.get((schema, table_name))
+        if indexes is None:
+            indexes = self.get_indexes(table_name, schema)
         for index_d in indexes:
             name = index_d["name"]
             columns = index_d["column_names"]
@@ -1005,3 +1171,20 @@ class Inspector(object):
             return
         else:
             table.comment = comment_dict.get("text", None)
+
+
+class _ReflectionInfo(object):
+    """Table information retrieved for many tables at once, keyed on
+    (schema, table name).
+
+    """
+
+    __slots__ = ("columns", "pk_constraint", "foreign_keys", "indexes")
+
+    def __init__(
+        self, columns=None, pk_constraint=None, foreign_keys=None, indexes=None
+    ):
+        self.columns = columns or {}
+        self.pk_constraint = pk_constraint or {}
+        self.foreign_keys = foreign_keys or {}
+        self.indexes = indexes or {}
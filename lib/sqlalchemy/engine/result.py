@@ -42,6 +42,32 @@ except ImportError:
         return obj
 
 
+try:
+    from sqlalchemy.cresultproxy import process_tuple_rows
+except ImportError:
+
+    def process_tuple_rows(cls, processors, rows):
+        """Apply result processors to raw DBAPI rows, returning a list of
+        instances of the given ``tuple`` subclass."""
+
+        new = tuple.__new__
+        procs = [
+            (index, processor)
+            for index, processor in enumerate(processors)
+            if processor is not None
+        ]
+        if not procs:
+            return [new(cls, row) for row in rows]
+
+        result = []
+        for row in rows:
+            row = list(row)
+            for index, processor in procs:
+                row[index] = processor(row[index])
+            result.append(new(cls, row))
+        return result
+
+
 try:
     from sqlalchemy.cresultproxy import BaseRowProxy
 
@@ -210,6 +236,7 @@ class ResultMetaData(object):
         "_processors",
         "keys",
         "_orig_processors",
+        "_tuple_row_cls",
     )
 
     def __init__(self, parent, cursor_description):
@@ -218,6 +245,7 @@ class ResultMetaData(object):
         self.case_sensitive = dialect.case_sensitive
         self.matched_on_name = False
         self._orig_processors = None
+        self._tuple_row_cls = None
 
         if context.result_column_struct:
             result_columns, cols_are_ordered, textual_ordered = (
@@ -655,6 +683,23 @@ class ResultMetaData(object):
 
         return operator.itemgetter(index)
 
+    def _tuple_row_class(self):
+        """Return the ``tuple`` subclass used for rows when the
+        ``tuple_rows`` execution option is in use.
+
+        String keys which are ambiguous within the result don't produce
+        attributes on the class.
+
+        """
+        row_cls = self._tuple_row_cls
+        if row_cls is None:
+            counts = collections.Counter(self.keys)
+            row_cls = self._tuple_row_cls = util.lightweight_named_tuple(
+                "result",
+                [key if counts[key] == 1 else None for key in self.keys],
+            )
+        return row_cls
+
     def __getstate__(self):
         return {
             "_pickled_keymap": dict(
@@ -679,6 +724,8 @@ class ResultMetaData(object):
         self.keys = state["keys"]
         self.case_sensitive = state["case_sensitive"]
         self.matched_on_name = state["matched_on_name"]
+        self._orig_processors = None
+        self._tuple_row_cls = None
 
 
 class ResultProxy(object):
@@ -703,6 +750,7 @@ class ResultProxy(object):
     """
 
     _process_row = RowProxy
+    _tuple_row_cls = None
     out_parameters = None
     _autoclose_connection = False
     _metadata = None
@@ -717,6 +765,7 @@ class ResultProxy(object):
         self._echo = (
             self.connection._echo and context.engine._should_log_debug()
         )
+        self._tuple_rows = context.execution_options.get("tuple_rows", False)
         self._init_metadata()
 
     def _getter(self, key, raiseerr=True):
@@ -738,16 +787,31 @@ class ResultProxy(object):
     def _init_metadata(self):
         cursor_description = self._cursor_description()
         if cursor_description is not None:
-            if (
-                self.context.compiled
-                and "compiled_cache" in self.context.execution_options
-            ):
-                if self.context.compiled._cached_metadata:
-                    self._metadata = self.context.compiled._cached_metadata
+            compiled = self.context.compiled
+            if compiled:
+                # a compiled statement nearly always produces the same
+                # cursor.description each time it's executed; reuse the
+                # ResultMetaData built from the previous description, as
+                # long as the dialect and the names and types reported by
+                # the DBAPI are unchanged
+                dialect = self.context.dialect
+                description_key = [
+                    (rec[0], rec[1]) for rec in cursor_description
+                ]
+                cached = compiled._cached_metadata
+                if (
+                    cached is not None
+                    and cached[0] is dialect
+                    and cached[1] == description_key
+                ):
+                    self._metadata = cached[2]
                 else:
-                    self._metadata = (
-                        self.context.compiled._cached_metadata
-                    ) = ResultMetaData(self, cursor_description)
+                    self._metadata = ResultMetaData(self, cursor_description)
+                    compiled._cached_metadata = (
+                        dialect,
+                        description_key,
+                        self._metadata,
+                    )
             else:
                 self._metadata = ResultMetaData(self, cursor_description)
             if self._echo:
@@ -1174,8 +1238,11 @@ class ResultProxy(object):
             return default
 
     def process_rows(self, rows):
-        process_row = self._process_row
         metadata = self._metadata
+        if self._tuple_rows:
+            return self._process_tuple_rows(metadata, rows)
+
+        process_row = self._process_row
         keymap = metadata._keymap
         processors = metadata._processors
         if self._echo:
@@ -1190,6 +1257,20 @@ class ResultProxy(object):
                 process_row(metadata, row, processors, keymap) for row in rows
             ]
 
+    def _process_tuple_rows(self, metadata, rows):
+        if self._echo:
+            log = self.context.engine.logger.debug
+            for row in rows:
+                log("Row %r", sql_util._repr_row(row))
+
+        # BufferedColumnResultProxy moves the processors aside
+        processors = metadata._orig_processors or metadata._processors
+        return process_tuple_rows(
+            self._tuple_row_cls or metadata._tuple_row_class(),
+            processors,
+            rows,
+        )
+
     def fetchall(self):
         """Fetch all rows, just like DB-API ``cursor.fetchall()``.
 
@@ -18,7 +18,6 @@ New strategies can be added via new ``EngineStrategy`` classes.
 from operator import attrgetter
 
 from . import base
-from . import threadlocal
 from . import url
 from .. import event
 from .. import pool as poollib
@@ -225,7 +224,11 @@ class ThreadLocalEngineStrategy(DefaultEngineStrategy):
     """Strategy for configuring an Engine with threadlocal behavior."""
 
     name = "threadlocal"
-    engine_cls = threadlocal.TLEngine
+
+    @property
+    @util.dependencies("sqlalchemy.engine.threadlocal")
+    def engine_cls(self, threadlocal):
+        return threadlocal.TLEngine
 
 
 ThreadLocalEngineStrategy()
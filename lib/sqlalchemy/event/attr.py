@@ -76,6 +76,7 @@ class _ClsLevelDispatch(RefCollection):
         "has_kw",
         "legacy_signatures",
         "_clslevel",
+        "_empty_listeners",
         "__weakref__",
     )
 
@@ -94,6 +95,7 @@ class _ClsLevelDispatch(RefCollection):
         fn.__doc__ = legacy._augment_fn_docs(self, parent_dispatch_cls, fn)
 
         self._clslevel = weakref.WeakKeyDictionary()
+        self._empty_listeners = weakref.WeakKeyDictionary()
 
     def _adjust_fn_spec(self, fn, named):
         if named:
@@ -134,6 +136,7 @@ class _ClsLevelDispatch(RefCollection):
                 if cls not in self._clslevel:
                     self._assign_cls_collection(cls)
                 self._clslevel[cls].appendleft(event_key._listen_fn)
+            self._update_empty_listener(cls)
         registry._stored_in_collection(event_key, self)
 
     def append(self, event_key, propagate):
@@ -155,6 +158,7 @@ class _ClsLevelDispatch(RefCollection):
                 if cls not in self._clslevel:
                     self._assign_cls_collection(cls)
                 self._clslevel[cls].append(event_key._listen_fn)
+            self._update_empty_listener(cls)
         registry._stored_in_collection(event_key, self)
 
     def _assign_cls_collection(self, target):
@@ -172,6 +176,14 @@ class _ClsLevelDispatch(RefCollection):
                 clslevel.extend(
                     [fn for fn in self._clslevel[cls] if fn not in clslevel]
                 )
+        self._update_empty_listener(target)
+
+    def _update_empty_listener(self, target):
+        # switch the _EmptyListener for this class to or from the
+        # no-op version, following changes to the class level listeners
+        empty = self._empty_listeners.get(target)
+        if empty is not None:
+            empty._set_class()
 
     def remove(self, event_key):
         target = event_key.dispatch_target
@@ -181,6 +193,7 @@ class _ClsLevelDispatch(RefCollection):
             stack.extend(cls.__subclasses__())
             if cls in self._clslevel:
                 self._clslevel[cls].remove(event_key._listen_fn)
+                self._update_empty_listener(cls)
         registry._removed_from_collection(event_key, self)
 
     def clear(self):
@@ -190,6 +203,8 @@ class _ClsLevelDispatch(RefCollection):
         for dispatcher in self._clslevel.values():
             to_clear.update(dispatcher)
             dispatcher.clear()
+        for empty in self._empty_listeners.values():
+            empty._set_class()
         registry._clear(self, to_clear)
 
     def for_modify(self, obj):
@@ -217,6 +232,10 @@ class _EmptyListener(_InstanceLevelDispatch):
     Is replaced by _ListenerCollection when instance-level
     events are added.
 
+    While no class-level events are present either, the
+    _EmptyListener takes on the class _NoListeners, so that
+    testing for and invoking the event are as inexpensive as possible.
+
     """
 
     propagate = frozenset()
@@ -230,6 +249,13 @@ class _EmptyListener(_InstanceLevelDispatch):
         self.parent = parent  # _ClsLevelDispatch
         self.parent_listeners = parent._clslevel[target_cls]
         self.name = parent.name
+        parent._empty_listeners[target_cls] = self
+        self._set_class()
+
+    def _set_class(self):
+        self.__class__ = (
+            _EmptyListener if self.parent_listeners else _NoListeners
+        )
 
     def for_modify(self, obj):
         """Return an event collection which can be modified.
@@ -270,6 +296,26 @@ class _EmptyListener(_InstanceLevelDispatch):
     __nonzero__ = __bool__
 
 
+class _NoListeners(_EmptyListener):
+    """An _EmptyListener for which no class-level events are present."""
+
+    __slots__ = ()
+
+    def __call__(self, *args, **kw):
+        """Execute this event."""
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+
 class _CompoundListener(_InstanceLevelDispatch):
     __slots__ = "_exec_once_mutex", "_exec_once"
 
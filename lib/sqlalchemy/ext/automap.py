@@ -465,6 +465,41 @@ to a new name::
     Base.prepare(engine, reflect=True)
 
 
+.. _automap_render_module:
+
+Rendering a Module at Build Time
+================================
+
+Reflecting a large schema and generating classes and relationships on each
+process start can take a considerable amount of time.   Once
+:meth:`.AutomapBase.prepare` has been called, the
+:meth:`.AutomapBase.render_module` method may be used to produce the source
+code of a Python module which declares the same tables, classes and
+relationships using plain :mod:`~sqlalchemy.ext.declarative`, typically as
+part of an application's build process::
+
+    Base = automap_base()
+    Base.prepare(engine, reflect=True)
+
+    with open("myapp/model.py", "w") as file_:
+        file_.write(Base.render_module())
+
+The resulting module may then be imported directly, without reflection or
+relationship generation taking place::
+
+    from myapp.model import user, address
+
+The module renders each :class:`.Table` with its columns, datatypes,
+nullability, server defaults, foreign key and unique constraints and
+indexes; other constructs, such as CHECK constraints and dialect-specific
+table options, as well as mapper options such as those for inheritance
+other than the base class, are not rendered.   Class names, as produced
+by :paramref:`.AutomapBase.prepare.classname_for_table`, must be valid
+Python identifiers, which don't conflict with the other names the module
+defines or imports, such as ``Base``, ``Column`` or ``text``.
+
+.. versionadded:: 1.4
+
 Using Automap with Explicit Declarations
 ========================================
 
@@ -513,16 +548,26 @@ we've declared are in an un-mapped state.
 
 
 """  # noqa
+import keyword
+import re
+
 from .declarative import declarative_base as _declarative_base
 from .declarative.base import _DeferredMapperConfig
+from .. import exc
+from .. import types
 from .. import util
 from ..orm import backref
+from ..orm import configure_mappers
 from ..orm import exc as orm_exc
 from ..orm import interfaces
 from ..orm import relationship
 from ..orm.mapper import _CONFIGURE_MUTEX
+from ..orm.util import CascadeOptions
+from ..schema import DefaultClause
 from ..schema import ForeignKeyConstraint
+from ..schema import UniqueConstraint
 from ..sql import and_
+from ..sql.type_api import TypeEngine
 
 
 def classname_for_table(base, tablename, table):
@@ -709,6 +754,7 @@ class AutomapBase(object):
         name_for_scalar_relationship=name_for_scalar_relationship,
         name_for_collection_relationship=name_for_collection_relationship,
         generate_relationship=generate_relationship,
+        reflection_cache=None,
     ):
         """Extract mapped classes and relationships from the :class:`.MetaData` and
         perform mappings.
@@ -753,14 +799,24 @@ class AutomapBase(object):
 
          .. versionadded:: 1.1
 
+        :param reflection_cache: a
+         :class:`~sqlalchemy.ext.reflectioncache.ReflectionCache` which, when
+         present in conjunction with the
+         :paramref:`.AutomapBase.prepare.reflect` flag, is used to load
+         reflected tables from disk when the database schema has not
+         changed since they were last reflected.
+
+         .. versionadded:: 1.4
+
         """
         if reflect:
-            cls.metadata.reflect(
-                engine,
-                schema=schema,
-                extend_existing=True,
-                autoload_replace=False,
+            reflect_opts = dict(
+                schema=schema, extend_existing=True, autoload_replace=False
             )
+            if reflection_cache is not None:
+                reflection_cache.reflect(cls.metadata, engine, **reflect_opts)
+            else:
+                cls.metadata.reflect(engine, **reflect_opts)
 
         _CONFIGURE_MUTEX.acquire()
         try:
@@ -821,6 +877,24 @@ class AutomapBase(object):
         finally:
             _CONFIGURE_MUTEX.release()
 
+    @classmethod
+    def render_module(cls):
+        """Return the source code of a Python module which declares the
+        tables, classes and relationships produced by
+        :meth:`.AutomapBase.prepare`, using plain declarative.
+
+        :meth:`.AutomapBase.prepare` must be called first.
+
+        .. seealso::
+
+            :ref:`automap_render_module`
+
+        .. versionadded:: 1.4
+
+        """
+        configure_mappers()
+        return _ModuleRenderer(cls).render()
+
     _sa_decl_prepare = True
     """Indicate that the mapping of classes should be deferred.
 
@@ -1107,3 +1181,289 @@ def _m2m_relationship(
             map_config.properties[
                 relationship_name
             ].back_populates = backref_name
+
+
+class _ModuleRenderer(object):
+    """Render the source of a declarative module equivalent to the
+    mappings of an :class:`.AutomapBase`."""
+
+    _identifier = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+    _default_cascade = CascadeOptions("save-update, merge")
+
+    def __init__(self, automap_base):
+        self.metadata = automap_base.metadata
+        self.mappers = [cls.__mapper__ for cls in automap_base.classes]
+        self.imports = set(
+            [
+                ("sqlalchemy", "Column"),
+                ("sqlalchemy", "Table"),
+                ("sqlalchemy.ext.declarative", "declarative_base"),
+            ]
+        )
+        self.builtins = set()
+        self.table_exprs = {}
+        for mapper in self.mappers:
+            name = mapper.class_.__name__
+            if not self._is_identifier(name):
+                raise exc.ArgumentError(
+                    "Can't render class name %r as a Python identifier; "
+                    "use the classname_for_table parameter of "
+                    "AutomapBase.prepare() to produce a different name."
+                    % name
+                )
+            self.table_exprs[mapper.local_table] = "%s.__table__" % name
+            for prop in mapper.relationships:
+                if prop.parent is mapper and not self._is_identifier(prop.key):
+                    raise exc.ArgumentError(
+                        "Can't render relationship name %r on class %r as a "
+                        "Python identifier; use the "
+                        "name_for_scalar_relationship and "
+                        "name_for_collection_relationship parameters of "
+                        "AutomapBase.prepare() to produce a different name."
+                        % (prop.key, name)
+                    )
+        for table in self.metadata.tables.values():
+            if table not in self.table_exprs:
+                self.table_exprs[table] = "t_%s" % re.sub(
+                    r"\W", "_", table.key
+                )
+
+    def _is_identifier(self, name):
+        return bool(
+            self._identifier.match(name)
+            and not keyword.iskeyword(name)
+            and name not in ("None", "True", "False")
+        )
+
+    def render(self):
+        sections = []
+        for table in self.metadata.tables.values():
+            if not self.table_exprs[table].endswith(".__table__"):
+                sections.append(
+                    "%s = %s" % (self.table_exprs[table], self._table(table))
+                )
+
+        rendered = set()
+        for mapper in self.mappers:
+            self._render_class(mapper, rendered, sections)
+
+        self._check_module_names()
+
+        imports = [
+            "from %s import %s" % (module, name)
+            for module, name in sorted(self.imports)
+        ]
+        return "\n\n\n".join(
+            [
+                "# generated by sqlalchemy.ext.automap\n"
+                + "\n".join(imports),
+                "Base = declarative_base()",
+            ]
+            + sections
+        ) + "\n"
+
+    def _check_module_names(self):
+        module_names = set(name for module, name in self.imports)
+        module_names.update(self.builtins)
+        module_names.add("Base")
+        module_names.update(
+            expr
+            for expr in self.table_exprs.values()
+            if not expr.endswith(".__table__")
+        )
+        for mapper in self.mappers:
+            name = mapper.class_.__name__
+            if name in module_names:
+                raise exc.ArgumentError(
+                    "Can't render class name %r, which conflicts with a "
+                    "name the module imports or defines; use the "
+                    "classname_for_table parameter of AutomapBase.prepare() "
+                    "to produce a different name." % name
+                )
+
+    def _render_class(self, mapper, rendered, sections):
+        if mapper in rendered:
+            return
+        rendered.add(mapper)
+        if mapper.inherits is not None:
+            self._render_class(mapper.inherits, rendered, sections)
+            base = mapper.inherits.class_.__name__
+        else:
+            base = "Base"
+
+        lines = [
+            "class %s(%s):" % (mapper.class_.__name__, base),
+            "    __table__ = %s" % self._table(mapper.local_table, 1),
+        ]
+        for prop in mapper.relationships:
+            if prop.parent is mapper:
+                lines.append("")
+                lines.append(
+                    "    %s = %s" % (prop.key, self._relationship(prop))
+                )
+        sections.append("\n".join(lines))
+
+    def _table(self, table, indent=0):
+        args = [repr(table.name), "Base.metadata"]
+        for col in table.columns:
+            args.append(self._column(col))
+        for constraint in sorted(
+            table.constraints, key=lambda c: (c.name or "", c._creation_order)
+        ):
+            if isinstance(constraint, ForeignKeyConstraint):
+                args.append(self._fk_constraint(constraint))
+            elif isinstance(constraint, UniqueConstraint):
+                self.imports.add(("sqlalchemy", "UniqueConstraint"))
+                args.append(
+                    "UniqueConstraint(%s)"
+                    % ", ".join(
+                        [repr(col.name) for col in constraint.columns]
+                        + self._kwargs(name=constraint.name)
+                    )
+                )
+        for index in sorted(table.indexes, key=lambda idx: idx.name or ""):
+            if index.expressions and len(index.columns) == len(
+                index.expressions
+            ):
+                self.imports.add(("sqlalchemy", "Index"))
+                args.append(
+                    "Index(%s)"
+                    % ", ".join(
+                        [repr(index.name)]
+                        + [repr(col.name) for col in index.columns]
+                        + self._kwargs(
+                            unique=True if index.unique else None
+                        )
+                    )
+                )
+        args.extend(self._kwargs(schema=table.schema, comment=table.comment))
+        return self._call("Table", args, indent)
+
+    def _column(self, col):
+        args = [repr(col.name), self._type(col.type)]
+        server_default = None
+        if isinstance(col.server_default, DefaultClause):
+            self.imports.add(("sqlalchemy", "text"))
+            server_default = "text(%r)" % util.text_type(
+                col.server_default.arg
+            )
+        args.extend(
+            self._kwargs(
+                key=col.key if col.key != col.name else None,
+                primary_key=col.primary_key or None,
+                nullable=False
+                if not col.nullable and not col.primary_key
+                else None,
+                comment=col.comment,
+            )
+        )
+        if server_default is not None:
+            args.append("server_default=%s" % server_default)
+        return "Column(%s)" % ", ".join(args)
+
+    def _type(self, type_):
+        for value in [type_] + list(vars(type_).values()):
+            if isinstance(value, TypeEngine):
+                cls = type(value)
+                if getattr(types, cls.__name__, None) is cls:
+                    self.imports.add(("sqlalchemy.types", cls.__name__))
+                else:
+                    self.imports.add((cls.__module__, cls.__name__))
+        return repr(type_)
+
+    def _fk_constraint(self, constraint):
+        self.imports.add(("sqlalchemy", "ForeignKeyConstraint"))
+        return "ForeignKeyConstraint(%s)" % ", ".join(
+            [
+                repr([fk.parent.name for fk in constraint.elements]),
+                repr([fk.target_fullname for fk in constraint.elements]),
+            ]
+            + self._kwargs(
+                name=constraint.name,
+                ondelete=constraint.ondelete,
+                onupdate=constraint.onupdate,
+                deferrable=constraint.deferrable,
+                initially=constraint.initially,
+            )
+        )
+
+    def _relationship(self, prop):
+        self.imports.add(("sqlalchemy.orm", "relationship"))
+        args = [repr(prop.mapper.class_.__name__)]
+        if prop.secondary is not None:
+            self.imports.add(("sqlalchemy", "and_"))
+            args.append("secondary=%s" % self.table_exprs[prop.secondary])
+            args.append(
+                "primaryjoin=lambda: %s"
+                % self._join(prop.synchronize_pairs)
+            )
+            args.append(
+                "secondaryjoin=lambda: %s"
+                % self._join(prop.secondary_synchronize_pairs)
+            )
+        elif prop._user_defined_foreign_keys:
+            args.append(
+                "foreign_keys=lambda: %s"
+                % self._columns(prop._user_defined_foreign_keys)
+            )
+        if prop.direction is interfaces.MANYTOONE:
+            args.append(
+                "remote_side=lambda: %s" % self._columns(prop.remote_side)
+            )
+        elif not prop.uselist:
+            args.append("uselist=False")
+
+        if prop._reverse_property:
+            reverse = sorted(rev.key for rev in prop._reverse_property)
+            args.append("back_populates=%r" % reverse[0])
+
+        if prop.uselist and prop.collection_class not in (None, list):
+            cls = prop.collection_class
+            if cls.__module__ not in ("builtins", "__builtin__"):
+                self.imports.add((cls.__module__, cls.__name__))
+            else:
+                self.builtins.add(cls.__name__)
+            args.append("collection_class=%s" % cls.__name__)
+        if prop.cascade != self._default_cascade:
+            args.append("cascade=%r" % ", ".join(sorted(prop.cascade)))
+        args.extend(
+            self._kwargs(
+                passive_deletes=prop.passive_deletes or None,
+                viewonly=prop.viewonly or None,
+            )
+        )
+        return self._call("relationship", args, 1)
+
+    def _join(self, pairs):
+        return "and_(%s)" % ", ".join(
+            "%s == %s" % (self._col_expr(left), self._col_expr(right))
+            for left, right in pairs
+        )
+
+    def _columns(self, cols):
+        return "[%s]" % ", ".join(
+            sorted(self._col_expr(col) for col in cols)
+        )
+
+    def _col_expr(self, col):
+        table_expr = self.table_exprs[col.table]
+        if self._is_identifier(col.key):
+            return "%s.c.%s" % (table_expr, col.key)
+        else:
+            return "%s.c[%r]" % (table_expr, col.key)
+
+    def _kwargs(self, **kw):
+        return [
+            "%s=%r" % (key, value)
+            for key, value in sorted(kw.items())
+            if value is not None
+        ]
+
+    def _call(self, fn, args, indent):
+        pad = "    " * indent
+        return "%s(\n%s\n%s)" % (
+            fn,
+            "\n".join("%s    %s," % (pad, arg) for arg in args),
+            pad,
+        )
@@ -10,6 +10,7 @@ This system allows specification of classes and expressions used in
 :func:`.relationship` using strings.
 
 """
+import re
 import weakref
 
 from ... import exc
@@ -23,6 +24,9 @@ from ...orm.properties import SynonymProperty
 from ...schema import _get_table_key
 
 
+# a name or dotted series of names, e.g. "MyClass" or "MyClass.id"
+_dotted_name = re.compile(r"^[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*$")
+
 # strong references to registries which we place in
 # the _decl_class_registry, which is usually weak referencing.
 # the internal registries here link to classes with weakrefs and remove
@@ -289,9 +293,28 @@ class _class_resolver(object):
 
         return self.fallback[key]
 
+    def _resolve_name(self):
+        # resolve a plain dotted name without compiling an expression;
+        # KeyError indicates the first name wasn't located in the
+        # registry, to be handled by eval() in the usual way
+        tokens = self.arg.split(".")
+        if tokens[0] in ("None", "True", "False"):
+            raise KeyError(tokens[0])
+        x = self._dict[tokens[0]]
+        for token in tokens[1:]:
+            x = getattr(x, token)
+        return x
+
     def __call__(self):
         try:
-            x = eval(self.arg, globals(), self._dict)
+            x = None
+            if _dotted_name.match(self.arg):
+                try:
+                    x = self._resolve_name()
+                except KeyError:
+                    pass
+            if x is None:
+                x = eval(self.arg, globals(), self._dict)
 
             if isinstance(x, _GetColumns):
                 return x.cls
@@ -0,0 +1,223 @@
+# ext/reflectioncache.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Persist the results of :meth:`.MetaData.reflect` on disk, so that an
+application reflecting an unchanged schema on each startup may load the
+reflected :class:`.Table` objects from a file instead of querying the
+database catalog for each table.
+
+Usage::
+
+    from sqlalchemy.ext.reflectioncache import ReflectionCache
+
+    cache = ReflectionCache("/var/cache/myapp/reflection")
+
+    metadata = MetaData()
+    cache.reflect(metadata, engine)
+
+The :meth:`.ReflectionCache.reflect` method accepts the same arguments as
+:meth:`.MetaData.reflect`.   The cache may also be passed to
+:meth:`.AutomapBase.prepare`::
+
+    Base = automap_base()
+    Base.prepare(engine, reflect=True, reflection_cache=cache)
+
+Cache files are keyed on a *fingerprint* of the schema being reflected, as
+returned by :meth:`.Inspector.get_schema_fingerprint`, which the dialect
+produces using a single inexpensive query.   Whenever tables in the schema
+are created, altered or dropped, the fingerprint changes and the next
+reflection goes to the database, storing its result under the new
+fingerprint.   For dialects that don't support schema fingerprints, as well
+as when the ``only`` argument is given as a callable, the cache is bypassed
+and :meth:`.MetaData.reflect` is called normally.
+
+.. note::
+
+    The fingerprint covers only the schema being reflected; tables in
+    other schemas which are reflected due to foreign key references are
+    not checked for changes.
+
+The cache files are written using ``pickle`` and should be stored in a
+location that is writable only by the application.
+
+.. versionadded:: 1.4
+
+"""
+
+import hashlib
+import os
+import tempfile
+
+from .. import __version__
+from .. import inspect
+from .. import util
+from ..sql.base import _bind_or_error
+from ..sql.schema import MetaData
+from ..util import pickle
+
+
+__all__ = ["ReflectionCache"]
+
+
+class ReflectionCache(object):
+    """Store reflected :class:`.Table` objects in a directory, keyed on a
+    fingerprint of the database schema.
+
+    :param path: directory in which cache files are stored.  It is created
+     if it does not exist.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def reflect(
+        self,
+        metadata,
+        bind=None,
+        schema=None,
+        views=False,
+        only=None,
+        extend_existing=False,
+        autoload_replace=True,
+        resolve_fks=True,
+        max_workers=None,
+        **dialect_kwargs
+    ):
+        """Load all available table definitions from the database into
+        the given :class:`.MetaData`, using the cache where possible.
+
+        Arguments are the same as those of :meth:`.MetaData.reflect`,
+        with the addition of the target :class:`.MetaData` as the
+        first argument.
+
+        """
+        if bind is None:
+            bind = _bind_or_error(metadata)
+        if schema is None:
+            schema = metadata.schema
+
+        reflect_opts = dict(
+            schema=schema,
+            views=views,
+            only=only,
+            extend_existing=extend_existing,
+            autoload_replace=autoload_replace,
+            resolve_fks=resolve_fks,
+            max_workers=max_workers,
+            **dialect_kwargs
+        )
+
+        with bind.connect() as conn:
+            # worker threads check out connections of their own, so they
+            # need the Engine rather than this connection
+            reflect_bind = bind if max_workers else conn
+
+            if util.callable(only):
+                fingerprint = None
+            else:
+                fingerprint = inspect(conn).get_schema_fingerprint(schema)
+
+            if fingerprint is None:
+                metadata.reflect(reflect_bind, **reflect_opts)
+                return
+
+            filename = os.path.join(
+                self.path,
+                self._cache_key(
+                    conn,
+                    fingerprint,
+                    schema,
+                    views,
+                    only,
+                    resolve_fks,
+                    dialect_kwargs,
+                ),
+            )
+
+            cached = self._load(filename)
+            if cached is None:
+                cached = MetaData()
+                cached.reflect(
+                    reflect_bind,
+                    schema=schema,
+                    views=views,
+                    only=only,
+                    resolve_fks=resolve_fks,
+                    max_workers=max_workers,
+                    **dialect_kwargs
+                )
+                self._store(filename, cached)
+
+            existing = []
+            for key, table in cached.tables.items():
+                if key not in metadata.tables:
+                    table.tometadata(metadata)
+                elif table.schema == schema:
+                    existing.append(table.name)
+
+            # tables already present in the target MetaData are
+            # extended from the database as MetaData.reflect() would
+            if extend_existing and existing:
+                reflect_opts["only"] = existing
+                metadata.reflect(reflect_bind, **reflect_opts)
+
+    def _cache_key(
+        self,
+        conn,
+        fingerprint,
+        schema,
+        views,
+        only,
+        resolve_fks,
+        dialect_kwargs,
+    ):
+        key = repr(
+            (
+                __version__,
+                conn.dialect.name,
+                conn.dialect.driver,
+                repr(conn.engine.url),
+                fingerprint,
+                schema,
+                views,
+                sorted(only) if only is not None else None,
+                resolve_fks,
+                sorted(dialect_kwargs.items()),
+            )
+        )
+        return "%s.pickle" % hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _load(self, filename):
+        try:
+            with open(filename, "rb") as file_:
+                return pickle.load(file_)
+        except Exception:
+            # besides an unreadable or truncated file, unpickling may
+            # raise any exception, such as when a class it refers to was
+            # since renamed; any failure counts as a miss
+            return None
+
+    def _store(self, filename, metadata):
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        # write to a temporary file first so that concurrently starting
+        # processes never see a partially written cache file
+        fd, tmpname = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file_:
+                pickle.dump(metadata, file_, pickle.HIGHEST_PROTOCOL)
+            _replace(tmpname, filename)
+        except:
+            with util.safe_reraise():
+                os.remove(tmpname)
+
+
+_replace = getattr(os, "replace", os.rename)
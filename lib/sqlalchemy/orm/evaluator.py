@@ -5,11 +5,15 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+import keyword
 import operator
+import re
 
 from .. import inspect
 from .. import util
 from ..sql import operators
+from ..sql import visitors
+from ..util import compat
 
 
 class UnevaluatableError(Exception):
@@ -51,10 +55,80 @@ _notimplemented_ops = set(
 )
 
 
+# straight operators which can be rendered inline as Python operators
+# within a generated evaluator function
+_inline_ops = {
+    operators.add: "+",
+    operators.mul: "*",
+    operators.sub: "-",
+    operators.mod: "%",
+    operators.lt: "<",
+    operators.le: "<=",
+    operators.ne: "!=",
+    operators.gt: ">",
+    operators.ge: ">=",
+    operators.eq: "==",
+}
+
+_identifier = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
 class EvaluatorCompiler(object):
     def __init__(self, target_cls=None):
         self.target_cls = target_cls
 
+    def compile(self, clause):
+        """Produce a single Python function which evaluates the given
+        criteria against an object.
+
+        Whereas :meth:`.process` returns a tree of closures that each call
+        into one another, this method generates Python source for the
+        whole expression so that evaluation against each object is one
+        function call.   The generated code is cached in terms of the
+        structure of the clause, as given by its cache key, along with the
+        mapper each column is annotated with, so that repeated evaluation
+        of the same criteria with different bound values only generates
+        code once per target class.
+
+        """
+        cache = key = None
+        bindparams = []
+        if self.target_cls is not None:
+            try:
+                key = clause._cache_key(bindparams=bindparams)
+            except NotImplementedError:
+                pass
+            else:
+                # the cache key of a column doesn't include annotations;
+                # the parent mapper determines which attribute is evaluated
+                # and whether the column can be evaluated at all
+                key += tuple(
+                    elem._annotations.get("parentmapper")
+                    for elem in visitors.iterate(clause, {})
+                    if elem.__visit_name__ == "column"
+                )
+                cache = inspect(self.target_cls)._evaluator_cache
+
+        if cache is not None and key in cache:
+            factory = cache[key]
+        else:
+            generator = _EvaluatorCodeGenerator(self)
+            factory = generator.generate(clause)
+            if cache is not None and len(generator.bindparams) == len(
+                bindparams
+            ):
+                cache[key] = factory
+            # use the bindparams in the order in which code was generated,
+            # in case the cache key does not match up
+            bindparams = generator.bindparams
+
+        return factory(
+            *[
+                bindparam.callable() if bindparam.callable else bindparam.value
+                for bindparam in bindparams
+            ]
+        )
+
     def process(self, clause):
         meth = getattr(self, "visit_%s" % clause.__visit_name__, None)
         if not meth:
@@ -76,6 +150,10 @@ class EvaluatorCompiler(object):
         return lambda obj: True
 
     def visit_column(self, clause):
+        get_corresponding_attr = operator.attrgetter(self._column_key(clause))
+        return lambda obj: get_corresponding_attr(obj)
+
+    def _column_key(self, clause):
         if "parentmapper" in clause._annotations:
             parentmapper = clause._annotations["parentmapper"]
             if self.target_cls and not issubclass(
@@ -100,9 +178,7 @@ class EvaluatorCompiler(object):
                 )
             else:
                 raise UnevaluatableError("Cannot evaluate column: %s" % clause)
-
-        get_corresponding_attr = operator.attrgetter(key)
-        return lambda obj: get_corresponding_attr(obj)
+        return key
 
     def visit_clauselist(self, clause):
         evaluators = list(map(self.process, clause.clauses))
@@ -190,3 +266,156 @@ class EvaluatorCompiler(object):
         else:
             val = clause.value
         return lambda obj: val
+
+
+class _EvaluatorCodeGenerator(object):
+    """Generate Python source for an evaluator function.
+
+    Each element renders statements which assign its value to a local
+    variable, whose name is returned; AND and OR are short circuited
+    using a nested block per element, maintaining the same
+    NULL-handling semantics as that of the evaluators produced by
+    :meth:`.EvaluatorCompiler.process`.
+
+    """
+
+    def __init__(self, compiler):
+        self.compiler = compiler
+        self.lines = []
+        self.env = {}
+        self.bindparams = []
+        self._counter = 0
+
+    def generate(self, clause):
+        self.indent = 2
+        result = self.process(clause)
+        self.emit("return %s" % result)
+
+        argnames = ", ".join(
+            "_p%d" % idx for idx in range(len(self.bindparams))
+        )
+        code = "def factory(%s):\n    def evaluate(obj):\n%s\n" % (
+            argnames,
+            "\n".join(self.lines),
+        )
+        code += "    return evaluate\n"
+        env = dict(self.env)
+        compat.exec_(code, env)
+        return env["factory"]
+
+    def emit(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def assign(self, expr):
+        self._counter += 1
+        name = "_t%d" % self._counter
+        self.emit("%s = %s" % (name, expr))
+        return name
+
+    def process(self, clause):
+        meth = getattr(self, "visit_%s" % clause.__visit_name__, None)
+        if not meth:
+            raise UnevaluatableError(
+                "Cannot evaluate %s" % type(clause).__name__
+            )
+        return meth(clause)
+
+    def visit_grouping(self, clause):
+        return self.process(clause.element)
+
+    def visit_null(self, clause):
+        return "None"
+
+    def visit_false(self, clause):
+        return "False"
+
+    def visit_true(self, clause):
+        return "True"
+
+    def visit_column(self, clause):
+        key = self.compiler._column_key(clause)
+
+        if _identifier.match(key) and not keyword.iskeyword(key):
+            return self.assign("obj.%s" % key)
+        else:
+            name = "_g%d" % len(self.env)
+            self.env[name] = operator.attrgetter(key)
+            return self.assign("%s(obj)" % name)
+
+    def visit_bindparam(self, clause):
+        self.bindparams.append(clause)
+        return "_p%d" % (len(self.bindparams) - 1)
+
+    def visit_clauselist(self, clause):
+        if clause.operator is operators.or_:
+            result = self.assign("False")
+            has_null = self.assign("False")
+            for idx, sub_clause in enumerate(clause.clauses):
+                if idx:
+                    self.emit("if %s is not True:" % result)
+                    self.indent += 1
+                value = self.process(sub_clause)
+                self.emit("if %s:" % value)
+                self.emit("    %s = True" % result)
+                self.emit("elif %s is None:" % value)
+                self.emit("    %s = True" % has_null)
+                if idx:
+                    self.indent -= 1
+            self.emit("if %s is not True and %s:" % (result, has_null))
+            self.emit("    %s = None" % result)
+            return result
+
+        elif clause.operator is operators.and_:
+            result = self.assign("True")
+            for idx, sub_clause in enumerate(clause.clauses):
+                if idx:
+                    self.emit("if %s is True:" % result)
+                    self.indent += 1
+                value = self.process(sub_clause)
+                self.emit("if not %s:" % value)
+                self.emit(
+                    "    %s = None if %s is None else False" % (result, value)
+                )
+                if idx:
+                    self.indent -= 1
+            return result
+
+        else:
+            raise UnevaluatableError(
+                "Cannot evaluate clauselist with operator %s" % clause.operator
+            )
+
+    def visit_binary(self, clause):
+        left, right = self.process(clause.left), self.process(clause.right)
+        operator = clause.operator
+        if operator is operators.is_:
+            return self.assign("%s == %s" % (left, right))
+        elif operator is operators.isnot:
+            return self.assign("%s != %s" % (left, right))
+        elif operator in _straight_ops:
+            if operator in _inline_ops:
+                expr = "%s %s %s" % (left, _inline_ops[operator], right)
+            else:
+                name = "_o%d" % len(self.env)
+                self.env[name] = operator
+                expr = "%s(%s, %s)" % (name, left, right)
+            return self.assign(
+                "None if %s is None or %s is None else %s"
+                % (left, right, expr)
+            )
+        else:
+            raise UnevaluatableError(
+                "Cannot evaluate %s with operator %s"
+                % (type(clause).__name__, clause.operator)
+            )
+
+    def visit_unary(self, clause):
+        if clause.operator is operators.inv:
+            value = self.process(clause.element)
+            return self.assign(
+                "None if %s is None else not %s" % (value, value)
+            )
+        raise UnevaluatableError(
+            "Cannot evaluate %s with operator %s"
+            % (type(clause).__name__, clause.operator)
+        )
@@ -53,6 +53,16 @@ class IdentityMap(object):
     def _dirty_states(self):
         return self._modified
 
+    def _all_states_for_class(self, class_):
+        """Return all states for objects which are instances of the given
+        class or its subclasses."""
+
+        return [
+            state
+            for state in self.all_states()
+            if issubclass(state.class_, class_)
+        ]
+
     def check_modified(self):
         """return True if any InstanceStates present have been marked
         as 'modified'.
@@ -86,6 +96,12 @@ class IdentityMap(object):
 
 
 class WeakInstanceDict(IdentityMap):
+
+    # dictionary of class -> {identity key: state}, established
+    # upon first call to _all_states_for_class() and maintained
+    # from that point on
+    _class_index = None
+
     def __getitem__(self, key):
         state = self._dict[key]
         o = state.obj()
@@ -124,11 +140,15 @@ class WeakInstanceDict(IdentityMap):
             else:
                 if existing is not state:
                     self._manage_removed_state(existing)
+                    if self._class_index is not None:
+                        self._unindex_state(existing, state.key)
                 else:
                     return
 
         self._dict[state.key] = state
         self._manage_incoming_state(state)
+        if self._class_index is not None:
+            self._index_state(state, state.key)
 
     def add(self, state):
         key = state.key
@@ -153,12 +173,16 @@ class WeakInstanceDict(IdentityMap):
                     return False
         self._dict[key] = state
         self._manage_incoming_state(state)
+        if self._class_index is not None:
+            self._index_state(state, key)
         return True
 
     def _add_unpresent(self, state, key):
         # inlined form of add() called by loading.py
         self._dict[key] = state
         state._instance_dict = self._wr
+        if self._class_index is not None:
+            self._index_state(state, key)
 
     def get(self, key, default=None):
         if key not in self._dict:
@@ -221,6 +245,8 @@ class WeakInstanceDict(IdentityMap):
         else:
             if st is state:
                 self._dict.pop(state.key, None)
+                if self._class_index is not None:
+                    self._unindex_state(state, state.key)
 
     def discard(self, state):
         self.safe_discard(state)
@@ -236,10 +262,36 @@ class WeakInstanceDict(IdentityMap):
                 if st is state:
                     self._dict.pop(state.key, None)
                     self._manage_removed_state(state)
+                    if self._class_index is not None:
+                        self._unindex_state(state, state.key)
 
     def prune(self):
         return 0
 
+    def _index_state(self, state, key):
+        self._class_index.setdefault(state.class_, {})[key] = state
+
+    def _unindex_state(self, state, key):
+        by_key = self._class_index.get(state.class_)
+        if by_key is not None and by_key.get(key) is state:
+            del by_key[key]
+
+    def _all_states_for_class(self, class_):
+        if self._class_index is None:
+            self._class_index = {}
+            for key, state in list(self._dict.items()):
+                self._index_state(state, key)
+
+        states = []
+        for cls, by_key in list(self._class_index.items()):
+            if issubclass(cls, class_):
+                states.extend(
+                    state
+                    for state in list(by_key.values())
+                    if state.obj() is not None
+                )
+        return states
+
 
 class StrongInstanceDict(IdentityMap):
     """A 'strong-referencing' version of the identity map.
@@ -25,6 +25,7 @@ from .base import _SET_DEFERRED_EXPIRED
 from .util import _none_set
 from .util import state_str
 from .. import exc as sa_exc
+from .. import sql
 from .. import util
 from ..sql import util as sql_util
 
@@ -37,6 +38,7 @@ def instances(query, cursor, context):
 
     context.runid = _new_runid()
     context.post_load_paths = {}
+    context.dialect = cursor.dialect
 
     filtered = query._has_mapper_entities
 
@@ -58,17 +60,31 @@ def instances(query, cursor, context):
                 )
 
     try:
-        (process, labels) = list(
-            zip(
-                *[
-                    query_entity.row_processor(query, context, cursor)
-                    for query_entity in query._entities
-                ]
-            )
+        column_tuple = not filtered and _column_tuple_class(
+            query, context, cursor
         )
 
-        if not single_entity:
-            keyed_tuple = util.lightweight_named_tuple("result", labels)
+        if column_tuple:
+            # the result columns are exactly the column entities, so the
+            # ResultProxy can produce the named tuples directly
+            cursor._tuple_rows = True
+            cursor._tuple_row_cls = column_tuple
+        else:
+            # row processors look up columns by key, so a "tuple_rows"
+            # option passed along from the Engine or Connection is
+            # ignored here
+            cursor._tuple_rows = False
+            (process, labels) = list(
+                zip(
+                    *[
+                        query_entity.row_processor(query, context, cursor)
+                        for query_entity in query._entities
+                    ]
+                )
+            )
+
+            if not single_entity:
+                keyed_tuple = util.lightweight_named_tuple("result", labels)
 
         while True:
             context.partials = {}
@@ -80,7 +96,9 @@ def instances(query, cursor, context):
             else:
                 fetch = cursor.fetchall()
 
-            if single_entity:
+            if column_tuple:
+                rows = fetch
+            elif single_entity:
                 proc = process[0]
                 rows = [proc(row) for row in fetch]
             else:
@@ -105,6 +123,30 @@ def instances(query, cursor, context):
         util.raise_from_cause(err)
 
 
+@util.dependencies("sqlalchemy.orm.query")
+def _column_tuple_class(querylib, query, context, cursor):
+    """Return the named tuple class for the rows of a query that selects
+    only column expressions, if each column entity corresponds to the
+    result column in the same position; otherwise return None.
+
+    """
+    metadata = cursor._metadata
+    if metadata is None or len(metadata.keys) != len(query._entities):
+        return None
+
+    keymap = metadata._keymap
+    labels = []
+    for index, ent in enumerate(query._entities):
+        if type(ent) is not querylib._ColumnEntity:
+            return None
+        rec = keymap.get(ent._result_column(query, context))
+        if rec is None or rec[2] != index:
+            return None
+        labels.append(ent._label_name)
+
+    return util.lightweight_named_tuple("result", labels)
+
+
 @util.dependencies("sqlalchemy.orm.query")
 def merge_result(querylib, query, iterator, load=True):
     """Merge a result into this :class:`.Query` object's Session."""
@@ -284,6 +326,148 @@ def load_on_pk_identity(
         return None
 
 
+_get_many_chunksize = 500
+
+
+def _get_many_chunksize_for(query, mapper):
+    """Return the number of primary key identities to send in each
+    IN expression, taking into account the bound parameter limit
+    of the dialect in use, if any.
+
+    """
+    chunksize = _get_many_chunksize
+    if query.session is not None:
+        # locate the bind in terms of the statement to be executed, as
+        # is done when the query is run, so that a session which chooses
+        # among several binds based on the statement locates the same one
+        dialect = query._get_bind_args(
+            query._compile_context(), query.session.get_bind
+        ).dialect
+        if dialect.max_bind_parameters:
+            chunksize = min(
+                chunksize,
+                max(1, dialect.max_bind_parameters // len(mapper.primary_key)),
+            )
+    return chunksize
+
+
+def load_on_pk_identities(
+    query,
+    primary_key_identities,
+    chunksize=None,
+    populate_existing=False,
+    only_load_props=None,
+):
+    """Load the given list of primary key identities from the database.
+
+    Identities are loaded using "IN" (or tuple-"IN" for a composite primary
+    key) criteria against a single expanding bound parameter, so that the
+    same compiled statement serves every chunk.  Returns a dictionary of
+    primary key identity tuple to instance; identities not located are
+    not present in the dictionary.
+
+    """
+
+    mapper = query._mapper_zero()
+
+    result = {}
+
+    # None present in ident - these can't participate in an IN
+    # expression; load them individually using "IS NULL"
+    primary_key_identities = [tuple(ident) for ident in primary_key_identities]
+    for ident in primary_key_identities:
+        if None in ident:
+            obj = load_on_pk_identity(
+                query, ident, only_load_props=only_load_props
+            )
+            if obj is not None:
+                result[ident] = obj
+
+    idents = [ident for ident in primary_key_identities if None not in ident]
+    if not idents:
+        return result
+
+    in_expr, zero_idx = mapper._get_many_in_expr
+
+    q = query._clone()
+    q._get_condition()
+    q._criterion = q._adapt_clause(
+        in_expr.in_(sql.bindparam("primary_keys", expanding=True)),
+        True,
+        False,
+    )
+
+    if query._for_update_arg is not None:
+        version_check = True
+    else:
+        version_check = False
+
+    if only_load_props:
+        # the primary key is needed in each row in order to
+        # locate the identity
+        only_load_props = set(only_load_props).union(
+            prop.key for prop in mapper._identity_key_props
+        )
+
+    q._get_options(
+        populate_existing=populate_existing,
+        version_check=version_check,
+        only_load_props=only_load_props,
+    )
+    q._order_by = None
+
+    if chunksize is None:
+        chunksize = _get_many_chunksize_for(q, mapper)
+
+    while idents:
+        chunk = idents[0:chunksize]
+        idents = idents[chunksize:]
+
+        for obj in q.params(
+            primary_keys=[ident[0] if zero_idx else ident for ident in chunk]
+        ):
+            result[attributes.instance_state(obj).key[1]] = obj
+
+    return result
+
+
+def refresh_states(session, states, only_load_props=None):
+    """Refresh the given persistent states from the database.
+
+    States are grouped by mapper and loaded using
+    :func:`.load_on_pk_identities`, so that the number of SELECT
+    statements emitted is one per chunk of identities per mapper,
+    rather than one per state.  Returns a list of those states
+    which could not be located.
+
+    """
+
+    by_mapper = util.OrderedDict()
+    for state in states:
+        by_mapper.setdefault(state.mapper, []).append(state)
+
+    missing = []
+    for mapper, mapper_states in by_mapper.items():
+        if only_load_props:
+            # see load_scalar_attributes()
+            attribute_names = set(only_load_props).intersection(
+                mapper.attrs.keys()
+            )
+        else:
+            attribute_names = None
+
+        found = load_on_pk_identities(
+            session.query(mapper),
+            [state.key[1] for state in mapper_states],
+            populate_existing=True,
+            only_load_props=attribute_names,
+        )
+        missing.extend(
+            state for state in mapper_states if state.key[1] not in found
+        )
+    return missing
+
+
 def _setup_entity_query(
     context,
     mapper,
@@ -489,6 +673,14 @@ def _instance_processor(
     else:
         is_not_primary_key = _none_set.intersection
 
+    # consecutive rows for the same identity, such as those produced by
+    # joined eager loading of a collection, re-use the instance located
+    # for the previous row rather than looking it up in the identity
+    # map again.  not used with yield_per, as the Session may be altered
+    # between batches of rows.
+    track_last_row = not context.query._yield_per
+    last_row = [None, None]
+
     def _instance(row):
 
         # determine the state that we'll be populating
@@ -503,13 +695,16 @@ def _instance_processor(
         else:
             # look at the row, see if that identity is in the
             # session, or we have to create a new one
-            identitykey = (
-                identity_class,
-                tuple([row[column] for column in pk_cols]),
-                identity_token,
-            )
+            identity = tuple([row[column] for column in pk_cols])
 
-            instance = session_identity_map.get(identitykey)
+            if track_last_row and identity == last_row[0]:
+                instance = last_row[1]
+            else:
+                identitykey = (identity_class, identity, identity_token)
+                instance = session_identity_map.get(identitykey)
+                if track_last_row and instance is not None:
+                    last_row[0] = identity
+                    last_row[1] = instance
 
             if instance is not None:
                 # existing instance
@@ -528,7 +723,7 @@ def _instance_processor(
 
                 # check for non-NULL values in the primary key columns,
                 # else no entity is returned for the row
-                if is_not_primary_key(identitykey[1]):
+                if is_not_primary_key(identity):
                     return None
 
                 isnew = True
@@ -546,6 +741,10 @@ def _instance_processor(
                 state.session_id = session_id
                 session_identity_map._add_unpresent(state, identitykey)
 
+                if track_last_row:
+                    last_row[0] = identity
+                    last_row[1] = instance
+
         # populate.  this looks at whether this state is new
         # for this load or was existing, and whether or not this
         # row is the first row with this identity.
@@ -2499,6 +2499,21 @@ class Mapper(InspectionAttr):
             util.column_dict(params),
         )
 
+    @_memoized_configured_property
+    def _get_many_in_expr(self):
+        """create the left side of an "IN" expression based on the primary
+        key, used by query.get_many() to load many items by primary key.
+
+        Returns a tuple of the expression and a flag indicating if
+        the primary key is a single column, in which case scalar
+        values are passed to the IN rather than tuples.
+
+        """
+        if len(self.primary_key) > 1:
+            return sql.tuple_(*self.primary_key), False
+        else:
+            return self.primary_key[0], True
+
     @_memoized_configured_property
     def _equivalent_columns(self):
         """Create a map of all equivalent columns, based on
@@ -3067,6 +3082,10 @@ class Mapper(InspectionAttr):
     def _compiled_cache(self):
         return util.LRUCache(self._compiled_cache_size)
 
+    @_memoized_configured_property
+    def _evaluator_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
     @_memoized_configured_property
     def _sorted_tables(self):
         table_to_mapper = {}
@@ -3179,6 +3198,13 @@ def configure_mappers():
       mappings that haven't been produced yet, such as if they are in modules
       as yet unimported.
 
+    For an application with a large number of mappings which runs within
+    multiple forked processes, as is common with web application servers,
+    calling :func:`.configure_mappers` in the parent process after all
+    mapped classes have been imported and before forking allows the work of
+    configuration to take place only once, with each child process
+    receiving the configured mappers as is.
+
     """
 
     if not Mapper._new_mappers:
@@ -19,9 +19,9 @@ from itertools import groupby
 import operator
 
 from . import attributes
-from . import evaluator
 from . import exc as orm_exc
 from . import loading
+from . import properties
 from . import sync
 from .base import _entity_descriptor
 from .base import state_str
@@ -1749,14 +1749,15 @@ class BulkEvaluate(BulkUD):
     def _additional_evaluators(self, evaluator_compiler):
         pass
 
-    def _do_pre_synchronize(self):
+    @util.dependencies("sqlalchemy.orm.evaluator")
+    def _do_pre_synchronize(self, evaluator):
         query = self.query
         target_cls = query._mapper_zero().class_
 
         try:
             evaluator_compiler = evaluator.EvaluatorCompiler(target_cls)
             if query.whereclause is not None:
-                eval_condition = evaluator_compiler.process(query.whereclause)
+                eval_condition = evaluator_compiler.compile(query.whereclause)
             else:
 
                 def eval_condition(obj):
@@ -1774,17 +1775,27 @@ class BulkEvaluate(BulkUD):
         # TODO: detect when the where clause is a trivial primary key match
         self.matched_objects = [
             obj
-            for (
-                cls,
-                pk,
-                identity_token,
-            ), obj in query.session.identity_map.items()
-            if issubclass(cls, target_cls) and eval_condition(obj)
+            for obj in (
+                state.obj()
+                for state in query.session.identity_map._all_states_for_class(
+                    target_cls
+                )
+            )
+            if obj is not None and eval_condition(obj)
         ]
 
 
 class BulkFetch(BulkUD):
-    """BulkUD which does the 'fetch' method of session state resolution."""
+    """BulkUD which does the 'fetch' method of session state resolution.
+
+    On backends which support RETURNING for UPDATE and DELETE, the
+    primary keys of matched rows are delivered by the statement itself,
+    unless implicit returning is disabled for the dialect or the table;
+    otherwise, they are fetched using a SELECT ahead of the statement.
+
+    """
+
+    returned_rows = None
 
     def _do_pre_synchronize(self):
         query = self.query
@@ -1793,10 +1804,45 @@ class BulkFetch(BulkUD):
         select_stmt = context.statement.with_only_columns(
             self.primary_table.primary_key
         )
+
+        if self._can_use_returning(
+            session.get_bind(self.mapper, clause=select_stmt).dialect
+        ):
+            # matched rows are established from RETURNING in _execute_stmt
+            self.matched_rows = None
+            return
+
         self.matched_rows = session.execute(
             select_stmt, mapper=self.mapper, params=query._params
         ).fetchall()
 
+    def _can_use_returning(self, dialect):
+        # implicit_returning set to False on the dialect or the table
+        # indicates RETURNING should not be emitted, as is the case for
+        # tables with triggers on some backends
+        return (
+            dialect.full_returning
+            and dialect.implicit_returning
+            and self.primary_table.implicit_returning
+        )
+
+    def _returning_cols(self):
+        return list(self.primary_table.primary_key)
+
+    def _execute_stmt(self, stmt):
+        if self.matched_rows is not None:
+            super(BulkFetch, self)._execute_stmt(stmt)
+            return
+
+        self.result = self.query._execute_crud(
+            stmt.returning(*self._returning_cols()), self.mapper
+        )
+        self.returned_rows = self.result.fetchall()
+        self.rowcount = len(self.returned_rows)
+
+        num_pk = len(self.primary_table.primary_key)
+        self.matched_rows = [row[0:num_pk] for row in self.returned_rows]
+
 
 class BulkUpdate(BulkUD):
     """BulkUD which handles UPDATEs."""
@@ -1979,7 +2025,92 @@ class BulkUpdateFetch(BulkFetch, BulkUpdate):
     """BulkUD which handles UPDATEs using the "fetch"
     method of session resolution."""
 
+    def _can_use_returning(self, dialect):
+        if not super(BulkUpdateFetch, self)._can_use_returning(dialect):
+            return False
+
+        # RETURNING delivers the new primary key, so can't be used to
+        # locate objects in the identity map if the primary key is changing
+        primary_key = self.primary_table.primary_key
+        return not any(
+            col in primary_key for col in self._returning_value_cols()
+        )
+
+    def _returning_value_cols(self):
+        target_mapper = self.query._mapper_zero()
+        cols = util.OrderedDict()
+        for key, value in self._resolved_values_keys_as_propnames:
+            prop = target_mapper._props.get(key)
+            if isinstance(prop, properties.ColumnProperty):
+                col = prop.columns[0]
+                if self.primary_table.c.contains_column(col):
+                    cols[key] = col
+        return cols
+
+    def _returning_cols(self):
+        self.returned_value_cols = self._returning_value_cols()
+        return super(BulkUpdateFetch, self)._returning_cols() + list(
+            self.returned_value_cols.values()
+        )
+
     def _do_post_synchronize(self):
+        if self.returned_rows is not None:
+            self._do_post_synchronize_returning()
+        else:
+            self._do_post_synchronize_fetch()
+
+    def _do_post_synchronize_returning(self):
+        session = self.query.session
+        target_mapper = self.query._mapper_zero()
+        identity_map = session.identity_map
+
+        num_pk = len(self.primary_table.primary_key)
+        returned_keys = list(self.returned_value_cols)
+        attrib = set(k for k, v in self._resolved_values_keys_as_propnames)
+        not_returned = attrib.difference(returned_keys)
+
+        states = set()
+        to_refresh = []
+        for row in self.returned_rows:
+            identity_key = target_mapper.identity_key_from_primary_key(
+                list(row[0:num_pk])
+            )
+            if identity_key not in identity_map:
+                continue
+
+            state = attributes.instance_state(identity_map[identity_key])
+            dict_ = state.dict
+
+            # only apply to unmodified attributes
+            to_apply = state.unmodified.intersection(returned_keys)
+            for key, value in zip(returned_keys, row[num_pk:]):
+                if key in to_apply:
+                    dict_[key] = value
+
+            state.manager.dispatch.refresh(state, None, to_apply)
+
+            state._commit(dict_, list(to_apply))
+
+            # expire attributes with pending changes
+            # (there was no autoflush, so they are overwritten)
+            state._expire_attributes(
+                dict_, set(returned_keys).difference(to_apply)
+            )
+
+            to_expire = not_returned.intersection(dict_)
+            if to_expire:
+                session._expire_state(state, to_expire)
+                to_refresh.append(state)
+
+            states.add(state)
+
+        if to_refresh:
+            loading.refresh_states(
+                session, to_refresh, only_load_props=not_returned
+            )
+        session._register_altered(states)
+
+    def _do_post_synchronize_fetch(self):
         session = self.query.session
         target_mapper = self.query._mapper_zero()
 
@@ -1998,10 +2129,18 @@ class BulkUpdateFetch(BulkFetch, BulkUpdate):
 
         values = self._resolved_values_keys_as_propnames
         attrib = set(k for k, v in values)
+        to_refresh = []
         for state in states:
             to_expire = attrib.intersection(state.dict)
             if to_expire:
                 session._expire_state(state, to_expire)
+                to_refresh.append(state)
+
+        # reload the updated attributes for all matched objects using
+        # one SELECT per chunk of primary keys, rather than leaving them
+        # to be individually loaded upon next access
+        if to_refresh:
+            loading.refresh_states(session, to_refresh, only_load_props=attrib)
         session._register_altered(states)
 
 
@@ -2012,17 +2151,15 @@ class BulkDeleteFetch(BulkFetch, BulkDelete):
     def _do_post_synchronize(self):
         session = self.query.session
         target_mapper = self.query._mapper_zero()
+        identity_map = session.identity_map
+        deleted = []
         for primary_key in self.matched_rows:
-            # TODO: inline this and call remove_newly_deleted
-            # once
             identity_key = target_mapper.identity_key_from_primary_key(
                 list(primary_key)
             )
-            if identity_key in session.identity_map:
-                session._remove_newly_deleted(
-                    [
-                        attributes.instance_state(
-                            session.identity_map[identity_key]
-                        )
-                    ]
+            if identity_key in identity_map:
+                deleted.append(
+                    attributes.instance_state(identity_map[identity_key])
                 )
+        if deleted:
+            session._remove_newly_deleted(deleted)
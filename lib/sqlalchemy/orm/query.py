@@ -962,6 +962,109 @@ class Query(object):
         """
         return self._get_impl(ident, loading.load_on_pk_identity)
 
+    def get_many(self, idents, chunksize=None):
+        """Return a list of instances based on the given sequence of
+        primary key identifiers, in the same order as given, with ``None``
+        in place of any identifier not found.
+
+        E.g.::
+
+            users = session.query(User).get_many([5, 7, 10])
+
+        :meth:`~.Query.get_many` is the multiple-identity form of
+        :meth:`~.Query.get`.   Each identifier is first looked up in the
+        identity map of the owning :class:`.Session`; only those identifiers
+        not locally present, or present but marked as expired, are
+        then loaded from the database, using a single SELECT with an IN
+        expression against the primary key (or a tuple IN for a composite
+        primary key) for each group of identifiers.   The IN expression
+        makes use of an "expanding" bound parameter, so that the same
+        SQL construct is used regardless of the number of identifiers
+        present in each group.
+
+        The same restrictions as that of :meth:`~.Query.get` apply, in that
+        the :class:`.Query` must be against a single mapped entity with no
+        additional filtering criterion.
+
+        :param idents: a sequence of identifiers, each of which is
+         a scalar, tuple, or dictionary as accepted by :meth:`~.Query.get`.
+
+        :param chunksize: the maximum number of identifiers to be sent
+         in a single SELECT statement.   Defaults to 500, reduced as needed
+         so as to remain within the bound parameter limit of the dialect
+         in use, if any.
+
+        :return: a list of object instances or ``None``, corresponding
+         positionally to the given identifiers.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Query.get`
+
+            :meth:`.Session.get_many`
+
+        """
+        mapper = self._only_full_mapper_zero("get_many")
+
+        primary_key_identities = [
+            tuple(self._primary_key_identity_as_list(mapper, ident))
+            for ident in idents
+        ]
+
+        self._get_existing_condition()
+
+        found = {}
+        expired = {}
+
+        if (
+            not self._populate_existing
+            and not mapper.always_refresh
+            and self._for_update_arg is None
+        ):
+            for ident in primary_key_identities:
+                if ident in found or ident in expired:
+                    continue
+
+                instance = self._identity_lookup(
+                    mapper, ident, passive=attributes.PASSIVE_NO_FETCH
+                )
+                if instance is attributes.PASSIVE_NO_RESULT:
+                    # expired; unexpire along with those we're loading
+                    # and verify it still exists
+                    expired[ident] = mapper.identity_key_from_primary_key(
+                        ident
+                    )
+                elif instance is not None:
+                    # reject calls for id in identity map but class
+                    # mismatch.
+                    found[ident] = (
+                        instance
+                        if issubclass(instance.__class__, mapper.class_)
+                        else None
+                    )
+
+        to_load = util.unique_list(
+            ident for ident in primary_key_identities if ident not in found
+        )
+        if to_load:
+            found.update(
+                loading.load_on_pk_identities(
+                    self, to_load, chunksize=chunksize
+                )
+            )
+
+        deleted = [
+            attributes.instance_state(self.session.identity_map[key])
+            for ident, key in expired.items()
+            if ident not in found and key in self.session.identity_map
+        ]
+        if deleted:
+            self.session._remove_newly_deleted(deleted)
+
+        return [found.get(ident) for ident in primary_key_identities]
+
     def _identity_lookup(
         self,
         mapper,
@@ -1017,12 +1120,41 @@ class Query(object):
         return loading.get_from_identity(self.session, key, passive)
 
     def _get_impl(self, primary_key_identity, db_load_fn, identity_token=None):
+        mapper = self._only_full_mapper_zero("get")
+
+        primary_key_identity = self._primary_key_identity_as_list(
+            mapper, primary_key_identity
+        )
+
+        if (
+            not self._populate_existing
+            and not mapper.always_refresh
+            and self._for_update_arg is None
+        ):
+
+            instance = self._identity_lookup(
+                mapper, primary_key_identity, identity_token=identity_token
+            )
+
+            if instance is not None:
+                self._get_existing_condition()
+                # reject calls for id in identity map but class
+                # mismatch.
+                if not issubclass(instance.__class__, mapper.class_):
+                    return None
+                return instance
+
+        return db_load_fn(self, primary_key_identity)
+
+    def _primary_key_identity_as_list(self, mapper, primary_key_identity):
+        """Convert a scalar, tuple, dictionary or composite primary key
+        identifier as accepted by :meth:`.Query.get` into a list of values
+        in primary key column order."""
+
         # convert composite types to individual args
         if hasattr(primary_key_identity, "__composite_values__"):
             primary_key_identity = primary_key_identity.__composite_values__()
 
-        mapper = self._only_full_mapper_zero("get")
-
         is_dict = isinstance(primary_key_identity, dict)
         if not is_dict:
             primary_key_identity = util.to_list(primary_key_identity)
@@ -1052,25 +1184,7 @@ class Query(object):
                     )
                 )
 
-        if (
-            not self._populate_existing
-            and not mapper.always_refresh
-            and self._for_update_arg is None
-        ):
-
-            instance = self._identity_lookup(
-                mapper, primary_key_identity, identity_token=identity_token
-            )
-
-            if instance is not None:
-                self._get_existing_condition()
-                # reject calls for id in identity map but class
-                # mismatch.
-                if not issubclass(instance.__class__, mapper.class_):
-                    return None
-                return instance
-
-        return db_load_fn(self, primary_key_identity)
+        return primary_key_identity
 
     @_generative()
     def correlate(self, *args):
@@ -4607,7 +4721,10 @@ class _ColumnEntity(_QueryEntity):
                 self.entity_zero
             ) and entity.common_parent(self.entity_zero)
 
-    def row_processor(self, query, context, result):
+    def _result_column(self, query, context):
+        """Return the column expression used to locate this entity's value
+        in result rows."""
+
         if ("fetch_column", self) in context.attributes:
             column = context.attributes[("fetch_column", self)]
         else:
@@ -4621,7 +4738,10 @@ class _ColumnEntity(_QueryEntity):
         if context.adapter:
             column = context.adapter.columns[column]
 
-        getter = result._getter(column)
+        return column
+
+    def row_processor(self, query, context, result):
+        getter = result._getter(self._result_column(query, context))
         return getter, self._label_name
 
     def setup_context(self, query, context):
@@ -4672,6 +4792,7 @@ class QueryContext(object):
         "partials",
         "post_load_paths",
         "identity_token",
+        "dialect",
     )
 
     def __init__(self, query):
@@ -4715,6 +4836,7 @@ class QueryContext(object):
             self.identity_token = query._refresh_identity_token
         else:
             self.identity_token = None
+        self.dialect = None
 
 
 class AliasOption(interfaces.MapperOption):
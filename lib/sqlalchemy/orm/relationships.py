@@ -151,6 +151,7 @@ class RelationshipProperty(StrategizedProperty):
         query_class=None,
         info=None,
         omit_join=None,
+        selectin_chunksize=None,
     ):
         """Provide a relationship between two mapped classes.
 
@@ -836,6 +837,20 @@ class RelationshipProperty(StrategizedProperty):
 
           .. versionadded:: 1.3
 
+        :param selectin_chunksize:
+          Number of parent primary key identities to send in each SELECT
+          emitted by the "selectin" loader strategy.  Defaults to ``None``,
+          in which case the loader uses a size of 500.  In either case the
+          size is reduced where needed so that each IN expression stays
+          within the bound parameter limit of the database in use, such as
+          that of SQLite.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`selectin_eager_loading`
+
 
         """
         super(RelationshipProperty, self).__init__()
@@ -864,6 +879,7 @@ class RelationshipProperty(StrategizedProperty):
         self.active_history = active_history
         self.join_depth = join_depth
         self.omit_join = omit_join
+        self.selectin_chunksize = selectin_chunksize
         self.local_remote_pairs = _local_remote_pairs
         self.extension = extension
         self.bake_queries = bake_queries
@@ -3103,6 +3119,14 @@ class JoinCondition(object):
             ]
         )
 
+    @util.memoized_property
+    def _join_targets_cache(self):
+        """Results of :meth:`.join_targets`, keyed on the selectables and
+        criterion they were generated for.
+
+        """
+        return util.LRUCache(10)
+
     def join_targets(
         self, source_selectable, dest_selectable, aliased, single_crit=None
     ):
@@ -3114,8 +3138,23 @@ class JoinCondition(object):
         in the target objects, as well as the extra child
         criterion, equivalent column sets, etc.
 
+        As the same aliased entities tend to be joined to repeatedly,
+        such as those pooled by the joined eager loader, the result is
+        cached, so that the join conditions aren't adapted again for the
+        same targets.
+
         """
+        key = (source_selectable, dest_selectable, aliased, single_crit)
+        targets = self._join_targets_cache.get(key)
+        if targets is None:
+            self._join_targets_cache[key] = targets = self._join_targets(
+                source_selectable, dest_selectable, aliased, single_crit
+            )
+        return targets
 
+    def _join_targets(
+        self, source_selectable, dest_selectable, aliased, single_crit
+    ):
         # place a barrier on the destination such that
         # replacement traversals won't ever dig into it.
         # its internal structure remains fixed
@@ -633,6 +633,7 @@ class Session(_SessionClassMethods):
         "expunge_all",
         "flush",
         "get_bind",
+        "get_many",
         "is_modified",
         "bulk_save_objects",
         "bulk_insert_mappings",
@@ -640,6 +641,7 @@ class Session(_SessionClassMethods):
         "merge",
         "query",
         "refresh",
+        "refresh_many",
         "rollback",
         "scalar",
     )
@@ -1542,6 +1544,29 @@ class Session(_SessionClassMethods):
 
         return self._query_cls(entities, self, **kwargs)
 
+    def get_many(self, entity, idents, chunksize=None):
+        """Return a list of instances of the given entity based on the
+        given sequence of primary key identifiers.
+
+        This is a shortcut for :meth:`.Query.get_many`::
+
+            users = session.get_many(User, [5, 7, 10])
+
+        Objects already present in the identity map are returned without
+        emitting SQL; the remainder are loaded using SELECT statements
+        with an IN expression against the primary key.  The list returned
+        corresponds positionally to the given identifiers, with ``None``
+        for any identifier not found.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Query.get_many`
+
+        """
+        return self.query(entity).get_many(idents, chunksize=chunksize)
+
     @property
     @util.contextmanager
     def no_autoflush(self):
@@ -1675,6 +1700,48 @@ class Session(_SessionClassMethods):
                 "Could not refresh instance '%s'" % instance_str(instance)
             )
 
+    def refresh_many(self, instances, attribute_names=None):
+        """Expire and refresh the attributes on the given instances.
+
+        This is the multiple-instance form of :meth:`.Session.refresh`.
+        Rather than emitting one SELECT per instance, instances are grouped
+        by mapper and refreshed using a SELECT with an IN expression against
+        the primary key, emitting one statement per group of up to 500
+        instances (or fewer, based on the bound parameter limit of the
+        dialect in use).
+
+        :param instances: a sequence of persistent instances.
+
+        :param attribute_names: optional.  An iterable collection of
+          string attribute names indicating a subset of attributes to
+          be refreshed.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Session.refresh`
+
+            :meth:`.Query.get_many`
+
+        """
+        states = []
+        for instance in instances:
+            try:
+                state = attributes.instance_state(instance)
+            except exc.NO_STATE:
+                raise exc.UnmappedInstanceError(instance)
+            self._expire_state(state, attribute_names)
+            states.append(state)
+
+        missing = loading.refresh_states(
+            self, states, only_load_props=attribute_names
+        )
+        if missing:
+            raise sa_exc.InvalidRequestError(
+                "Could not refresh instance '%s'" % state_str(missing[0])
+            )
+
     def expire_all(self):
         """Expires all persistent instances within this Session.
 
@@ -519,9 +519,11 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
         "_rev_bind_to_col",
         "_rev_equated_columns",
         "_simple_lazy_clause",
+        "_simple_lazy_clause_attrs",
         "_raise_always",
         "_raise_on_sql",
         "_bakery",
+        "_lazyload_queries",
     )
 
     def __init__(self, parent, strategy_key):
@@ -618,6 +620,23 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
         return criterion, params
 
+    def _memoized_attr__simple_lazy_clause_attrs(self):
+        # resolve the parent attribute for each column ahead of time;
+        # the columns here are annotated, and locating them within
+        # _columntoproperty on every load is comparatively expensive
+        mapper = self.parent_property.parent
+
+        return [
+            (
+                key,
+                mapper._columntoproperty[ident].key
+                if ident is not None
+                else None,
+                value,
+            )
+            for key, ident, value in self._simple_lazy_clause[1]
+        ]
+
     def _generate_lazy_clause(self, state, passive):
         criterion, param_keys = self._simple_lazy_clause
 
@@ -626,8 +645,6 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                 criterion, [key for key, ident, value in param_keys]
             )
 
-        mapper = self.parent_property.parent
-
         o = state.obj()  # strong ref
         dict_ = attributes.instance_dict(o)
 
@@ -635,16 +652,15 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             passive ^= attributes.INIT_OK
 
         params = {}
-        for key, ident, value in param_keys:
-            if ident is not None:
+        for key, attr_key, value in self._simple_lazy_clause_attrs:
+            if attr_key is not None:
+                impl = state.manager[attr_key].impl
                 if passive and passive & attributes.LOAD_AGAINST_COMMITTED:
-                    value = mapper._get_committed_state_attr_by_column(
-                        state, dict_, ident, passive
+                    value = impl.get_committed_value(
+                        state, dict_, passive=passive
                     )
                 else:
-                    value = mapper._get_state_attr_by_column(
-                        state, dict_, ident, passive
-                    )
+                    value = impl.get(state, dict_, passive=passive)
 
             params[key] = value
 
@@ -744,9 +760,34 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
     def _memoized_attr__bakery(self, baked):
         return baked.bakery(size=50)
 
+    def _memoized_attr__lazyload_queries(self):
+        return {}
+
+    def _lazyload_query(self, state, passive):
+        autoflush = not (not state.key or passive & attributes.NO_AUTOFLUSH)
+
+        if not state.load_options:
+            # in the absence of loader options, the BakedQuery for this
+            # loader only varies on autoflush; assemble it once and
+            # re-use it for every subsequent load, so that per load we're
+            # only looking up the cached query and binding parameters
+            try:
+                return self._lazyload_queries[autoflush]
+            except KeyError:
+                q = self._lazyload_queries[
+                    autoflush
+                ] = self._assemble_lazyload_query(autoflush, None, None)
+                return q
+        else:
+            return self._assemble_lazyload_query(
+                autoflush,
+                state.load_options,
+                state.load_path[self.parent_property],
+            )
+
     @util.dependencies("sqlalchemy.orm.strategy_options")
-    def _emit_lazyload(
-        self, strategy_options, session, state, primary_key_identity, passive
+    def _assemble_lazyload_query(
+        self, strategy_options, autoflush, load_options, effective_path
     ):
         # emit lazy load now using BakedQuery, to cut way down on the overhead
         # of generating queries.
@@ -788,33 +829,20 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                 )
             )
 
-        pending = not state.key
-
         # don't autoflush on pending
-        if pending or passive & attributes.NO_AUTOFLUSH:
+        if not autoflush:
             q.add_criteria(lambda q: q.autoflush(False))
 
-        if state.load_options:
+        if load_options:
             # here, if any of the options cannot return a cache key,
             # the BakedQuery "spoils" and caching will not occur.  a path
             # that features Cls.attribute.of_type(some_alias) will cancel
             # caching, for example, since "some_alias" is user-defined and
             # is usually a throwaway object.
-            effective_path = state.load_path[self.parent_property]
-
-            q._add_lazyload_options(state.load_options, effective_path)
+            q._add_lazyload_options(load_options, effective_path)
 
         if self.use_get:
-            if self._raise_on_sql:
-                self._invoke_raise_load(state, passive, "raise_on_sql")
-
-            return (
-                q(session)
-                .with_post_criteria(lambda q: q._set_lazyload_from(state))
-                ._load_on_pk_identity(
-                    session.query(self.mapper), primary_key_identity
-                )
-            )
+            return q
 
         if self.parent_property.order_by:
             q.add_criteria(
@@ -840,9 +868,27 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                     )
                 )
 
+        lazy_clause = self._simple_lazy_clause[0]
+        q.add_criteria(lambda q: q.filter(lazy_clause))
+
+        return q
+
+    def _emit_lazyload(self, session, state, primary_key_identity, passive):
+        if self.use_get:
+            if self._raise_on_sql:
+                self._invoke_raise_load(state, passive, "raise_on_sql")
+
+            return (
+                self._lazyload_query(state, passive)(session)
+                .with_post_criteria(lambda q: q._set_lazyload_from(state))
+                ._load_on_pk_identity(
+                    session.query(self.mapper), primary_key_identity
+                )
+            )
+
         lazy_clause, params = self._generate_lazy_clause(state, passive)
 
-        if pending:
+        if not state.key:
             if util.has_intersection(orm_util._none_set, params.values()):
                 return None
 
@@ -852,8 +898,6 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
         if self._raise_on_sql:
             self._invoke_raise_load(state, passive, "raise_on_sql")
 
-        q.add_criteria(lambda q: q.filter(lazy_clause))
-
         # set parameters in the query such that we don't overwrite
         # parameters that are already set within it
         def set_default_params(q):
@@ -862,7 +906,7 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             return q
 
         result = (
-            q(session)
+            self._lazyload_query(state, passive)(session)
             .with_post_criteria(lambda q: q._set_lazyload_from(state))
             .with_post_criteria(set_default_params)
             .all()
@@ -2070,6 +2114,7 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
         "_parent_alias",
         "_query_info",
         "_fallback_query_info",
+        "_recursive_cte",
         "_bakery",
     )
 
@@ -2167,6 +2212,70 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             zero_idx = True
         return self.query_info(False, True, in_expr, pk_cols, zero_idx, None)
 
+    def _memoized_attr__recursive_cte(self):
+        # a recursive CTE which locates the primary key of every
+        # descendant of the given parents; only built for the "omit join"
+        # case where parent and child primary key and foreign key
+        # columns are all local to one table
+        query_info = self._query_info
+        if query_info.load_only_child or query_info.load_with_join:
+            return None
+
+        fk_to_pk = dict(
+            (remote, local)
+            for local, remote in (
+                self.parent_property._join_condition.local_remote_pairs
+            )
+        )
+        fk_cols = query_info.pk_cols
+        pk_cols = [fk_to_pk.get(col) for col in fk_cols]
+
+        if any(col is None for col in pk_cols) or set(pk_cols) != set(
+            self.mapper.primary_key
+        ):
+            return None
+
+        table = fk_cols[0].table
+        if any(col.table is not table for col in pk_cols + fk_cols):
+            return None
+
+        cte = (
+            sql.select(pk_cols)
+            .where(
+                query_info.in_expr.in_(
+                    sql.bindparam("primary_keys", expanding=True)
+                )
+            )
+            .cte(recursive=True)
+        )
+        node = table.alias()
+        # UNION rather than UNION ALL, so that the recursion ends
+        # for rows which refer to one another in a cycle
+        cte = cte.union(
+            sql.select([node.corresponding_column(col) for col in pk_cols])
+            .where(
+                sql.and_(
+                    *[
+                        node.corresponding_column(fk) == cte_col
+                        for fk, cte_col in zip(fk_cols, cte.c)
+                    ]
+                )
+            )
+        )
+        onclause = sql.and_(
+            *[col == cte_col for col, cte_col in zip(pk_cols, cte.c)]
+        )
+        return cte, onclause
+
+    def _use_recursive_cte(self, query_info, effective_entity, context):
+        return (
+            context.dialect is not None
+            and context.dialect.supports_recursive_ctes
+            and query_info is self._query_info
+            and self._recursive_cte is not None
+            and not inspect(effective_entity).is_aliased_class
+        )
+
     def init_class_attribute(self, mapper):
         self.parent_property._get_strategy(
             (("lazy", "select"),)
@@ -2195,6 +2304,17 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
         if loading.PostLoad.path_exists(context, selectin_path, self.key):
             return
 
+        recursive = loadopt is not None and loadopt.local_opts.get(
+            "recursive", False
+        )
+        if recursive and not (
+            self.uselist and self.parent_property._is_self_referential
+        ):
+            raise sa_exc.InvalidRequestError(
+                "Recursive selectin loading can only be applied to a "
+                "self-referential collection; '%s' is not." % self
+            )
+
         path_w_prop = path[self.parent_property]
         selectin_path_w_prop = selectin_path[self.parent_property]
 
@@ -2223,11 +2343,19 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             self.key,
             self._load_for_path,
             effective_entity,
+            recursive,
         )
 
     @util.dependencies("sqlalchemy.ext.baked")
     def _load_for_path(
-        self, baked, context, path, states, load_only, effective_entity
+        self,
+        baked,
+        context,
+        path,
+        states,
+        load_only,
+        effective_entity,
+        recursive=False,
     ):
 
         if load_only and self.key not in load_only:
@@ -2311,7 +2439,18 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                 )
             )
 
-        if query_info.load_only_child:
+        use_cte = recursive and self._use_recursive_cte(
+            query_info, effective_entity, context
+        )
+
+        if use_cte:
+            # the IN expression is within the CTE, which delivers the
+            # parent as well as all descendant primary keys
+            cte, onclause = self._recursive_cte
+            q.add_criteria(
+                lambda q: q.join(cte, onclause).order_by(*pk_cols)
+            )
+        elif query_info.load_only_child:
             q.add_criteria(
                 lambda q: q.filter(
                     in_expr.in_(sql.bindparam("primary_keys", expanding=True))
@@ -2358,17 +2497,37 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
         if query_info.load_only_child:
             self._load_via_child(our_states, query_info, q, context)
+        elif use_cte:
+            self._load_via_recursive_cte(our_states, query_info, q, context)
+        elif recursive:
+            self._load_via_parent_per_level(
+                our_states, query_info, q, context
+            )
         else:
             self._load_via_parent(our_states, query_info, q, context)
 
+    def _chunksize_for(self, query_info, context):
+        chunksize = self.parent_property.selectin_chunksize or self._chunksize
+
+        # each key in the IN expression consumes one bound parameter
+        # per column; stay within the limit of the database, if any
+        dialect = context.dialect
+        if dialect is not None and dialect.max_bind_parameters:
+            chunksize = min(
+                chunksize,
+                max(1, dialect.max_bind_parameters // len(query_info.pk_cols)),
+            )
+        return chunksize
+
     def _load_via_child(self, our_states, query_info, q, context):
         uselist = self.uselist
+        chunksize = self._chunksize_for(query_info, context)
 
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
         while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
+            chunk = our_keys[0:chunksize]
+            our_keys = our_keys[chunksize:]
 
             data = {
                 k: v
@@ -2394,10 +2553,11 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
     def _load_via_parent(self, our_states, query_info, q, context):
         uselist = self.uselist
         _empty_result = () if uselist else None
+        chunksize = self._chunksize_for(query_info, context)
 
         while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
 
             primary_keys = [
                 key[0] if query_info.zero_idx else key
@@ -2434,6 +2594,76 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                         state, state_dict, collection
                     )
 
+    def _load_via_recursive_cte(self, our_states, query_info, q, context):
+        chunksize = self._chunksize_for(query_info, context)
+        populate_existing = context.query._populate_existing
+
+        while our_states:
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
+
+            primary_keys = [
+                key[0] if query_info.zero_idx else key
+                for key, state, state_dict, overwrite in chunk
+            ]
+
+            # rows are the parent key and one descendant at any depth;
+            # where parents are themselves nested, a descendant will be
+            # delivered more than once
+            data = collections.defaultdict(list)
+            descendants = util.OrderedDict()
+            for key, obj in q(context.session).params(
+                primary_keys=primary_keys
+            ):
+                state = attributes.instance_state(obj)
+                if (key, state) in descendants:
+                    continue
+                descendants[(key, state)] = True
+                data[key].append(obj)
+
+            for key, state, state_dict, overwrite in chunk:
+                if not overwrite and self.key in state_dict:
+                    continue
+
+                state.get_impl(self.key).set_committed_value(
+                    state, state_dict, data.get(key, ())
+                )
+
+            for key, state in descendants:
+                state_dict = state.dict
+                if not populate_existing and self.key in state_dict:
+                    continue
+
+                state.get_impl(self.key).set_committed_value(
+                    state, state_dict, data.get(state.key[1], ())
+                )
+
+    def _load_via_parent_per_level(self, our_states, query_info, q, context):
+        populate_existing = context.query._populate_existing
+        seen = set(state for key, state, state_dict, overwrite in our_states)
+
+        while our_states:
+            self._load_via_parent(our_states, query_info, q, context)
+
+            # the children just loaded are the parents for the next level;
+            # objects already reached by way of another parent are skipped
+            level = []
+            for key, state, state_dict, overwrite in our_states:
+                for obj in state_dict.get(self.key, ()):
+                    child_state = attributes.instance_state(obj)
+                    if child_state in seen:
+                        continue
+                    seen.add(child_state)
+                    level.append(
+                        (
+                            child_state.key[1],
+                            child_state,
+                            child_state.dict,
+                            populate_existing,
+                        )
+                    )
+            our_states = level
+
 
 def single_parent_validator(desc, prop):
     def _do_check(state, value, oldvalue, initiator):
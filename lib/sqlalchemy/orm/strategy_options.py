@@ -1221,7 +1221,7 @@ def subqueryload_all(*keys):
 
 
 @loader_option()
-def selectinload(loadopt, attr):
+def selectinload(loadopt, attr, recursive=False):
     """Indicate that the given attribute should be loaded using
     SELECT IN eager loading.
 
@@ -1242,6 +1242,20 @@ def selectinload(loadopt, attr):
         query(Order).options(
             lazyload(Order.items).selectinload(Item.keywords))
 
+    :param recursive: if ``True``, the attribute must be a self-referential
+     one-to-many collection, and the collection is loaded for the complete
+     hierarchy beneath each parent object, rather than just one level::
+
+        query(Node).filter(Node.parent_id == None).options(
+            selectinload(Node.children, recursive=True))
+
+     On backends which support recursive common table expressions, each
+     batch of parent objects emits a single SELECT that includes every
+     descendant; on other backends, one SELECT is emitted per level of the
+     hierarchy.
+
+     .. versionadded:: 1.4
+
     .. versionadded:: 1.2
 
     .. seealso::
@@ -1251,17 +1265,20 @@ def selectinload(loadopt, attr):
         :ref:`selectin_eager_loading`
 
     """
-    return loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    loader = loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    if recursive:
+        loader.local_opts["recursive"] = True
+    return loader
 
 
 @selectinload._add_unbound_fn
-def selectinload(*keys):
-    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, False, {})
+def selectinload(*keys, **kw):
+    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, False, kw)
 
 
 @selectinload._add_unbound_all_fn
-def selectinload_all(*keys):
-    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, True, {})
+def selectinload_all(*keys, **kw):
+    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, True, kw)
 
 
 @loader_option()
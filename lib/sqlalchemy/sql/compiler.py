@@ -634,6 +634,22 @@ class SQLCompiler(Compiled):
             if value is not None
         )
 
+    @util.memoized_property
+    def _expanding_template(self):
+        """The statement string split around "expanding" parameters, with
+        the name of each parameter at the odd-numbered positions.
+
+        """
+        return re.split(r"\[EXPANDING_(\S+)\]", self.string)
+
+    @util.memoized_property
+    def _expanded_statements(self):
+        """Statement strings with "expanding" parameters rendered, keyed
+        on the number and shape of the values for each parameter.
+
+        """
+        return util.LRUCache(100)
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -641,61 +657,124 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
+    @util.memoized_property
+    def _bind_param_plan(self):
+        """Per-compiled summary of :attr:`.bind_names` used by
+        :meth:`.construct_params`, so that the bound parameters don't
+        need to be inspected individually on each execution.
+
+        When each bound parameter's key is the same as its rendered name,
+        as is the case for most statements, a dictionary of parameters may
+        be applied to the defaults using dictionary and set operations;
+        otherwise each bound parameter is matched individually as
+        described by the ``per_bind`` collection.
+
+        """
+        defaults = {}
+        callables = []
+        required = set()
+        per_bind = []
+        simple = True
+        for bindparam, name in self.bind_names.items():
+            key = bindparam.key
+            if key != name:
+                simple = False
+            if bindparam.required:
+                required.add(name)
+            if bindparam.callable:
+                callables.append((bindparam, name))
+            else:
+                defaults[name] = bindparam.value
+            per_bind.append((bindparam, key, name))
+
+        if simple and len(self.bind_names) != len(defaults) + len(
+            callables
+        ):
+            # bound parameters sharing a key and name
+            simple = False
+
+        return (
+            simple,
+            defaults,
+            callables,
+            frozenset(required),
+            frozenset(defaults).union(name for b, name in callables),
+            per_bind,
+        )
+
+    @util.memoized_property
+    def _positional_bind_processors(self):
+        """The bind processor for each name in :attr:`.positiontup`."""
+
+        processors = self._bind_processors
+        return [(key, processors.get(key)) for key in self.positiontup]
+
     def construct_params(self, params=None, _group_number=None, _check=True):
         """return a dictionary of bind parameter keys and values"""
 
-        if params:
+        (
+            simple,
+            defaults,
+            callables,
+            required,
+            names,
+            per_bind,
+        ) = self._bind_param_plan
+
+        if not params:
+            if _check and required:
+                for bindparam, key, name in per_bind:
+                    if bindparam.required:
+                        self._raise_for_required(bindparam, _group_number)
+
+            pd = dict(defaults)
+            for bindparam, name in callables:
+                pd[name] = bindparam.effective_value
+            return pd
+        elif simple and isinstance(params, dict):
+            if _check and required and required.difference(params):
+                for bindparam, key, name in per_bind:
+                    if name in required and name not in params:
+                        self._raise_for_required(bindparam, _group_number)
+
+            pd = dict(defaults)
+            for bindparam, name in callables:
+                if name not in params:
+                    pd[name] = bindparam.effective_value
+
+            if names.issuperset(params):
+                pd.update(params)
+            else:
+                for name in names.intersection(params):
+                    pd[name] = params[name]
+            return pd
+        else:
             pd = {}
-            for bindparam in self.bind_names:
-                name = self.bind_names[bindparam]
-                if bindparam.key in params:
-                    pd[name] = params[bindparam.key]
+            for bindparam, key, name in per_bind:
+                if key in params:
+                    pd[name] = params[key]
                 elif name in params:
                     pd[name] = params[name]
-
                 elif _check and bindparam.required:
-                    if _group_number:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r, "
-                            "in parameter group %d"
-                            % (bindparam.key, _group_number),
-                            code="cd3x",
-                        )
-                    else:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r"
-                            % bindparam.key,
-                            code="cd3x",
-                        )
-
+                    self._raise_for_required(bindparam, _group_number)
                 elif bindparam.callable:
                     pd[name] = bindparam.effective_value
                 else:
                     pd[name] = bindparam.value
             return pd
-        else:
-            pd = {}
-            for bindparam in self.bind_names:
-                if _check and bindparam.required:
-                    if _group_number:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r, "
-                            "in parameter group %d"
-                            % (bindparam.key, _group_number),
-                            code="cd3x",
-                        )
-                    else:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r"
-                            % bindparam.key,
-                            code="cd3x",
-                        )
 
-                if bindparam.callable:
-                    pd[self.bind_names[bindparam]] = bindparam.effective_value
-                else:
-                    pd[self.bind_names[bindparam]] = bindparam.value
-            return pd
+    def _raise_for_required(self, bindparam, _group_number):
+        if _group_number:
+            raise exc.InvalidRequestError(
+                "A value is required for bind parameter %r, "
+                "in parameter group %d" % (bindparam.key, _group_number),
+                code="cd3x",
+            )
+        else:
+            raise exc.InvalidRequestError(
+                "A value is required for bind parameter %r" % bindparam.key,
+                code="cd3x",
+            )
 
     @property
     def params(self):
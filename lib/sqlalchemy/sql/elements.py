@@ -1153,6 +1153,11 @@ class BindParameter(roles.InElementRole, ColumnElement):
           .. versionchanged:: 1.3 the "expanding" bound parameter feature now
              supports empty lists.
 
+          .. versionchanged:: 1.4 the SQL string rendered for each distinct
+             number of values is cached on the compiled statement; see
+             also the ``pad_in_lists`` option of
+             :meth:`.Connection.execution_options`.
+
 
         .. seealso::
 
@@ -3262,6 +3267,8 @@ class BinaryExpression(ColumnElement):
             BinaryExpression,
             self.left._cache_key(**kw),
             self.right._cache_key(**kw),
+            self.operator,
+            self.negate,
         )
 
     def self_group(self, against=None):
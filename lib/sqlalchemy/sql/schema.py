@@ -32,6 +32,7 @@ from __future__ import absolute_import
 
 import collections
 import operator
+import sys
 
 import sqlalchemy
 from . import coercions
@@ -554,6 +555,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         # this argument is only used with _init_existing()
         kwargs.pop("autoload_replace", True)
         _extend_on = kwargs.pop("_extend_on", None)
+        _reflect_info = kwargs.pop("_reflect_info", None)
 
         resolve_fks = kwargs.pop("resolve_fks", True)
         include_columns = kwargs.pop("include_columns", None)
@@ -582,6 +584,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 autoload_with,
                 include_columns,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
                 resolve_fks=resolve_fks,
             )
 
@@ -597,6 +600,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         exclude_columns=(),
         resolve_fks=True,
         _extend_on=None,
+        _reflect_info=None,
     ):
 
         if autoload_with:
@@ -607,6 +611,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
             )
         else:
             bind = _bind_or_error(
@@ -624,6 +629,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
             )
 
     @property
@@ -653,6 +659,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         autoload_replace = kwargs.pop("autoload_replace", True)
         schema = kwargs.pop("schema", None)
         _extend_on = kwargs.pop("_extend_on", None)
+        _reflect_info = kwargs.pop("_reflect_info", None)
 
         if schema and schema != self.schema:
             raise exc.ArgumentError(
@@ -696,6 +703,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
             )
 
         self._extra_kwargs(**kwargs)
@@ -4080,6 +4088,7 @@ class MetaData(SchemaItem):
         extend_existing=False,
         autoload_replace=True,
         resolve_fks=True,
+        max_workers=None,
         **dialect_kwargs
     ):
         r"""Load all available table definitions from the database.
@@ -4146,6 +4155,21 @@ class MetaData(SchemaItem):
 
             :paramref:`.Table.resolve_fks`
 
+        :param max_workers: if greater than one, tables are reflected
+         concurrently using up to this many threads, each of which uses its
+         own connection checked out from the :class:`.Engine` given as
+         :paramref:`.MetaData.reflect.bind`; the connection pool should be
+         sized accordingly.   The reflected :class:`.Table` objects are
+         added to this :class:`.MetaData` in the order in which they were
+         requested, regardless of the order in which the threads complete,
+         and foreign keys to tables that were not part of the reflected set
+         are resolved afterwards.  Tables already
+         present in this :class:`.MetaData` are reflected serially.  Not
+         supported when :paramref:`.MetaData.reflect.bind` is a
+         :class:`.Connection`.
+
+         .. versionadded:: 1.4
+
         :param \**dialect_kwargs: Additional keyword arguments not mentioned
          above are dialect specific, and passed in the form
          ``<dialectname>_<argname>``.  See the documentation regarding an
@@ -4161,6 +4185,16 @@ class MetaData(SchemaItem):
         if bind is None:
             bind = _bind_or_error(self)
 
+        if max_workers is not None and max_workers > 1:
+            if bind.engine is not bind:
+                raise exc.ArgumentError(
+                    "The max_workers parameter of MetaData.reflect() "
+                    "requires an Engine, as each worker thread makes use "
+                    "of its own connection."
+                )
+        else:
+            max_workers = None
+
         with bind.connect() as conn:
 
             reflect_opts = {
@@ -4222,12 +4256,114 @@ class MetaData(SchemaItem):
                     if extend_existing or name not in current
                 ]
 
+            if load:
+                # retrieve information for all tables to be loaded up
+                # front, using as few queries as the dialect allows
+                reflect_opts["_reflect_info"] = inspection.inspect(
+                    conn
+                )._get_reflection_info(
+                    schema=schema, filter_names=load, **dialect_kwargs
+                )
+
+            if max_workers is not None:
+                load = self._reflect_concurrently(
+                    bind, conn, schema, load, max_workers, reflect_opts
+                )
+
             for name in load:
                 try:
                     Table(name, self, **reflect_opts)
                 except exc.UnreflectableTableError as uerr:
                     util.warn("Skipping table %s: %s" % (name, uerr))
 
+    def _reflect_concurrently(
+        self, engine, conn, schema, load, max_workers, reflect_opts
+    ):
+        """Reflect those tables in ``load`` not already present using
+        worker threads; return the names of the remaining tables.
+
+        """
+        current = set(self.tables)
+        remaining = [
+            name for name in load if _get_table_key(name, schema) in current
+        ]
+        load = [
+            name
+            for name in load
+            if _get_table_key(name, schema) not in current
+        ]
+        if not load:
+            return remaining
+
+        # each table is reflected into a MetaData of its own without
+        # following foreign keys, so that the threads don't share any
+        # state; the tables are then copied into this MetaData below
+        worker_opts = dict(reflect_opts, resolve_fks=False)
+        worker_opts.pop("_extend_on")
+        names = iter(load)
+        mutex = util.threading.Lock()
+        results = {}
+        errors = []
+
+        def reflect_tables():
+            try:
+                with engine.connect() as worker_conn:
+                    opts = dict(worker_opts, autoload_with=worker_conn)
+                    while True:
+                        with mutex:
+                            name = next(names, None)
+                        if name is None:
+                            break
+                        try:
+                            results[name] = Table(name, MetaData(), **opts)
+                        except Exception:
+                            results[name] = sys.exc_info()
+            except Exception:
+                errors.append(sys.exc_info())
+
+        threads = [
+            util.threading.Thread(target=reflect_tables)
+            for i in range(min(max_workers, len(load)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            util.reraise(*errors[0])
+
+        tables = []
+        for name in load:
+            result = results[name]
+            if not isinstance(result, Table):
+                if isinstance(result[1], exc.UnreflectableTableError):
+                    util.warn("Skipping table %s: %s" % (name, result[1]))
+                    continue
+                util.reraise(*result)
+            tables.append(result.tometadata(self))
+
+        if reflect_opts["resolve_fks"]:
+            resolve_opts = dict(reflect_opts, autoload_with=conn)
+            resolve_opts.pop("schema", None)
+            for table in tables:
+                for fk in table.foreign_keys:
+                    referred_schema, referred_table, _ = fk._column_tokens
+                    if (
+                        _get_table_key(referred_table, referred_schema)
+                        not in self.tables
+                    ):
+                        Table(
+                            referred_table,
+                            self,
+                            schema=referred_schema
+                            if referred_schema is not None
+                            else BLANK_SCHEMA,
+                            **resolve_opts
+                        )
+
+        return remaining
+
     @util.deprecated(
         "0.7",
         "the :meth:`.MetaData.append_ddl_listener` method is deprecated and "
@@ -230,13 +230,12 @@ def iterate(obj, opts):
     if not children:
         return [obj]
 
-    traversal = deque()
-    stack = deque([obj])
+    traversal = deque([obj])
+    stack = deque(children)
     while stack:
         t = stack.popleft()
         traversal.append(t)
-        for c in t.get_children(**opts):
-            stack.append(c)
+        stack.extend(t.get_children(**opts))
     return iter(traversal)
 
 
@@ -251,13 +250,12 @@ def iterate_depthfirst(obj, opts):
     if not children:
         return [obj]
 
-    stack = deque([obj])
-    traversal = deque()
+    stack = deque(children)
+    traversal = deque([obj])
     while stack:
         t = stack.pop()
         traversal.appendleft(t)
-        for c in t.get_children(**opts):
-            stack.append(c)
+        stack.extend(t.get_children(**opts))
     return iter(traversal)
 
 
@@ -289,25 +287,72 @@ def traverse_depthfirst(obj, opts, visitors):
     return traverse_using(iterate_depthfirst(obj, opts), obj, visitors)
 
 
+def _iterate_unvisited(obj, opts, stop):
+    """return the given element and those below it which have yet to be
+    cloned, ordered such that each element follows all of its children.
+
+    Used by :func:`.cloned_traverse` and :func:`.replacement_traverse` to
+    clone deeply nested structures from an explicit stack, once the
+    recursion through ``_copy_internals()`` has reached
+    ``_max_clone_depth`` levels.  The ``stop`` callable returns True for
+    elements below the given element which are not to be descended into.
+
+    """
+    traversal = [obj]
+    seen = {id(obj)}
+    stack = list(obj.get_children(**opts))
+    while stack:
+        t = stack.pop()
+        if id(t) in seen or stop(t):
+            continue
+        seen.add(id(t))
+        traversal.append(t)
+        stack.extend(t.get_children(**opts))
+    traversal.reverse()
+    return traversal
+
+
+_max_clone_depth = 100
+
+
 def cloned_traverse(obj, opts, visitors):
     """clone the given expression structure, allowing
     modifications by visitors."""
 
     cloned = {}
     stop_on = set(opts.get("stop_on", []))
+    depth = [0]
+
+    def stop(elem):
+        return elem in stop_on or id(elem) in cloned
 
     def clone(elem):
         if elem in stop_on:
             return elem
-        else:
-            if id(elem) not in cloned:
-                cloned[id(elem)] = newelem = elem._clone()
-                newelem._copy_internals(clone=clone)
-                meth = visitors.get(newelem.__visit_name__, None)
-                if meth:
-                    meth(newelem)
+        elif id(elem) in cloned:
             return cloned[id(elem)]
 
+        depth[0] += 1
+        if depth[0] > _max_clone_depth:
+            # clone the children of deeply nested elements first, so
+            # that _copy_internals() below doesn't recurse any further
+            for sub in _iterate_unvisited(
+                elem, {"column_collections": False}, stop
+            ):
+                if id(sub) not in cloned:
+                    copy(sub)
+        else:
+            copy(elem)
+        depth[0] -= 1
+        return cloned[id(elem)]
+
+    def copy(elem):
+        cloned[id(elem)] = newelem = elem._clone()
+        newelem._copy_internals(clone=clone)
+        meth = visitors.get(newelem.__visit_name__, None)
+        if meth:
+            meth(newelem)
+
     if obj is not None:
         obj = clone(obj)
     return obj
@@ -318,7 +363,21 @@ def replacement_traverse(obj, opts, replace):
     replacement by a given replacement function."""
 
     cloned = {}
+    replaced = {}
     stop_on = {id(x) for x in opts.get("stop_on", [])}
+    depth = [0]
+
+    def stop(elem):
+        if (
+            id(elem) in stop_on
+            or "no_replacement_traverse" in elem._annotations
+            or elem in cloned
+        ):
+            return True
+        # record the result so that clone() doesn't call replace()
+        # a second time for the same element
+        replaced[elem] = newelem = replace(elem)
+        return newelem is not None
 
     def clone(elem, **kw):
         if (
@@ -327,15 +386,30 @@ def replacement_traverse(obj, opts, replace):
         ):
             return elem
         else:
-            newelem = replace(elem)
+            try:
+                newelem = replaced[elem]
+            except KeyError:
+                newelem = replace(elem)
             if newelem is not None:
                 stop_on.add(id(newelem))
                 return newelem
-            else:
-                if elem not in cloned:
-                    cloned[elem] = newelem = elem._clone()
-                    newelem._copy_internals(clone=clone, **kw)
-                return cloned[elem]
+            elif elem not in cloned:
+                depth[0] += 1
+                if depth[0] > _max_clone_depth:
+                    # clone the children of deeply nested elements first,
+                    # so that _copy_internals() below doesn't recurse any
+                    # further
+                    for sub in _iterate_unvisited(elem, kw, stop):
+                        if sub not in cloned:
+                            copy(sub, kw)
+                else:
+                    copy(elem, kw)
+                depth[0] -= 1
+            return cloned[elem]
+
+    def copy(elem, kw):
+        cloned[elem] = newelem = elem._clone()
+        newelem._copy_internals(clone=clone, **kw)
 
     if obj is not None:
         obj = clone(obj, **opts)
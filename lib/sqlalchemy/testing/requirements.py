@@ -275,6 +275,25 @@ class SuiteRequirements(Requirements):
             "%(database)s %(does_support)s 'returning'",
         )
 
+    @property
+    def full_returning(self):
+        """target platform supports RETURNING for UPDATE and DELETE
+        statements which affect multiple rows."""
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.full_returning,
+            "%(database)s %(does_support)s 'RETURNING of multiple rows'",
+        )
+
+    @property
+    def recursive_ctes(self):
+        """target platform supports WITH RECURSIVE."""
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.supports_recursive_ctes,
+            "%(database)s %(does_support)s 'recursive CTEs'",
+        )
+
     @property
     def tuple_in(self):
         """Target platform supports the syntax
@@ -465,6 +484,11 @@ class SuiteRequirements(Requirements):
     def index_reflection(self):
         return exclusions.open()
 
+    @property
+    def schema_fingerprint(self):
+        """target dialect implements Inspector.get_schema_fingerprint()"""
+        return exclusions.closed()
+
     @property
     def indexes_with_expressions(self):
         """target database supports CREATE INDEX against SQL expressions."""
@@ -906,6 +930,13 @@ class SuiteRequirements(Requirements):
             lambda: sys.version_info < (3,), "Python version 3.xx is required."
         )
 
+    @property
+    def python37(self):
+        return exclusions.skip_if(
+            lambda: sys.version_info < (3, 7),
+            "Python version 3.7 or greater is required.",
+        )
+
     @property
     def cpython(self):
         return exclusions.only_if(
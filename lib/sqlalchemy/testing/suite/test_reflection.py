@@ -9,6 +9,7 @@ from .. import eq_
 from .. import expect_warnings
 from .. import fixtures
 from .. import is_
+from .. import ne_
 from ..schema import Column
 from ..schema import Table
 from ... import event
@@ -775,6 +776,95 @@ class ComponentReflectionTest(fixtures.TablesTest):
     def test_get_indexes_with_schema(self):
         self._test_get_indexes(schema=testing.config.test_schema)
 
+    def _test_get_multi(self, schema=None):
+        insp = inspect(testing.db)
+        table_names = ["users", "email_addresses", "dingalings"]
+
+        multi_cols = insp.get_multi_columns(
+            schema=schema, filter_names=table_names
+        )
+        multi_pks = insp.get_multi_pk_constraint(
+            schema=schema, filter_names=table_names
+        )
+        multi_fks = insp.get_multi_foreign_keys(
+            schema=schema, filter_names=table_names
+        )
+        eq_(set(multi_cols), set(table_names))
+
+        for table_name in table_names:
+            cols = insp.get_columns(table_name, schema=schema)
+            eq_(
+                [
+                    (c["name"], c["nullable"], c["type"].__class__)
+                    for c in multi_cols[table_name]
+                ],
+                [
+                    (c["name"], c["nullable"], c["type"].__class__)
+                    for c in cols
+                ],
+            )
+            eq_(
+                multi_pks[table_name]["constrained_columns"],
+                insp.get_pk_constraint(table_name, schema=schema)[
+                    "constrained_columns"
+                ],
+            )
+            eq_(
+                sorted(
+                    multi_fks[table_name],
+                    key=operator.itemgetter("constrained_columns"),
+                ),
+                sorted(
+                    insp.get_foreign_keys(table_name, schema=schema),
+                    key=operator.itemgetter("constrained_columns"),
+                ),
+            )
+
+        if testing.requires.index_reflection.enabled:
+            multi_indexes = insp.get_multi_indexes(
+                schema=schema, filter_names=table_names
+            )
+            for table_name in table_names:
+                eq_(
+                    sorted(
+                        multi_indexes.get(table_name, []),
+                        key=operator.itemgetter("name"),
+                    ),
+                    sorted(
+                        insp.get_indexes(table_name, schema=schema),
+                        key=operator.itemgetter("name"),
+                    ),
+                )
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    def test_get_multi(self):
+        self._test_get_multi()
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    @testing.requires.schemas
+    def test_get_multi_with_schema(self):
+        self._test_get_multi(schema=testing.config.test_schema)
+
+    @testing.requires.schema_fingerprint
+    @testing.provide_metadata
+    def test_get_schema_fingerprint(self):
+        insp = inspect(testing.db)
+        fingerprint = insp.get_schema_fingerprint()
+        eq_(insp.get_schema_fingerprint(), fingerprint)
+
+        Table(
+            "fingerprint_test",
+            self.metadata,
+            Column("id", Integer, primary_key=True),
+        )
+        self.metadata.create_all()
+        insp = inspect(testing.db)
+        ne_(insp.get_schema_fingerprint(), fingerprint)
+
     @testing.provide_metadata
     def _test_get_noncol_index(self, tname, ixname):
         meta = self.metadata
@@ -458,6 +458,46 @@ class ExpandingBoundInTest(fixtures.TablesTest):
 
         self._assert_result(stmt, [(2,), (3,), (4,)], params={"q": [2, 3, 4]})
 
+    def test_bound_in_scalar_padded(self):
+        table = self.tables.some_table
+
+        stmt = (
+            select([table.c.id])
+            .where(table.c.x.in_(bindparam("q", expanding=True)))
+            .order_by(table.c.id)
+        )
+
+        with config.db.connect() as conn:
+            conn = conn.execution_options(pad_in_lists=True)
+            for values in ([2], [2, 3, 4], [1, 2, 3, 4, 4]):
+                eq_(
+                    conn.execute(stmt, {"q": values}).fetchall(),
+                    [(x,) for x in sorted(set(values))],
+                )
+
+    @testing.requires.tuple_in
+    def test_bound_in_two_tuple_padded(self):
+        table = self.tables.some_table
+
+        stmt = (
+            select([table.c.id])
+            .where(
+                tuple_(table.c.x, table.c.y).in_(
+                    bindparam("q", expanding=True)
+                )
+            )
+            .order_by(table.c.id)
+        )
+
+        with config.db.connect() as conn:
+            conn = conn.execution_options(pad_in_lists=True)
+            eq_(
+                conn.execute(
+                    stmt, {"q": [(2, 3), (3, 4), (4, 5)]}
+                ).fetchall(),
+                [(2,), (3,), (4,)],
+            )
+
     @testing.requires.tuple_in
     def test_bound_in_two_tuple(self):
         table = self.tables.some_table
@@ -901,21 +901,32 @@ class group_expirable_memoized_property(object):
 
     def __init__(self, attributes=()):
         self.attributes = []
+        self._attribute_set = set()
         if attributes:
             self.attributes.extend(attributes)
+            self._attribute_set.update(attributes)
 
     def expire_instance(self, instance):
         """Expire all memoized properties for *instance*."""
         stash = instance.__dict__
+
+        # objects are frequently expired when nothing has been memoized,
+        # such as a newly generated copy of a statement; check for that
+        # with a single set operation
+        if self._attribute_set.isdisjoint(stash):
+            return
+
         for attribute in self.attributes:
             stash.pop(attribute, None)
 
     def __call__(self, fn):
         self.attributes.append(fn.__name__)
+        self._attribute_set.add(fn.__name__)
         return memoized_property(fn)
 
     def method(self, fn):
         self.attributes.append(fn.__name__)
+        self._attribute_set.add(fn.__name__)
         return memoized_instancemethod(fn)
 
 
@@ -988,7 +999,10 @@ class dependencies(object):
 
     Rationale is so that the impact of a dependency cycle can be
     associated directly with the few functions that cause the cycle,
-    and not pollute the module-level namespace.
+    and not pollute the module-level namespace.   The named modules are
+    imported when the function is first called, so that a module needed
+    only by a particular feature isn't imported until that feature is
+    used.
 
     """
 
@@ -1029,11 +1043,13 @@ class dependencies(object):
 
     @classmethod
     def resolve_all(cls, path):
+        dependencies._resolved_paths.add(path)
         for m in list(dependencies._unresolved):
             if m._full_path.startswith(path):
                 m._resolve()
 
     _unresolved = set()
+    _resolved_paths = set()
     _by_key = {}
 
     class _importlater(object):
@@ -1052,7 +1068,15 @@ class dependencies(object):
         def __init__(self, path, addtl):
             self._il_path = path
             self._il_addtl = addtl
-            dependencies._unresolved.add(self)
+
+            # a module which is itself imported on first use may declare
+            # dependencies after resolve_all() has been called for its
+            # package
+            if not any(
+                self._full_path.startswith(resolved)
+                for resolved in dependencies._resolved_paths
+            ):
+                dependencies._unresolved.add(self)
 
         @property
         def _full_path(self):
@@ -1067,13 +1091,18 @@ class dependencies(object):
                     % (self._il_path, self._il_addtl)
                 )
 
-            return getattr(self._initial_import, self._il_addtl)
+            # the module is imported on first use, so that a dependency
+            # which isn't otherwise part of what's been imported does not
+            # add to the time taken to import the package
+            return getattr(
+                compat.import_(
+                    self._il_path, globals(), locals(), [self._il_addtl]
+                ),
+                self._il_addtl,
+            )
 
         def _resolve(self):
             dependencies._unresolved.discard(self)
-            self._initial_import = compat.import_(
-                self._il_path, globals(), locals(), [self._il_addtl]
-            )
 
         def __getattr__(self, key):
             if key == "module":
@@ -96,3 +96,28 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
             s.compile(dialect=self.dialect)
 
         go()
+
+    def test_select_generative(self):
+        def build():
+            return (
+                select([t1])
+                .where(t1.c.c1 > 5)
+                .where(t1.c.c2 == "x")
+                .where(t1.c.c1 < 10)
+                .order_by(t1.c.c1)
+                .order_by(t1.c.c2)
+                .group_by(t1.c.c2)
+                .having(t1.c.c1 > 1)
+                .distinct()
+                .limit(10)
+                .offset(5)
+            )
+
+        # warm up
+        build()
+
+        @profiling.function_call_count()
+        def go():
+            build()
+
+        go()
@@ -1,4 +1,10 @@
+import os
+import subprocess
+import sys
+
+import sqlalchemy
 from sqlalchemy import Enum
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import profiling
 from sqlalchemy.util import classproperty
@@ -35,3 +41,54 @@ class EnumTest(fixtures.TestBase):
     @profiling.function_call_count()
     def test_create_enum_from_pep_435_w_expensive_members(self):
         Enum(self.SomeEnum)
+
+
+class ImportTest(fixtures.TestBase):
+    __requires__ = ("cpython", "python37")
+
+    def _imported_modules(self, statement):
+        # run in a subprocess with -X importtime, which reports each module
+        # imported along with the time taken to import it
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.dirname(
+            os.path.dirname(sqlalchemy.__file__)
+        )
+        proc = subprocess.Popen(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = proc.communicate()
+        eq_(proc.returncode, 0, stderr)
+        return set(
+            line.rsplit("|", 1)[-1].strip()
+            for line in stderr.decode("utf-8").splitlines()
+            if line.startswith("import time:")
+        )
+
+    def test_import_sqlalchemy(self):
+        modules = self._imported_modules("import sqlalchemy")
+        assert "sqlalchemy.sql.schema" in modules
+
+        for name in (
+            "sqlalchemy.orm",
+            "sqlalchemy.ext",
+            "sqlalchemy.engine.default",
+            "sqlalchemy.engine.reflection",
+            "sqlalchemy.engine.threadlocal",
+            "sqlalchemy.dialects.sqlite",
+            "sqlalchemy.dialects.postgresql",
+        ):
+            assert name not in modules, "%s was imported" % name
+
+    def test_import_orm(self):
+        modules = self._imported_modules("import sqlalchemy.orm")
+        assert "sqlalchemy.orm.strategies" in modules
+
+        for name in (
+            "sqlalchemy.ext.baked",
+            "sqlalchemy.orm.evaluator",
+            "sqlalchemy.engine.reflection",
+        ):
+            assert name not in modules, "%s was imported" % name
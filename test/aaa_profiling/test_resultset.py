@@ -90,6 +90,54 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
     def test_unicode(self):
         [tuple(row) for row in t2.select().execute().fetchall()]
 
+    @profiling.function_call_count()
+    def test_string_tuple_rows(self):
+        [
+            tuple(row)
+            for row in t.select()
+            .execution_options(tuple_rows=True)
+            .execute()
+            .fetchall()
+        ]
+
+    @profiling.function_call_count()
+    def test_unicode_tuple_rows(self):
+        [
+            tuple(row)
+            for row in t2.select()
+            .execution_options(tuple_rows=True)
+            .execute()
+            .fetchall()
+        ]
+
+    @profiling.function_call_count()
+    def test_string_tuple_rows_attribute_access(self):
+        for row in (
+            t.select().execution_options(tuple_rows=True).execute().fetchall()
+        ):
+            row.field0, row.field5, row.field9
+
+    @profiling.function_call_count()
+    def test_string_attribute_access(self):
+        for row in t.select().execute().fetchall():
+            row.field0, row.field5, row.field9
+
+    @testing.requires.cpython
+    def test_tuple_rows_memory(self):
+        rows = t.select().execute().fetchall()
+        tuple_rows = (
+            t.select().execution_options(tuple_rows=True).execute().fetchall()
+        )
+        eq_(rows, tuple_rows)
+
+        # a RowProxy refers to the raw DBAPI row in addition to itself;
+        # the tuple row is a single object
+        proxy_size = sum(
+            sys.getsizeof(row) + sys.getsizeof(row._row) for row in rows
+        )
+        tuple_size = sum(sys.getsizeof(row) for row in tuple_rows)
+        assert tuple_size < proxy_size, (tuple_size, proxy_size)
+
     @profiling.function_call_count(variance=0.10)
     def test_raw_string(self):
         stmt = "SELECT %s FROM table1" % (
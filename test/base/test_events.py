@@ -65,6 +65,50 @@ class EventsTest(fixtures.TestBase):
         t = self.Target()
         assert t.dispatch.event_one
 
+    def test_empty_listener_follows_clslevel(self):
+        m1 = Mock()
+
+        t1 = self.Target()
+        empty = t1.dispatch.event_one
+        assert not empty
+        eq_(len(empty), 0)
+        assert isinstance(empty, event.attr._NoListeners)
+        empty(5, 6)
+
+        event.listen(self.Target, "event_one", m1)
+        is_(t1.dispatch.event_one, empty)
+        assert empty
+        eq_(len(empty), 1)
+        assert not isinstance(empty, event.attr._NoListeners)
+        empty(5, 6)
+
+        event.remove(self.Target, "event_one", m1)
+        assert not empty
+        assert isinstance(empty, event.attr._NoListeners)
+        empty(7, 8)
+
+        eq_(m1.mock_calls, [call(5, 6)])
+
+    def test_empty_listener_follows_clslevel_subclass(self):
+        class SubTarget(self.Target):
+            pass
+
+        m1 = Mock()
+
+        t1 = SubTarget()
+        empty = t1.dispatch.event_one
+        assert not empty
+
+        event.listen(self.Target, "event_one", m1)
+        assert empty
+        empty(5, 6)
+
+        self.Target.dispatch._clear()
+        assert not empty
+        empty(7, 8)
+
+        eq_(m1.mock_calls, [call(5, 6)])
+
     def test_register_class_instance(self):
         def listen_one(x, y):
             pass
@@ -307,6 +307,39 @@ class MemoizedAttrTest(fixtures.TestBase):
         eq_(f1.bar(), 20)
         eq_(val[0], 21)
 
+    def test_group_expirable_memoized_property(self):
+        val = [20]
+        memoized = util.group_expirable_memoized_property(["bat"])
+
+        class Foo(object):
+            @memoized
+            def bar(self):
+                v = val[0]
+                val[0] += 1
+                return v
+
+            @memoized.method
+            def bah(self):
+                return "bah"
+
+        f1 = Foo()
+        f1.some_attr = "x"
+
+        # nothing memoized yet
+        memoized.expire_instance(f1)
+        eq_(f1.__dict__, {"some_attr": "x"})
+
+        eq_(f1.bar, 20)
+        eq_(f1.bah(), "bah")
+        f1.bat = "bat"
+        memoized.expire_instance(f1)
+        eq_(f1.__dict__, {"some_attr": "x"})
+        eq_(f1.bar, 21)
+
+        f1.bat = "bat"
+        memoized.expire_instance(f1)
+        eq_(f1.__dict__, {"some_attr": "x"})
+
     def test_memoized_slots(self):
         canary = mock.Mock()
 
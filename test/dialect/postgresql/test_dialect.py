@@ -3,18 +3,22 @@
 import datetime
 import logging
 import logging.handlers
+import re
 
 from sqlalchemy import BigInteger
 from sqlalchemy import bindparam
 from sqlalchemy import cast
 from sqlalchemy import Column
+from sqlalchemy import create_engine
 from sqlalchemy import DateTime
 from sqlalchemy import dialects
 from sqlalchemy import exc
 from sqlalchemy import extract
 from sqlalchemy import func
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import literal
+from sqlalchemy import literal_column
 from sqlalchemy import MetaData
 from sqlalchemy import Numeric
 from sqlalchemy import schema
@@ -223,6 +227,286 @@ class BatchInsertsTest(fixtures.TablesTest):
             )
 
 
+class PreparedStatementTest(fixtures.TestBase):
+    def setup(self):
+        self.cursor = Mock(
+            description=None, rowcount=1, fetchmany=Mock(return_value=[])
+        )
+        self.dbapi = Mock(
+            paramstyle="pyformat",
+            connect=Mock(
+                return_value=Mock(cursor=Mock(return_value=self.cursor))
+            ),
+        )
+        self.engine = create_engine(
+            "postgresql+psycopg2://",
+            module=self.dbapi,
+            prepared_statement_cache_size=2,
+            _initialize=False,
+        )
+        self.table = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+        )
+
+    def _assert_executed(self, *calls):
+        eq_(
+            [
+                (re.sub(r"[\n\t]", "", c[1][0]), c[1][1])
+                for c in self.cursor.mock_calls
+                if c[0] == "execute"
+            ],
+            list(calls),
+        )
+        self.cursor.reset_mock()
+
+    def test_prepare_then_execute(self):
+        t = self.table
+        stmt = select([t.c.x]).where(t.c.id == bindparam("q"))
+        with self.engine.connect() as conn:
+            conn.execute(stmt, q=5)
+            conn.execute(stmt, q=6)
+
+        self._assert_executed(
+            (
+                "PREPARE sqla_1 AS SELECT t.x FROM t WHERE t.id = $1; "
+                "EXECUTE sqla_1 (%(q)s)",
+                {"q": 5},
+            ),
+            ("EXECUTE sqla_1 (%(q)s)", {"q": 6}),
+        )
+
+    def test_repeated_bind(self):
+        t = self.table
+        stmt = select([t.c.id]).where(
+            (t.c.x == bindparam("q"))
+            | (t.c.id == bindparam("p"))
+            | (t.c.x > bindparam("q"))
+        )
+        with self.engine.connect() as conn:
+            conn.execute(stmt, q="a", p=5)
+
+        self._assert_executed(
+            (
+                "PREPARE sqla_1 AS SELECT t.id FROM t "
+                "WHERE t.x = $1 OR t.id = $2 OR t.x > $1; "
+                "EXECUTE sqla_1 (%(q)s, %(p)s)",
+                {"q": "a", "p": 5},
+            )
+        )
+
+    def test_no_binds_percent_sign(self):
+        stmt = select([literal_column("'x'").label("p%ct")])
+        with self.engine.connect() as conn:
+            conn.execute(stmt)
+            conn.execute(stmt)
+
+        self._assert_executed(
+            ("PREPARE sqla_1 AS SELECT 'x' AS \"p%%ct\"; EXECUTE sqla_1", {}),
+            ("EXECUTE sqla_1", {}),
+        )
+
+    def test_least_recently_used_deallocated(self):
+        t = self.table
+        s1, s2, s3 = [select([col]) for col in (t.c.id, t.c.x, t)]
+        with self.engine.connect() as conn:
+            conn.execute(s1)
+            conn.execute(s2)
+            conn.execute(s1)
+            self.cursor.reset_mock()
+
+            conn.execute(s3)
+            conn.execute(s1)
+            conn.execute(s2)
+
+        self._assert_executed(
+            (
+                "DEALLOCATE sqla_2; PREPARE sqla_3 AS "
+                "SELECT t.id, t.x FROM t; EXECUTE sqla_3",
+                {},
+            ),
+            ("EXECUTE sqla_1", {}),
+            (
+                "DEALLOCATE sqla_3; PREPARE sqla_4 AS SELECT t.x FROM t; "
+                "EXECUTE sqla_4",
+                {},
+            ),
+        )
+
+    def test_ddl_discards_prepared(self):
+        t = self.table
+        stmt = select([t.c.id])
+        with self.engine.connect() as conn:
+            conn.execute(stmt)
+            conn.execute(schema.CreateIndex(Index("ix", t.c.x)))
+            conn.execute(stmt)
+
+        self._assert_executed(
+            ("PREPARE sqla_1 AS SELECT t.id FROM t; EXECUTE sqla_1", {}),
+            ("CREATE INDEX ix ON t (x)", {}),
+            (
+                "DEALLOCATE sqla_1; PREPARE sqla_2 AS SELECT t.id FROM t; "
+                "EXECUTE sqla_2",
+                {},
+            ),
+        )
+
+    def test_invalidate_discards_prepared(self):
+        t = self.table
+        stmt = select([t.c.id])
+        with self.engine.connect() as conn:
+            conn.execute(stmt)
+            conn.invalidate()
+            conn.execute(stmt)
+
+        self._assert_executed(
+            ("PREPARE sqla_1 AS SELECT t.id FROM t; EXECUTE sqla_1", {}),
+            ("PREPARE sqla_1 AS SELECT t.id FROM t; EXECUTE sqla_1", {}),
+        )
+
+    def test_failed_prepare_deallocates_all(self):
+        t = self.table
+        s1, s2, s3 = [select([col]) for col in (t.c.id, t.c.x, t)]
+        with self.engine.connect() as conn:
+            conn.execute(s1)
+            conn.execute(s2)
+            self.cursor.reset_mock()
+
+            self.cursor.execute.side_effect = Exception("failed")
+            assert_raises(Exception, conn.execute, s3)
+            self.cursor.execute.side_effect = None
+            conn.execute(s3)
+            conn.execute(s3)
+            conn.execute(s1)
+
+        self._assert_executed(
+            (
+                "DEALLOCATE sqla_1; PREPARE sqla_3 AS "
+                "SELECT t.id, t.x FROM t; EXECUTE sqla_3",
+                {},
+            ),
+            (
+                "DEALLOCATE ALL; PREPARE sqla_4 AS "
+                "SELECT t.id, t.x FROM t; EXECUTE sqla_4",
+                {},
+            ),
+            ("EXECUTE sqla_4", {}),
+            ("PREPARE sqla_5 AS SELECT t.id FROM t; EXECUTE sqla_5", {}),
+        )
+
+    def test_failed_execute_of_prepared_kept(self):
+        t = self.table
+        stmt = select([t.c.id])
+        with self.engine.connect() as conn:
+            conn.execute(stmt)
+            self.cursor.execute.side_effect = Exception("failed")
+            assert_raises(Exception, conn.execute, stmt)
+            self.cursor.execute.side_effect = None
+            conn.execute(stmt)
+
+        self._assert_executed(
+            ("PREPARE sqla_1 AS SELECT t.id FROM t; EXECUTE sqla_1", {}),
+            ("EXECUTE sqla_1", {}),
+            ("EXECUTE sqla_1", {}),
+        )
+
+    def test_not_prepared(self):
+        t = self.table
+        with self.engine.connect() as conn:
+            conn.execute(text("select 1"))
+            conn.execute(t.insert(), [{"id": 1}, {"id": 2}])
+            conn.execute(select([t.c.id]).execution_options(prepare=False))
+            conn.execution_options(stream_results=True).execute(
+                select([t.c.id])
+            )
+
+        eq_(
+            [
+                re.sub(r"[\n\t]", "", c[1][0])
+                for c in self.cursor.mock_calls
+                if c[0] == "execute"
+            ],
+            ["select 1", "SELECT t.id FROM t", "SELECT t.id FROM t"],
+        )
+        eq_(
+            [c[1][0] for c in self.cursor.mock_calls if c[0] == "executemany"],
+            ["INSERT INTO t (id) VALUES (%(id)s)"],
+        )
+
+
+class PreparedStatementBackendTest(fixtures.TablesTest):
+    __only_on__ = "postgresql+psycopg2"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+        )
+
+    @classmethod
+    def insert_data(cls):
+        testing.db.execute(
+            cls.tables.data.insert(),
+            [
+                {"id": 1, "x": "x1"},
+                {"id": 2, "x": "x%2"},
+                {"id": 3, "x": None},
+            ],
+        )
+
+    def setup(self):
+        self.engine = engines.testing_engine(
+            options={"prepared_statement_cache_size": 2}
+        )
+
+    def teardown(self):
+        self.engine.dispose()
+
+    def _prepared_count(self, conn):
+        return conn.scalar(
+            text(
+                "select count(*) from pg_prepared_statements "
+                "where statement like '%data%'"
+            )
+        )
+
+    def test_select(self):
+        data = self.tables.data
+        stmt = select([data.c.x]).where(data.c.id == bindparam("q"))
+        with self.engine.connect() as conn:
+            for q, x in [(1, "x1"), (2, "x%2"), (3, None), (1, "x1")]:
+                eq_(conn.execute(stmt, q=q).scalar(), x)
+            eq_(self._prepared_count(conn), 1)
+
+    def test_crud_and_eviction(self):
+        data = self.tables.data
+        with self.engine.connect() as conn:
+            trans = conn.begin()
+            conn.execute(data.insert(), {"id": 4, "x": "x4"})
+            eq_(
+                conn.execute(
+                    data.update().where(data.c.id == 4), {"x": "x5"}
+                ).rowcount,
+                1,
+            )
+            eq_(
+                conn.execute(
+                    select([data.c.x])
+                    .where(data.c.x.like("x%"))
+                    .order_by(data.c.id)
+                ).fetchall(),
+                [("x1",), ("x%2",), ("x5",)],
+            )
+            eq_(self._prepared_count(conn), 2)
+            trans.rollback()
+
+
 class MiscBackendTest(
     fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL
 ):
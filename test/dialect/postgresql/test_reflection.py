@@ -1654,3 +1654,64 @@ class IntervalReflectionTest(fixtures.TestBase):
         assert isinstance(columns["data1"]["type"], INTERVAL)
         eq_(columns["data1"]["type"].fields, None)
         eq_(columns["data1"]["type"].precision, 6)
+
+
+class SchemaFingerprintTest(fixtures.TestBase):
+    __only_on__ = "postgresql >= 9.0"
+    __backend__ = True
+
+    def teardown(self):
+        testing.db.execute("DROP TYPE IF EXISTS fp_enum")
+
+    @testing.provide_metadata
+    def test_fingerprint_changes_after_ddl(self):
+        Table(
+            "fp_test", self.metadata, Column("id", Integer, primary_key=True)
+        )
+        self.metadata.create_all()
+
+        with testing.db.connect() as conn:
+            insp = inspect(conn)
+            fingerprints = [insp.get_schema_fingerprint()]
+            eq_(insp.get_schema_fingerprint(), fingerprints[0])
+
+            for ddl in [
+                "ALTER TABLE fp_test ADD COLUMN data VARCHAR(20)",
+                "ALTER TABLE fp_test ALTER COLUMN data TYPE VARCHAR(30)",
+                "ALTER TABLE fp_test ALTER COLUMN data SET DEFAULT 'x'",
+                "ALTER TABLE fp_test ALTER COLUMN data SET NOT NULL",
+                "ALTER TABLE fp_test ADD CONSTRAINT fp_uq UNIQUE (data)",
+                "ALTER TABLE fp_test ADD CONSTRAINT fp_ck CHECK (id > 0)",
+                "CREATE INDEX fp_ix ON fp_test (id, data)",
+                "COMMENT ON TABLE fp_test IS 'a table'",
+                "COMMENT ON COLUMN fp_test.data IS 'a column'",
+                "CREATE TYPE fp_enum AS ENUM ('a', 'b')",
+                "ALTER TABLE fp_test ADD COLUMN e fp_enum",
+                "ALTER TABLE fp_test DROP COLUMN e",
+                "DROP TYPE fp_enum",
+                "ALTER TABLE fp_test RENAME COLUMN data TO data2",
+                "ALTER TABLE fp_test DROP COLUMN data2",
+            ]:
+                conn.execute(ddl)
+                fingerprint = insp.get_schema_fingerprint()
+                assert fingerprint not in fingerprints, ddl
+                fingerprints.append(fingerprint)
+
+            eq_(insp.get_schema_fingerprint(), fingerprints[-1])
+
+    @testing.provide_metadata
+    def test_fingerprint_per_schema(self):
+        insp = inspect(testing.db)
+        fingerprint = insp.get_schema_fingerprint(
+            schema=testing.config.test_schema
+        )
+
+        Table(
+            "fp_test", self.metadata, Column("id", Integer, primary_key=True)
+        )
+        self.metadata.create_all()
+
+        eq_(
+            insp.get_schema_fingerprint(schema=testing.config.test_schema),
+            fingerprint,
+        )
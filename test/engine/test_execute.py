@@ -863,6 +863,210 @@ class ConvenienceExecuteTest(fixtures.TablesTest):
         self._assert_no_data()
 
 
+class ExecuteBatchTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", VARCHAR(20)),
+        )
+
+    def test_execute_batch(self):
+        users = self.tables.users
+        with testing.db.connect() as conn:
+            r1, r2, r3, r4, r5 = conn.execute_batch(
+                [
+                    (users.insert(), {"user_id": 1, "user_name": "u1"}),
+                    (
+                        users.insert(),
+                        [
+                            {"user_id": 2, "user_name": "u2"},
+                            {"user_id": 3, "user_name": "u3"},
+                        ],
+                    ),
+                    (
+                        users.update().where(users.c.user_id > 1),
+                        {"user_name": "ux"},
+                    ),
+                    select([users]).order_by(users.c.user_id),
+                    select([func.count(users.c.user_id)]),
+                ]
+            )
+            eq_(r1.inserted_primary_key, [1])
+            eq_(r3.rowcount, 2)
+            eq_(r4.fetchall(), [(1, "u1"), (2, "ux"), (3, "ux")])
+            eq_(r5.scalar(), 3)
+
+    def test_execute_batch_empty(self):
+        with testing.db.connect() as conn:
+            eq_(conn.execute_batch([]), [])
+
+
+class ExecuteBatchMockTest(fixtures.TestBase):
+    """test execute_batch() with a DBAPI that runs the statements in one
+    round trip."""
+
+    def setup(self):
+        self.result_sets = result_sets = []
+
+        class Cursor(object):
+            description = None
+            rowcount = 1
+            lastrowid = None
+
+            def __init__(self):
+                self.execute = Mock(side_effect=self._execute)
+                self.executemany = Mock()
+
+            def _execute(self, statement, parameters):
+                self._sets = list(result_sets)
+                self.nextset()
+
+            def nextset(self):
+                if not self._sets:
+                    return None
+                (
+                    self.description,
+                    self.rowcount,
+                    self.lastrowid,
+                    self._rows,
+                ) = self._sets.pop(0)
+                return True
+
+            def fetchall(self):
+                return self._rows
+
+            def close(self):
+                pass
+
+        self.cursors = cursors = []
+
+        def cursor():
+            cursors.append(Cursor())
+            return cursors[-1]
+
+        dbapi = Mock(
+            paramstyle="format",
+            connect=Mock(return_value=Mock(cursor=Mock(side_effect=cursor))),
+        )
+        self.engine = create_engine(
+            "mysql+mysqldb://", module=dbapi, _initialize=False
+        )
+        self.table = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+        )
+
+    def _executed(self):
+        return [
+            c
+            for cursor in self.cursors
+            for c in cursor.execute.mock_calls
+            if c[0] == ""
+        ]
+
+    def test_single_round_trip(self):
+        t = self.table
+        self.result_sets.extend(
+            [
+                (None, 1, 5, ()),
+                (None, 2, 0, ()),
+                ((("id", 3), ("x", 253)), 2, 0, ((5, "a"), (6, "b"))),
+            ]
+        )
+        with self.engine.connect() as conn:
+            r1, r2, r3 = conn.execute_batch(
+                [
+                    (t.insert(), {"x": "a"}),
+                    (
+                        t.update()
+                        .values(x="z")
+                        .where(t.c.id > bindparam("q")),
+                        {"q": 3},
+                    ),
+                    (
+                        select([t]).where(
+                            t.c.x.in_(bindparam("x", expanding=True))
+                        ),
+                        {"x": ["a", "b"]},
+                    ),
+                ]
+            )
+        eq_(
+            self._executed(),
+            [
+                call(
+                    "INSERT INTO t (x) VALUES (%s); "
+                    "UPDATE t SET x=%s WHERE t.id > %s; "
+                    "SELECT t.id, t.x \nFROM t \nWHERE t.x IN (%s, %s)",
+                    ("a", "z", 3, "a", "b"),
+                )
+            ],
+        )
+        eq_(r1.inserted_primary_key, [5])
+        eq_(r2.rowcount, 2)
+        eq_(r3.fetchall(), [(5, "a"), (6, "b")])
+
+    def test_executemany_not_batched(self):
+        t = self.table
+        self.result_sets.append((None, 1, 5, ()))
+        with self.engine.connect() as conn:
+            conn.execute_batch(
+                [
+                    (t.insert(), {"id": 1, "x": "a"}),
+                    (t.insert(), [{"id": 2, "x": "b"}, {"id": 3, "x": "c"}]),
+                    (t.insert(), {"id": 4, "x": "d"}),
+                ]
+            )
+        eq_(
+            self._executed(),
+            [
+                call("INSERT INTO t (id, x) VALUES (%s, %s)", (1, "a")),
+                call("INSERT INTO t (id, x) VALUES (%s, %s)", (4, "d")),
+            ],
+        )
+        eq_(
+            [
+                c
+                for cursor in self.cursors
+                for c in cursor.executemany.mock_calls
+            ],
+            [
+                call(
+                    "INSERT INTO t (id, x) VALUES (%s, %s)",
+                    ((2, "b"), (3, "c")),
+                )
+            ],
+        )
+
+    def test_events_not_batched(self):
+        t = self.table
+        self.result_sets.append((None, 1, 5, ()))
+        canary = Mock()
+        with self.engine.connect() as conn:
+            event.listen(conn, "before_cursor_execute", canary)
+            conn.execute_batch(
+                [
+                    (t.insert(), {"id": 1, "x": "a"}),
+                    (t.insert(), {"id": 2, "x": "b"}),
+                ]
+            )
+        eq_(len(canary.mock_calls), 2)
+        eq_(
+            [c[1] for c in self._executed()],
+            [
+                ("INSERT INTO t (id, x) VALUES (%s, %s)", (1, "a")),
+                ("INSERT INTO t (id, x) VALUES (%s, %s)", (2, "b")),
+            ],
+        )
+
+
 class CompiledCacheTest(fixtures.TestBase):
     __backend__ = True
 
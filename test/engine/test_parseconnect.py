@@ -9,6 +9,7 @@ from sqlalchemy.dialects import registry
 from sqlalchemy.engine.default import DefaultDialect
 import sqlalchemy.engine.url as url
 from sqlalchemy.testing import assert_raises
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
@@ -391,6 +392,24 @@ class CreateEngineTest(fixtures.TestBase):
             module=mock_dbapi,
         )
 
+    def test_prepared_statement_cache_size(self):
+        e = create_engine(
+            "postgresql+psycopg2://",
+            prepared_statement_cache_size=50,
+            module=mock_dbapi,
+            _initialize=False,
+        )
+        eq_(e.dialect.prepared_statement_cache_size, 50)
+
+        assert_raises_message(
+            exc.ArgumentError,
+            r"Dialect 'sqlite\+pysqlite' does not support prepared statements",
+            create_engine,
+            "sqlite://",
+            prepared_statement_cache_size=50,
+            module=mock_sqlite_dbapi,
+        )
+
     def test_urlattr(self):
         """test the url attribute on ``Engine``."""
 
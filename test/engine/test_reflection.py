@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unicodedata
 
 import sqlalchemy as sa
@@ -13,6 +16,7 @@ from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.engine import reflection
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
@@ -24,6 +28,7 @@ from sqlalchemy.testing import eq_regex
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing import not_in_
@@ -1286,6 +1291,104 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
             m9.reflect()
             self.assert_(not m9.tables)
 
+    @testing.provide_metadata
+    def test_reflect_all_uses_multi(self):
+        a = Table(
+            "rt_a", self.metadata, Column("id", sa.Integer, primary_key=True)
+        )
+        Table(
+            "rt_b",
+            self.metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("a_id", sa.Integer, sa.ForeignKey(a.c.id), index=True),
+            test_needs_fk=True,
+        )
+        self.metadata.create_all()
+
+        dialect = testing.db.dialect
+        m = MetaData()
+        with mock.patch.object(
+            dialect, "get_multi_columns", wraps=dialect.get_multi_columns
+        ) as get_multi_columns, mock.patch.object(
+            reflection.Inspector, "get_columns"
+        ) as get_columns, mock.patch.object(
+            reflection.Inspector, "get_pk_constraint"
+        ) as get_pk_constraint, mock.patch.object(
+            reflection.Inspector, "get_foreign_keys"
+        ) as get_foreign_keys, mock.patch.object(
+            reflection.Inspector, "get_indexes"
+        ) as get_indexes:
+            m.reflect(testing.db, only=["rt_a", "rt_b"])
+
+        eq_(get_multi_columns.call_count, 1)
+        eq_(get_columns.mock_calls, [])
+        eq_(get_pk_constraint.mock_calls, [])
+        eq_(get_foreign_keys.mock_calls, [])
+        eq_(get_indexes.mock_calls, [])
+
+        rt_a, rt_b = m.tables["rt_a"], m.tables["rt_b"]
+        eq_(rt_b.c.keys(), ["id", "a_id"])
+        eq_(list(rt_a.primary_key), [rt_a.c.id])
+        eq_(list(rt_b.primary_key), [rt_b.c.id])
+        if testing.requires.foreign_key_constraint_reflection.enabled:
+            assert rt_b.c.a_id.references(rt_a.c.id)
+        if testing.requires.index_reflection.enabled:
+            eq_(
+                [list(idx.columns) for idx in rt_b.indexes], [[rt_b.c.a_id]]
+            )
+
+    @testing.requires.independent_connections
+    @testing.provide_metadata
+    def test_reflect_all_max_workers(self):
+        a = Table(
+            "rt_a", self.metadata, Column("id", sa.Integer, primary_key=True)
+        )
+        names = ["rt_%s" % name for name in ("b", "c", "d", "e", "f")]
+        for name in names:
+            Table(
+                name,
+                self.metadata,
+                Column("id", sa.Integer, primary_key=True),
+                Column("a_id", sa.Integer, sa.ForeignKey(a.c.id)),
+                test_needs_fk=True,
+            )
+        self.metadata.create_all()
+
+        m1 = MetaData()
+        m1.reflect(testing.db, only=names, max_workers=3)
+        eq_(list(m1.tables), names + ["rt_a"])
+        for name in names:
+            eq_(m1.tables[name].c.keys(), ["id", "a_id"])
+            if testing.requires.foreign_key_constraint_reflection.enabled:
+                assert m1.tables[name].c.a_id.references(
+                    m1.tables["rt_a"].c.id
+                )
+
+        m2 = MetaData()
+        rt_b = Table("rt_b", m2, Column("id", sa.Integer, primary_key=True))
+        m2.reflect(
+            testing.db,
+            only=["rt_a", "rt_b", "rt_c"],
+            extend_existing=True,
+            autoload_replace=False,
+            max_workers=3,
+        )
+        eq_(set(m2.tables), set(["rt_a", "rt_b", "rt_c"]))
+        is_(m2.tables["rt_b"], rt_b)
+        eq_(rt_b.c.keys(), ["id", "a_id"])
+
+    def test_reflect_max_workers_connection(self):
+        m = MetaData()
+        with testing.db.connect() as conn:
+            assert_raises_message(
+                sa.exc.ArgumentError,
+                "The max_workers parameter of MetaData.reflect\\(\\) "
+                "requires an Engine",
+                m.reflect,
+                conn,
+                max_workers=2,
+            )
+
     @testing.provide_metadata
     def test_reflect_all_unreflectable_table(self):
         names = ["rt_%s" % name for name in ("a", "b", "c", "d", "e")]
@@ -1481,6 +1584,117 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
             _drop_views(metadata.bind)
 
 
+class ConcurrentReflectTest(fixtures.TestBase):
+    """Test MetaData.reflect() with max_workers against a file-based
+    SQLite database, which unlike the default in-memory database allows
+    the worker threads each to use a connection of their own."""
+
+    __only_on__ = "sqlite"
+
+    def setup(self):
+        self.path = tempfile.mkdtemp()
+        self.engine = engines.testing_engine(
+            "sqlite:///%s" % os.path.join(self.path, "reflect.db"),
+            # connections made by the worker threads are released by the
+            # test teardown on the main thread
+            options={"connect_args": {"check_same_thread": False}},
+        )
+
+        m = MetaData()
+        a = Table("rt_a", m, Column("id", sa.Integer, primary_key=True))
+        self.names = ["rt_%s" % name for name in ("b", "c", "d", "e", "f")]
+        for name in self.names:
+            Table(
+                name,
+                m,
+                Column("id", sa.Integer, primary_key=True),
+                Column("a_id", sa.Integer, sa.ForeignKey(a.c.id)),
+            )
+        m.create_all(self.engine)
+
+    def teardown(self):
+        self.engine.dispose()
+        shutil.rmtree(self.path)
+
+    def _patch_reflecttable(
+        self, fail_on=None, exc_cls=sa.exc.InvalidRequestError
+    ):
+        reflecttable = reflection.Inspector.reflecttable
+        threads = {}
+
+        def reflect(inspector, table, *arg, **kw):
+            threads[table.name] = sa.util.threading.current_thread()
+            if table.name == fail_on:
+                raise exc_cls("can't reflect %s" % table.name)
+            return reflecttable(inspector, table, *arg, **kw)
+
+        return (
+            mock.patch.object(
+                reflection.Inspector,
+                "reflecttable",
+                autospec=True,
+                side_effect=reflect,
+            ),
+            threads,
+        )
+
+    def test_reflect(self):
+        patch, threads = self._patch_reflecttable()
+        m = MetaData()
+        with patch:
+            m.reflect(self.engine, only=self.names, max_workers=3)
+
+        # the workers reflect the requested tables; rt_a is reflected
+        # afterwards, on the calling thread, to resolve the foreign keys
+        current = sa.util.threading.current_thread()
+        is_(threads.pop("rt_a"), current)
+        eq_(sorted(threads), self.names)
+        not_in_(current, set(threads.values()))
+        eq_(set(m.tables), set(self.names + ["rt_a"]))
+        for name in self.names:
+            table = m.tables[name]
+            eq_(table.c.keys(), ["id", "a_id"])
+            eq_(list(table.primary_key), [table.c.id])
+            assert table.c.a_id.references(m.tables["rt_a"].c.id)
+
+    def test_reflect_no_resolve_fks(self):
+        m = MetaData()
+        m.reflect(
+            self.engine, only=self.names, max_workers=3, resolve_fks=False
+        )
+        eq_(set(m.tables), set(self.names))
+
+    def test_reflect_existing_table(self):
+        m = MetaData()
+        rt_a = Table("rt_a", m, Column("id", sa.Integer, primary_key=True))
+        m.reflect(self.engine, only=["rt_b", "rt_c"], max_workers=2)
+        is_(m.tables["rt_a"], rt_a)
+        assert m.tables["rt_b"].c.a_id.references(rt_a.c.id)
+
+    def test_worker_error(self):
+        patch, threads = self._patch_reflecttable(fail_on="rt_d")
+        m = MetaData()
+        with patch:
+            assert_raises_message(
+                sa.exc.InvalidRequestError,
+                "can't reflect rt_d",
+                m.reflect,
+                self.engine,
+                only=self.names,
+                max_workers=3,
+            )
+        not_in_("rt_d", m.tables)
+
+    def test_worker_unreflectable_table(self):
+        patch, threads = self._patch_reflecttable(
+            fail_on="rt_d", exc_cls=sa.exc.UnreflectableTableError
+        )
+        m = MetaData()
+        with patch, expect_warnings("Skipping table rt_d"):
+            m.reflect(self.engine, only=self.names, max_workers=3)
+        eq_(set(m.tables), set(["rt_b", "rt_c", "rt_e", "rt_f", "rt_a"]))
+
+
 class CreateDropTest(fixtures.TestBase):
     __backend__ = True
 
@@ -1,8 +1,15 @@
 import weakref
 
+from sqlalchemy import Column
 from sqlalchemy import exc
+from sqlalchemy import Integer
 from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import true
 from sqlalchemy.ext.declarative import clsregistry
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import clear_mappers
+from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
@@ -238,3 +245,63 @@ class ClsRegistryTest(fixtures.TestBase):
         del f4
         gc_collect()
         assert "single" not in reg
+
+
+class ClassResolverTest(fixtures.TestBase):
+    def setup(self):
+        Base = declarative_base()
+
+        class User(Base):
+            __tablename__ = "users"
+
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+        self.User = User
+        self.resolver = clsregistry._resolver(User, MockProp())
+
+    def teardown(self):
+        clear_mappers()
+
+    def test_class_name(self):
+        is_(self.resolver("User")(), self.User)
+
+    def test_class_name_not_evaluated(self):
+        resolver = self.resolver("User.name")
+        is_(resolver._resolve_name(), self.User.name)
+
+    def test_class_attribute(self):
+        is_(self.resolver("User.name")(), self.User.name)
+        is_(self.resolver("users.c.name")(), self.User.__table__.c.name)
+
+    def test_constants(self):
+        for arg in ("None", "True", "False"):
+            assert_raises(KeyError, self.resolver(arg)._resolve_name)
+
+        is_(self.resolver("None")(), None)
+        is_(self.resolver("True")(), True)
+        is_(self.resolver("False")(), False)
+
+    def test_name_outside_registry(self):
+        # names located in the sqlalchemy namespace rather than in the
+        # registry are still resolved
+        is_(self.resolver("true")(), true)
+
+    def test_expression_evaluated(self):
+        expr = self.resolver("User.id == User.name")()
+        eq_(str(expr), "users.id = users.name")
+
+    def test_unknown_name(self):
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "When initializing mapper some_parent, expression 'Unknown' "
+            "failed to locate a name",
+            self.resolver("Unknown"),
+        )
+
+    def test_unknown_attribute(self):
+        assert_raises_message(
+            AttributeError,
+            "does not have a mapped column named 'nonexistent'",
+            self.resolver("User.nonexistent"),
+        )
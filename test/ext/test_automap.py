@@ -3,6 +3,7 @@ import threading
 import time
 
 from sqlalchemy import create_engine
+from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
@@ -10,12 +11,14 @@ from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.ext.automap import generate_relationship
+from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import configure_mappers
 from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import interfaces
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.mock import patch
@@ -234,6 +237,166 @@ class AutomapTest(fixtures.MappedTest):
             ]
         )
 
+    def _relationship_summary(self, cls):
+        return sorted(
+            (
+                prop.key,
+                prop.direction,
+                prop.mapper.class_.__name__,
+                prop.uselist,
+                prop.secondary.name if prop.secondary is not None else None,
+                sorted(prop.cascade),
+                prop.passive_deletes,
+                sorted(rev.key for rev in prop._reverse_property),
+                sorted(
+                    (left.table.name, left.name, right.table.name, right.name)
+                    for left, right in prop.local_remote_pairs
+                ),
+            )
+            for prop in cls.__mapper__.relationships
+        )
+
+    def test_render_module(self):
+        Base = automap_base(metadata=self.metadata)
+        Base.prepare()
+
+        namespace = {}
+        exec(compile(Base.render_module(), "<automap>", "exec"), namespace)
+        configure_mappers()
+
+        eq_(
+            sorted(namespace["Base"].metadata.tables),
+            sorted(self.metadata.tables),
+        )
+        for name in Base.classes.keys():
+            cls, rendered_cls = Base.classes[name], namespace[name]
+            eq_(
+                [
+                    (col.key, col.type._type_affinity)
+                    for col in cls.__table__.c
+                ],
+                [
+                    (col.key, col.type._type_affinity)
+                    for col in rendered_cls.__table__.c
+                ],
+            )
+            eq_(
+                self._relationship_summary(rendered_cls),
+                self._relationship_summary(cls),
+            )
+
+        Order, Item = namespace["orders"], namespace["items"]
+        o1 = Order()
+        i1 = Item()
+        o1.items_collection.append(i1)
+        assert o1 in i1.orders_collection
+
+    def test_render_module_invalid_classname(self):
+        Base = automap_base(metadata=self.metadata)
+
+        def classname_for_table(base, tablename, table):
+            return str("my " + tablename)
+
+        Base.prepare(classname_for_table=classname_for_table)
+        assert_raises_message(
+            exc.ArgumentError,
+            r"Can't render class name 'my \w+' as a Python identifier",
+            Base.render_module,
+        )
+
+    def test_render_module_keyword_classname(self):
+        Base = automap_base(metadata=self.metadata)
+
+        def classname_for_table(base, tablename, table):
+            return "class" if tablename == "keywords" else str(tablename)
+
+        Base.prepare(classname_for_table=classname_for_table)
+        assert_raises_message(
+            exc.ArgumentError,
+            "Can't render class name 'class' as a Python identifier",
+            Base.render_module,
+        )
+
+    def test_render_module_classname_conflicts_with_import(self):
+        m = MetaData()
+        Table(
+            "text",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("x", Integer, server_default="5"),
+        )
+        Base = automap_base(metadata=m)
+        Base.prepare()
+        assert_raises_message(
+            exc.ArgumentError,
+            "Can't render class name 'text', which conflicts with a name "
+            "the module imports or defines",
+            Base.render_module,
+        )
+
+    def test_render_module_classname_conflicts_with_module_names(self):
+        for name in (
+            "Base",
+            "Column",
+            "relationship",
+            "and_",
+            "t_item_keywords",
+        ):
+
+            def classname_for_table(base, tablename, table):
+                return name if tablename == "users" else str(tablename)
+
+            Base = automap_base(metadata=self.metadata)
+            Base.prepare(classname_for_table=classname_for_table)
+            assert_raises_message(
+                exc.ArgumentError,
+                "Can't render class name %r, which conflicts" % name,
+                Base.render_module,
+            )
+            clear_mappers()
+
+    def test_render_module_keyword_relationship_name(self):
+        Base = automap_base(metadata=self.metadata)
+
+        def name_for_scalar_relationship(
+            base, local_cls, referred_cls, constraint
+        ):
+            if local_cls.__name__ == "addresses":
+                return "global"
+            return referred_cls.__name__.lower()
+
+        Base.prepare(name_for_scalar_relationship=name_for_scalar_relationship)
+        assert_raises_message(
+            exc.ArgumentError,
+            "Can't render relationship name 'global' on class 'addresses' "
+            "as a Python identifier",
+            Base.render_module,
+        )
+
+    def test_render_module_keyword_column(self):
+        m = MetaData()
+        Table("parent", m, Column("from", Integer, primary_key=True))
+        Table(
+            "child",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("parent_from", ForeignKey("parent.from")),
+        )
+        Base = automap_base(metadata=m)
+        Base.prepare()
+
+        rendered = Base.render_module()
+        assert "parent.__table__.c['from']" in rendered
+
+        namespace = {}
+        exec(compile(rendered, "<automap>", "exec"), namespace)
+        configure_mappers()
+        parent_table = namespace["parent"].__table__
+        eq_(
+            namespace["child"].parent.property.remote_side,
+            set([parent_table.c["from"]]),
+        )
+
 
 class CascadeTest(fixtures.MappedTest):
     @classmethod
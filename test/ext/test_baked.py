@@ -4,9 +4,11 @@ import itertools
 from sqlalchemy import bindparam
 from sqlalchemy import exc as sa_exc
 from sqlalchemy import func
+from sqlalchemy import inspect
 from sqlalchemy import testing
 from sqlalchemy.ext import baked
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import attributes
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import defaultload
 from sqlalchemy.orm import exc as orm_exc
@@ -1342,6 +1344,44 @@ class LazyLoaderTest(testing.AssertsCompiledSQL, BakedTest):
 
         eq_(paramdict1, paramdict2)
 
+    def test_lazyload_query_reused(self):
+        User, Address = self._o2m_fixture()
+
+        strategy = User.addresses.property._lazy_strategy
+        lru = strategy._bakery(lambda q: None)._bakery
+
+        sess = Session()
+        for u in sess.query(User):
+            u.addresses
+
+        # one BakedQuery assembled; the bakery holds a single query
+        # context along with its compiled statement
+        eq_(list(strategy._lazyload_queries), [True])
+        eq_(len(lru), 2)
+
+        u1 = sess.query(User).get(7)
+        sess.expire(u1, ["addresses"])
+        state = inspect(u1)
+        eq_(
+            User.addresses.impl.get(
+                state,
+                state.dict,
+                passive=attributes.PASSIVE_OFF | attributes.NO_AUTOFLUSH,
+            ),
+            [Address(id=1, email_address="jack@bean.com")],
+        )
+
+        eq_(set(strategy._lazyload_queries), {True, False})
+        eq_(len(lru), 4)
+
+        sess.close()
+        u1 = sess.query(User).options(defaultload(User.addresses)).get(7)
+        eq_(u1.addresses, [Address(id=1, email_address="jack@bean.com")])
+
+        # queries with loader options are assembled per load
+        eq_(set(strategy._lazyload_queries), {True, False})
+        eq_(len(lru), 6)
+
     # additional tests:
     # 1. m2m w lazyload
     # 2. o2m lazyload where m2o backrefs have an eager load, test
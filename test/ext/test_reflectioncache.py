@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy.ext.automap import automap_base
+from sqlalchemy.ext.reflectioncache import ReflectionCache
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing.mock import patch
+from sqlalchemy.testing.schema import Column
+from sqlalchemy.testing.schema import Table
+
+
+class ReflectionCacheTest(fixtures.TablesTest):
+    __requires__ = ("schema_fingerprint",)
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(30)),
+        )
+        Table(
+            "addresses",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("user_id", Integer, ForeignKey("users.id")),
+            Column("email", String(50)),
+            Index("ix_addresses_email", "email"),
+            test_needs_fk=True,
+        )
+
+    def setup(self):
+        self.path = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.path)
+
+    def _assert_reflected(self, metadata):
+        users, addresses = (
+            metadata.tables["users"],
+            metadata.tables["addresses"],
+        )
+        eq_(users.c.keys(), ["id", "name"])
+        eq_(addresses.c.keys(), ["id", "user_id", "email"])
+        eq_(list(users.primary_key), [users.c.id])
+        assert addresses.c.user_id.references(users.c.id)
+        eq_(
+            [list(idx.columns) for idx in addresses.indexes],
+            [[addresses.c.email]],
+        )
+
+    def test_reflect_from_cache(self):
+        cache = ReflectionCache(self.path)
+
+        m1 = MetaData()
+        cache.reflect(m1, testing.db, only=["users", "addresses"])
+        self._assert_reflected(m1)
+        eq_(len(os.listdir(self.path)), 1)
+
+        m2 = MetaData()
+        with patch.object(testing.db.dialect, "reflecttable") as reflecttable:
+            cache.reflect(m2, testing.db, only=["users", "addresses"])
+        eq_(reflecttable.mock_calls, [])
+        self._assert_reflected(m2)
+        eq_(len(os.listdir(self.path)), 1)
+
+    def test_unloadable_file(self):
+        cache = ReflectionCache(self.path)
+        cache.reflect(MetaData(), testing.db, only=["users", "addresses"])
+        (filename,) = os.listdir(self.path)
+        filename = os.path.join(self.path, filename)
+
+        for content in [
+            b"",
+            b"not a pickle",
+            # AttributeError
+            b"csqlalchemy.sql.schema\nNoSuchClass\n.",
+            # ImportError
+            b"cno_such_module\nNoSuchClass\n.",
+            # TypeError
+            b"c__builtin__\nint\n(S'1'\nS'2'\nS'3'\ntR.",
+            # ValueError
+            b"c__builtin__\nint\n(S'x'\ntR.",
+        ]:
+            with open(filename, "wb") as file_:
+                file_.write(content)
+
+            m = MetaData()
+            with patch.object(
+                testing.db.dialect,
+                "reflecttable",
+                wraps=testing.db.dialect.reflecttable,
+            ) as reflecttable:
+                cache.reflect(m, testing.db, only=["users", "addresses"])
+            eq_(len(reflecttable.mock_calls), 2)
+            self._assert_reflected(m)
+            eq_(os.listdir(self.path), [os.path.basename(filename)])
+
+            # the file was replaced with the newly reflected tables
+            m = MetaData()
+            with patch.object(
+                testing.db.dialect, "reflecttable"
+            ) as reflecttable:
+                cache.reflect(m, testing.db, only=["users", "addresses"])
+            eq_(reflecttable.mock_calls, [])
+            self._assert_reflected(m)
+
+    def test_schema_change_invalidates(self):
+        cache = ReflectionCache(self.path)
+
+        m1 = MetaData()
+        cache.reflect(m1, testing.db)
+        assert "rc_extra" not in m1.tables
+
+        extra = MetaData()
+        Table("rc_extra", extra, Column("id", Integer, primary_key=True))
+        extra.create_all(testing.db)
+        try:
+            m2 = MetaData()
+            cache.reflect(m2, testing.db)
+            assert "rc_extra" in m2.tables
+            self._assert_reflected(m2)
+        finally:
+            extra.drop_all(testing.db)
+
+        eq_(len(os.listdir(self.path)), 2)
+
+    def test_no_fingerprint(self):
+        cache = ReflectionCache(self.path)
+
+        m1 = MetaData()
+        with patch.object(
+            testing.db.dialect, "get_schema_fingerprint", return_value=None
+        ):
+            cache.reflect(m1, testing.db, only=["users", "addresses"])
+        self._assert_reflected(m1)
+        assert not os.path.exists(self.path) or not os.listdir(self.path)
+
+    def test_extend_existing(self):
+        cache = ReflectionCache(self.path)
+        cache.reflect(MetaData(), testing.db, only=["users", "addresses"])
+
+        m1 = MetaData()
+        Table("users", m1, Column("id", Integer, primary_key=True))
+        cache.reflect(
+            m1,
+            testing.db,
+            only=["users", "addresses"],
+            extend_existing=True,
+            autoload_replace=False,
+        )
+        self._assert_reflected(m1)
+
+    def test_automap(self):
+        cache = ReflectionCache(self.path)
+
+        Base = automap_base()
+        Base.prepare(testing.db, reflect=True, reflection_cache=cache)
+
+        Base = automap_base()
+        with patch.object(testing.db.dialect, "reflecttable") as reflecttable:
+            Base.prepare(testing.db, reflect=True, reflection_cache=cache)
+        eq_(reflecttable.mock_calls, [])
+
+        User, Address = Base.classes.users, Base.classes.addresses
+        a1 = Address(email="e1")
+        u1 = User(name="u1", addresses_collection=[a1])
+        assert a1.users is u1
@@ -36,6 +36,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_not_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -3406,6 +3407,55 @@ class SubqueryAliasingTest(fixtures.MappedTest, testing.AssertsCompiledSQL):
         )
 
 
+class ParentRowRunTest(_fixtures.FixtureTest):
+
+    """test that consecutive rows for the same parent locate it once."""
+
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Address = cls.classes("User", "Address")
+        mapper(
+            User,
+            cls.tables.users,
+            properties={
+                "addresses": relationship(
+                    Address,
+                    lazy="joined",
+                    order_by=cls.tables.addresses.c.id,
+                )
+            },
+        )
+        mapper(Address, cls.tables.addresses)
+
+    def _assert_identity_lookups(self, sess, expected):
+        User = self.classes.User
+
+        get = mock.Mock(side_effect=sess.identity_map.get)
+        with mock.patch.object(sess.identity_map, "get", get):
+            users = sess.query(User).order_by(User.id).all()
+
+        eq_(users, self.static.user_address_result)
+        eq_(
+            len([c for c in get.mock_calls if c[1][0][0] is User]), expected
+        )
+
+    def test_new_objects(self):
+        sess = Session()
+
+        # four users, including three rows for user 8
+        self._assert_identity_lookups(sess, 4)
+
+    def test_existing_objects(self):
+        User = self.classes.User
+        sess = Session()
+        sess.query(User).all()
+
+        self._assert_identity_lookups(sess, 4)
+
+
 class LoadOnExistingTest(_fixtures.FixtureTest):
 
     """test that loaders from a base Query fully populate."""
@@ -13,6 +13,7 @@ from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
@@ -24,15 +25,14 @@ compiler = evaluator.EvaluatorCompiler()
 
 
 def eval_eq(clause, testcases=None):
-    evaluator = compiler.process(clause)
+    evaluators = [compiler.process(clause), compiler.compile(clause)]
 
     def testeval(obj=None, expected_result=None):
-        assert evaluator(obj) == expected_result, "%s != %r for %s with %r" % (
-            evaluator(obj),
-            expected_result,
-            clause,
-            obj,
-        )
+        for evaluate in evaluators:
+            assert evaluate(obj) == expected_result, (
+                "%s != %r for %s with %r"
+                % (evaluate(obj), expected_result, clause, obj)
+            )
 
     if testcases:
         for an_obj, result in testcases:
@@ -206,6 +206,62 @@ class EvaluateTest(fixtures.MappedTest):
             ],
         )
 
+    def test_compiled_nested_boolean_ops(self):
+        User = self.classes.User
+
+        eval_eq(
+            or_(
+                and_(User.name == "foo", User.id > 5),
+                and_(User.name == "bar", not_(User.id == None)),  # noqa
+            ),
+            testcases=[
+                (User(id=6, name="foo"), True),
+                (User(id=4, name="foo"), False),
+                (User(id=None, name="foo"), None),
+                (User(id=4, name="bar"), True),
+                (User(id=None, name="bar"), False),
+                (User(id=4, name=None), None),
+            ],
+        )
+
+    def test_compiled_cache(self):
+        User = self.classes.User
+
+        compiler = evaluator.EvaluatorCompiler(User)
+        cache = inspect(User)._evaluator_cache
+        cache.clear()
+
+        meth_one = compiler.compile(and_(User.name == "foo", User.id > 5))
+        eq_(len(cache), 1)
+
+        # same structure, different values; generated code is reused
+        meth_two = compiler.compile(and_(User.name == "bar", User.id > 2))
+        eq_(len(cache), 1)
+
+        # different operator; new code is generated
+        meth_three = compiler.compile(and_(User.name == "bar", User.id < 2))
+        eq_(len(cache), 2)
+
+        u1 = User(id=4, name="bar")
+        eq_(
+            [meth(u1) for meth in (meth_one, meth_two, meth_three)],
+            [False, True, False],
+        )
+
+    def test_compiled_callable_bind(self):
+        User = self.classes.User
+
+        compiler = evaluator.EvaluatorCompiler(User)
+
+        value = ["foo"]
+        expr = User.name == bindparam("x", callable_=lambda: value[0])
+        meth_one = compiler.compile(expr)
+        value[0] = "bar"
+        meth_two = compiler.compile(expr)
+
+        u1 = User(name="bar")
+        eq_((meth_one(u1), meth_two(u1)), (False, True))
+
 
 class M2OEvaluateTest(fixtures.DeclarativeMappedTest):
     @classmethod
@@ -240,3 +296,40 @@ class M2OEvaluateTest(fixtures.DeclarativeMappedTest):
         session.query(Child).filter(Child.parent == p).delete("evaluate")
 
         is_(inspect(c).deleted, True)
+
+
+class SingleInhEvaluateTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class Person(Base):
+            __tablename__ = "person"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(20))
+            name = Column(String(50))
+            __mapper_args__ = {"polymorphic_on": type}
+
+        class Engineer(Person):
+            __mapper_args__ = {"polymorphic_identity": "engineer"}
+
+        class Manager(Person):
+            __mapper_args__ = {"polymorphic_identity": "manager"}
+
+    def test_compiled_cache_sibling_class(self):
+        Engineer, Manager = self.classes("Engineer", "Manager")
+
+        e1 = Engineer(name="e1")
+
+        compiler = evaluator.EvaluatorCompiler(Engineer)
+        meth = compiler.compile(Engineer.name == "e1")
+        eq_(meth(e1), True)
+
+        # the same column, annotated with a sibling mapper, is not
+        # evaluated using the code generated for Engineer.name
+        assert_raises_message(
+            evaluator.UnevaluatableError,
+            "Can't evaluate criteria against alternate class",
+            compiler.compile,
+            Manager.name == "e1",
+        )
@@ -1694,6 +1694,71 @@ class RefreshTest(_fixtures.FixtureTest):
         s.refresh(u)
         assert u.name == "jack"
 
+    def test_refresh_many(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+        s = create_session()
+        users = s.query(User).order_by(User.id).all()
+        for u in users:
+            u.name = "foo"
+
+        def go():
+            s.refresh_many(users)
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_([u.name for u in users], ["jack", "ed", "fred", "chuck"])
+        for u in users:
+            assert u not in s.dirty
+
+    def test_refresh_many_attribute_names(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+        s = create_session()
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).order_by(User.id)
+        s.expire(u8, ["name"])
+
+        def go():
+            s.refresh_many([u7, u8], ["name"])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(u7.name, "jack")
+            eq_(u8.name, "ed")
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_refresh_many_on_deleted_raises(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+        s = create_session()
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).order_by(User.id)
+        s.execute(users.delete().where(users.c.id == 8))
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Could not refresh instance",
+            s.refresh_many,
+            [u7, u8],
+        )
+
+    def test_refresh_many_persistence_check(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        s = create_session()
+        u = s.query(User).get(7)
+        s.expunge_all()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"is not persistent within this Session",
+            s.refresh_many,
+            [u],
+        )
+
     def test_refresh_with_lazy(self):
         """test that when a lazy loader is set as a trigger on an object's
         attribute (at the attribute level, not the class level), a refresh()
@@ -27,6 +27,8 @@ from sqlalchemy import String
 from sqlalchemy import table
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy import type_coerce
+from sqlalchemy import TypeDecorator
 from sqlalchemy import Unicode
 from sqlalchemy import union
 from sqlalchemy import util
@@ -343,6 +345,116 @@ class RowTupleTest(QueryTest):
         row = q.first()
         eq_(row, (User(id=7), [7]))
 
+    def _column_entity_fixture(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users, properties={"uname": users.c.name})
+
+        return mock.patch.object(
+            sa.orm.query._ColumnEntity,
+            "row_processor",
+            side_effect=sa.orm.query._ColumnEntity.row_processor,
+            autospec=True,
+        )
+
+    def test_column_entities_direct_to_tuple(self):
+        User = self.classes.User
+
+        class MyType(TypeDecorator):
+            impl = String
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        with self._column_entity_fixture() as row_processor:
+            sess = create_session()
+            rows = (
+                sess.query(
+                    User.id,
+                    User.uname,
+                    type_coerce(User.uname, MyType).label("upper"),
+                )
+                .filter(User.id.in_([7, 8]))
+                .order_by(User.id)
+                .all()
+            )
+            eq_(rows, [(7, "jack", "HI jack"), (8, "ed", "HI ed")])
+            eq_(rows[0].keys(), ["id", "uname", "upper"])
+            eq_(rows[1].upper, "HI ed")
+
+            rows = list(
+                sess.query(User.id, User.uname)
+                .order_by(User.id)
+                .yield_per(1)
+            )
+            eq_(rows[0:2], [(7, "jack"), (8, "ed")])
+
+            rows = (
+                sess.query(User.id, User.uname)
+                .from_self()
+                .order_by(User.id)
+                .all()
+            )
+            eq_(rows[0].uname, "jack")
+
+        eq_(row_processor.mock_calls, [])
+
+    def test_column_entities_with_mapper_entity(self):
+        User = self.classes.User
+
+        with self._column_entity_fixture() as row_processor:
+            sess = create_session()
+            rows = (
+                sess.query(User.id, User)
+                .filter(User.id.in_([7, 8]))
+                .order_by(User.id)
+                .all()
+            )
+            eq_(rows, [(7, User(id=7)), (8, User(id=8))])
+            eq_(rows[0].User.uname, "jack")
+
+        eq_(len(row_processor.mock_calls), 1)
+
+    def test_tuple_rows_option_ignored_for_entities(self):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(Address, order_by=addresses.c.id)
+            },
+        )
+        mapper(Address, addresses)
+
+        sess = Session(bind=testing.db.execution_options(tuple_rows=True))
+        eq_(
+            sess.query(User).options(joinedload(User.addresses)).get(8),
+            User(
+                id=8,
+                addresses=[Address(id=2), Address(id=3), Address(id=4)],
+            ),
+        )
+
+        rows = (
+            sess.query(User, User.name)
+            .filter(User.id.in_([7, 9]))
+            .order_by(User.id)
+            .all()
+        )
+        eq_(rows, [(User(id=7), "jack"), (User(id=9), "fred")])
+
+        rows = sess.query(User.id, User.name).order_by(User.id).all()
+        eq_(rows[0], (7, "jack"))
+        eq_(rows[0].name, "jack")
+
+        u1 = User(name="newuser")
+        sess.add(u1)
+        sess.flush()
+        eq_(sess.query(User.name).filter_by(id=u1.id).scalar(), "newuser")
+        sess.rollback()
+
 
 class BindSensitiveStringifyTest(fixtures.TestBase):
     def _fixture(self, bind_to=None):
@@ -883,6 +995,151 @@ class GetTest(QueryTest):
         assert u.addresses[0].email_address == "jack@bean.com"
         assert u.orders[1].items[2].description == "item 5"
 
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = Session()
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).order_by(User.id)
+
+        def go():
+            eq_(
+                s.query(User).get_many([8, 9, 19, 7, 10, 9]),
+                [
+                    u8,
+                    s.query(User).get(9),
+                    None,
+                    u7,
+                    s.query(User).get(10),
+                    s.query(User).get(9),
+                ],
+            )
+
+        # one SELECT for 9, 10 and 19; the rest are in the identity map
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_many_all_present(self):
+        User = self.classes.User
+
+        s = Session()
+        users = s.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(s.get_many(User, [10, 9, 8, 7]), list(reversed(users)))
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_get_many_chunksize(self):
+        User = self.classes.User
+
+        s = Session()
+
+        def go():
+            eq_(
+                [u.id for u in s.query(User).get_many([7, 8, 9], chunksize=2)],
+                [7, 8, 9],
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_get_many_chunksize_from_dialect(self):
+        User = self.classes.User
+
+        s = Session()
+        with mock.patch.object(testing.db.dialect, "max_bind_parameters", 1):
+
+            def go():
+                eq_(
+                    [u.id for u in s.query(User).get_many([7, 8, 9])],
+                    [7, 8, 9],
+                )
+
+            self.assert_sql_count(testing.db, go, 3)
+
+    def test_get_many_bind_from_statement(self):
+        User = self.classes.User
+
+        clauses = []
+
+        class ClauseBindSession(Session):
+            def get_bind(self, mapper=None, clause=None):
+                clauses.append(clause)
+                return testing.db
+
+        s = ClauseBindSession()
+        with mock.patch.object(testing.db.dialect, "max_bind_parameters", 1):
+
+            def go():
+                eq_(
+                    [u.id for u in s.query(User).get_many([7, 8, 9])],
+                    [7, 8, 9],
+                )
+
+            self.assert_sql_count(testing.db, go, 3)
+
+        # the bind used to determine the chunk size is located in terms
+        # of the statement, as is the bind used to execute it
+        assert clauses
+        assert None not in clauses
+
+    def test_get_many_expired(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        s.expire(u7)
+
+        def go():
+            eq_(s.query(User).get_many([7, 8]), [u7, s.query(User).get(8)])
+            eq_(u7.name, "jack")
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_many_expired_deleted(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        s.expire(u7)
+        s.execute(self.tables.users.delete().where(User.id == 7))
+
+        eq_(s.query(User).get_many([7]), [None])
+        assert u7 not in s
+
+    def test_get_many_dict_ident(self):
+        User = self.classes.User
+
+        s = Session()
+        eq_(
+            [u.id for u in s.query(User).get_many([{"id": 8}, {"id": 7}])],
+            [8, 7],
+        )
+
+    @testing.requires.tuple_in
+    def test_get_many_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        one_two, none = s.query(CompositePk).get_many([(1, 2), (100, 100)])
+        eq_((one_two.i, one_two.j, one_two.k), (1, 2, 3))
+        is_(none, None)
+
+    def test_get_many_populate_existing(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        u7.name = "ed"
+
+        eq_(s.query(User).populate_existing().get_many([7]), [u7])
+        eq_(u7.name, "jack")
+
+    def test_get_many_criterion_raises(self):
+        User = self.classes.User
+
+        s = Session()
+        q = s.query(User).filter(User.id == 7)
+        assert_raises(sa_exc.InvalidRequestError, q.get_many, [7])
+
 
 class InvalidGenerationsTest(QueryTest, AssertsCompiledSQL):
     def test_no_limit_offset(self):
@@ -21,6 +21,7 @@ from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
 from sqlalchemy.testing import mock
 
 
@@ -1186,6 +1187,28 @@ class AdaptedJoinTest(_JoinFixtures, fixtures.TestBase, AssertsCompiledSQL):
             "AND pj.id = composite_selfref.parent_id",
         )
 
+    def test_join_targets_cached(self):
+        joincond = self._join_fixture_o2m()
+        right = select([joincond.child_persist_selectable]).alias("pj")
+
+        targets = joincond.join_targets(
+            joincond.parent_persist_selectable, right, True
+        )
+        for elem, cached in zip(
+            targets,
+            joincond.join_targets(
+                joincond.parent_persist_selectable, right, True
+            ),
+        ):
+            is_(cached, elem)
+
+        other = select([joincond.child_persist_selectable]).alias("pj2")
+        pj, sj, sec, adapter, ds = joincond.join_targets(
+            joincond.parent_persist_selectable, other, True
+        )
+        is_not_(pj, targets[0])
+        self.assert_compile(pj, "lft.id = pj2.lid")
+
 
 class LazyClauseTest(_JoinFixtures, fixtures.TestBase, AssertsCompiledSQL):
     __dialect__ = "default"
@@ -2234,6 +2234,55 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             ),
         )
 
+    def _assert_chunks(self, go, chunks):
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id AS a_id FROM a ORDER BY a.id", {}),
+            *[
+                CompiledSQL(
+                    "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                    "FROM b WHERE b.a_id IN "
+                    "([EXPANDING_primary_keys]) ORDER BY b.a_id, b.id",
+                    {"primary_keys": list(chunk)},
+                )
+                for chunk in chunks
+            ]
+        )
+
+    def test_relationship_chunksize(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            with mock.patch.object(A.bs.property, "selectin_chunksize", 30):
+                q = session.query(A).options(selectinload(A.bs)).order_by(A.id)
+
+                for a in q:
+                    a.bs
+
+        self._assert_chunks(
+            go,
+            [range(1, 31), range(31, 61), range(61, 91), range(91, 101)],
+        )
+
+    def test_chunksize_limited_by_dialect(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            with mock.patch.object(
+                testing.db.dialect, "max_bind_parameters", 40
+            ):
+                q = session.query(A).options(selectinload(A.bs)).order_by(A.id)
+
+                for a in q:
+                    a.bs
+
+        self._assert_chunks(go, [range(1, 41), range(41, 81), range(81, 101)])
+
 
 class SubRelationFromJoinedSubclassMultiLevelTest(_Polymorphic):
     @classmethod
@@ -2692,6 +2741,223 @@ class SelfReferentialTest(fixtures.MappedTest):
         self.assert_sql_count(testing.db, go, 4)
 
 
+class RecursiveTest(fixtures.DeclarativeMappedTest):
+    """test selectinload(recursive=True)."""
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class Node(fixtures.ComparableEntity, Base):
+            __tablename__ = "nodes"
+            id = Column(Integer, primary_key=True)
+            parent_id = Column(ForeignKey("nodes.id"))
+            data = Column(String(30))
+            children = relationship("Node", order_by="Node.data")
+            parent = relationship("Node", remote_side=id, viewonly=True)
+
+    @classmethod
+    def insert_data(cls):
+        Node = cls.classes.Node
+
+        session = Session()
+        session.add_all(
+            [
+                Node(
+                    id=1,
+                    data="n1",
+                    children=[
+                        Node(id=2, data="n11"),
+                        Node(
+                            id=3,
+                            data="n12",
+                            children=[
+                                Node(
+                                    id=4,
+                                    data="n121",
+                                    children=[Node(id=5, data="n1211")],
+                                ),
+                                Node(id=6, data="n122"),
+                            ],
+                        ),
+                    ],
+                ),
+                Node(id=7, data="n2", children=[Node(id=8, data="n21")]),
+                Node(id=9, data="n3"),
+            ]
+        )
+        session.commit()
+
+    def _tree(self):
+        Node = self.classes.Node
+        return [
+            Node(
+                data="n1",
+                children=[
+                    Node(data="n11", children=[]),
+                    Node(
+                        data="n12",
+                        children=[
+                            Node(
+                                data="n121",
+                                children=[Node(data="n1211", children=[])],
+                            ),
+                            Node(data="n122", children=[]),
+                        ],
+                    ),
+                ],
+            ),
+            Node(data="n2", children=[Node(data="n21", children=[])]),
+            Node(data="n3", children=[]),
+        ]
+
+    def _assert_tree(self, count):
+        Node = self.classes.Node
+        session = Session()
+
+        def go():
+            roots = (
+                session.query(Node)
+                .filter(Node.parent_id.is_(None))
+                .options(selectinload(Node.children, recursive=True))
+                .order_by(Node.data)
+                .all()
+            )
+            eq_(roots, self._tree())
+
+        self.assert_sql_count(testing.db, go, count)
+
+    @testing.requires.recursive_ctes
+    def test_recursive_cte(self):
+        self._assert_tree(2)
+
+    def test_recursive_per_level(self):
+        with mock.patch.object(
+            testing.db.dialect, "supports_recursive_ctes", False
+        ):
+            # the root query, then one per level, the last of which
+            # locates no further children
+            self._assert_tree(5)
+
+    @testing.requires.recursive_ctes
+    def test_recursive_cte_nested_parents(self):
+        Node = self.classes.Node
+        session = Session()
+
+        def go():
+            nodes = (
+                session.query(Node)
+                .options(selectinload(Node.children, recursive=True))
+                .order_by(Node.id)
+                .all()
+            )
+            eq_(nodes[0], self._tree()[0])
+            eq_(
+                [[child.id for child in node.children] for node in nodes],
+                [[2, 3], [], [4, 6], [5], [], [], [8], [], []],
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_recursive_per_level_nested_parents(self):
+        Node = self.classes.Node
+        session = Session()
+
+        def go():
+            nodes = (
+                session.query(Node)
+                .options(selectinload(Node.children, recursive=True))
+                .order_by(Node.id)
+                .all()
+            )
+            eq_(
+                [[child.id for child in node.children] for node in nodes],
+                [[2, 3], [], [4, 6], [5], [], [], [8], [], []],
+            )
+
+        with mock.patch.object(
+            testing.db.dialect, "supports_recursive_ctes", False
+        ):
+            # every node was already loaded as a parent, so the
+            # first level is the only one
+            self.assert_sql_count(testing.db, go, 2)
+
+    def test_recursive_not_collection(self):
+        Node = self.classes.Node
+        session = Session()
+
+        assert_raises_message(
+            sa.exc.InvalidRequestError,
+            "Recursive selectin loading can only be applied to a "
+            "self-referential collection; 'Node.parent' is not.",
+            session.query(Node)
+            .options(selectinload(Node.parent, recursive=True))
+            .all,
+        )
+
+
+class RecursiveCycleTest(fixtures.DeclarativeMappedTest):
+    """test selectinload(recursive=True) against rows which are each
+    other's parent."""
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class Node(Base):
+            __tablename__ = "nodes"
+            id = Column(Integer, primary_key=True)
+            parent_id = Column(Integer)
+            children = relationship(
+                "Node",
+                primaryjoin="Node.id == foreign(Node.parent_id)",
+                order_by="Node.id",
+            )
+
+    @classmethod
+    def insert_data(cls):
+        Node = cls.classes.Node
+        testing.db.execute(
+            Node.__table__.insert(),
+            [
+                {"id": 1, "parent_id": 2},
+                {"id": 2, "parent_id": 1},
+                {"id": 3, "parent_id": 2},
+            ],
+        )
+
+    def _assert_cycle(self, count):
+        Node = self.classes.Node
+        session = Session()
+
+        def go():
+            node = (
+                session.query(Node)
+                .filter(Node.id == 1)
+                .options(selectinload(Node.children, recursive=True))
+                .one()
+            )
+            eq_([child.id for child in node.children], [2])
+            eq_(
+                [child.id for child in node.children[0].children], [1, 3]
+            )
+            eq_(node.children[0].children[1].children, [])
+
+        self.assert_sql_count(testing.db, go, count)
+
+    @testing.requires.recursive_ctes
+    def test_recursive_cte(self):
+        self._assert_cycle(2)
+
+    def test_recursive_per_level(self):
+        with mock.patch.object(
+            testing.db.dialect, "supports_recursive_ctes", False
+        ):
+            # the root query, then one per level; node 1 is not loaded
+            # again as a child of node 2
+            self._assert_cycle(4)
+
+
 class SelfRefInheritanceAliasedTest(
     fixtures.DeclarativeMappedTest, testing.AssertsCompiledSQL
 ):
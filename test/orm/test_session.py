@@ -1655,7 +1655,7 @@ class SessionInterface(fixtures.TestBase):
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blacklist = set(("begin", "query"))
+        blacklist = set(("begin", "query", "get_many"))
 
         ok = set()
         for meth in Session.public_methods:
@@ -1725,6 +1725,8 @@ class SessionInterface(fixtures.TestBase):
 
         raises_("refresh", user_arg)
 
+        raises_("refresh_many", (user_arg,))
+
         instance_methods = (
             self._public_session_methods()
             - self._class_methods
@@ -4,6 +4,7 @@ from sqlalchemy import column
 from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
+from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import or_
 from sqlalchemy import select
@@ -242,6 +243,35 @@ class UpdateDeleteTest(fixtures.MappedTest):
 
         eq_(sess.query(User).order_by(User.id).all(), [jack, jane])
 
+    def test_evaluate_identity_map_maintained(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = Session()
+
+        john, jack = sess.query(User).filter(User.id < 3).order_by(User.id)
+        a1 = Address(id=1)
+        sess.add(a1)
+        sess.flush()
+
+        # establishes the per-class index in the identity map
+        sess.query(User).filter(User.name == "john").delete("evaluate")
+        assert john not in sess
+
+        # objects loaded after the index is built are also located
+        jill, jane = sess.query(User).filter(User.id > 2).order_by(User.id)
+        sess.query(User).filter(User.age > 30).update(
+            {"age": User.age - 10}, synchronize_session="evaluate"
+        )
+        eq_([jack.age, jill.age, jane.age], [37, 29, 27])
+
+        sess.expunge(jane)
+        sess.query(User).update({"age": 5}, synchronize_session="evaluate")
+        eq_([jack.age, jill.age, jane.age], [5, 5, 27])
+        eq_(
+            set(sess.identity_map._all_states_for_class(User)),
+            {inspect(jack), inspect(jill)},
+        )
+
     def test_delete_against_metadata(self):
         User = self.classes.User
         users = self.tables.users
@@ -509,6 +539,158 @@ class UpdateDeleteTest(fixtures.MappedTest):
             list(zip([25, 37, 29, 27])),
         )
 
+    def test_update_with_fetch_strategy_bulk_refresh(self):
+        User = self.classes.User
+
+        sess = Session()
+
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            sess.query(User).filter(User.age > 29).update(
+                {"age": User.age - 10}, synchronize_session="fetch"
+            )
+            eq_([john.age, jack.age, jill.age, jane.age], [25, 37, 29, 27])
+
+        # SELECT of matched primary keys, UPDATE, then a single
+        # SELECT to refresh the matched objects
+        with mock.patch.object(testing.db.dialect, "full_returning", False):
+            self.assert_sql_count(testing.db, go, 3)
+
+    def _implicit_returning_disabled(self, on_table):
+        if on_table:
+            return mock.patch.object(
+                self.tables.users, "implicit_returning", False
+            )
+        else:
+            return mock.patch.object(
+                testing.db.dialect, "implicit_returning", False
+            )
+
+    def _test_update_fetch_implicit_returning_disabled(self, on_table):
+        User = self.classes.User
+
+        sess = Session()
+
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            sess.query(User).filter(User.age > 29).update(
+                {"age": User.age - 10}, synchronize_session="fetch"
+            )
+            eq_([john.age, jack.age, jill.age, jane.age], [25, 37, 29, 27])
+
+        # SELECT of matched primary keys, UPDATE, then the refresh
+        with mock.patch.object(testing.db.dialect, "full_returning", True):
+            with self._implicit_returning_disabled(on_table):
+                self.assert_sql_count(testing.db, go, 3)
+
+    def _test_delete_fetch_implicit_returning_disabled(self, on_table):
+        User = self.classes.User
+
+        sess = Session()
+
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            sess.query(User).filter(User.age > 29).delete(
+                synchronize_session="fetch"
+            )
+
+        # SELECT of matched primary keys, then DELETE
+        with mock.patch.object(testing.db.dialect, "full_returning", True):
+            with self._implicit_returning_disabled(on_table):
+                self.assert_sql_count(testing.db, go, 2)
+        assert jack not in sess
+        assert jane not in sess
+        assert john in sess
+
+    def test_update_fetch_dialect_implicit_returning_disabled(self):
+        self._test_update_fetch_implicit_returning_disabled(False)
+
+    def test_update_fetch_table_implicit_returning_disabled(self):
+        self._test_update_fetch_implicit_returning_disabled(True)
+
+    def test_delete_fetch_dialect_implicit_returning_disabled(self):
+        self._test_delete_fetch_implicit_returning_disabled(False)
+
+    def test_delete_fetch_table_implicit_returning_disabled(self):
+        self._test_delete_fetch_implicit_returning_disabled(True)
+
+    @testing.requires.full_returning
+    @testing.requires.returning
+    def test_update_with_fetch_strategy_returning(self):
+        User = self.classes.User
+
+        sess = Session()
+
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            rowcount = (
+                sess.query(User)
+                .filter(User.age > 29)
+                .update(
+                    {"age": User.age - 10, "name": User.name + "x"},
+                    synchronize_session="fetch",
+                )
+            )
+            eq_(rowcount, 2)
+            eq_([john.age, jack.age, jill.age, jane.age], [25, 37, 29, 27])
+            eq_(
+                [john.name, jack.name, jill.name, jane.name],
+                ["john", "jackx", "jill", "janex"],
+            )
+
+        # UPDATE..RETURNING only
+        self.assert_sql_count(testing.db, go, 1)
+        assert jack not in sess.dirty
+        eq_(
+            sess.query(User.age, User.name).order_by(User.id).all(),
+            [(25, "john"), (37, "jackx"), (29, "jill"), (27, "janex")],
+        )
+
+    @testing.requires.full_returning
+    @testing.requires.returning
+    def test_update_with_fetch_strategy_returning_pk_change(self):
+        User = self.classes.User
+
+        sess = Session()
+
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            sess.query(User).filter(User.age > 29).update(
+                {"id": User.id + 10}, synchronize_session="fetch"
+            )
+
+        # primary key is changing, so RETURNING can't be used to locate
+        # objects; SELECT of matched primary keys, UPDATE, then the refresh
+        self.assert_sql_count(testing.db, go, 3)
+
+    @testing.requires.full_returning
+    @testing.requires.returning
+    def test_delete_with_fetch_strategy_returning(self):
+        User = self.classes.User
+
+        sess = Session()
+
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            rowcount = (
+                sess.query(User)
+                .filter(User.age > 29)
+                .delete(synchronize_session="fetch")
+            )
+            eq_(rowcount, 2)
+
+        # DELETE..RETURNING only
+        self.assert_sql_count(testing.db, go, 1)
+        assert jack not in sess
+        assert jane not in sess
+        assert john in sess
+
     @testing.fails_if(lambda: not testing.db.dialect.supports_sane_rowcount)
     def test_update_returns_rowcount(self):
         User = self.classes.User
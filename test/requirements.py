@@ -484,6 +484,12 @@ class DefaultRequirements(SuiteRequirements):
     def indexes_with_expressions(self):
         return only_on(["postgresql", "sqlite>=3.9.0"])
 
+    @property
+    def schema_fingerprint(self):
+        """target dialect implements Inspector.get_schema_fingerprint()"""
+
+        return only_on(["postgresql>=9.0", "sqlite"])
+
     @property
     def temp_table_names(self):
         """target dialect supports listing of temporary table names"""
@@ -104,6 +104,7 @@ class CompareAndCopyTest(fixtures.TestBase):
         lambda: (
             column("q") == column("x"),
             column("q") == column("y"),
+            column("q") > column("x"),
             column("z") == column("x"),
         ),
         lambda: (
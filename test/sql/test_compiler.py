@@ -80,6 +80,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import eq_ignore_whitespace
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import ne_
 from sqlalchemy.util import u
 
 
@@ -2473,6 +2474,47 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
         expr = column("x") == bindparam("key", callable_=lambda: 12)
         self.assert_compile(expr, "x = :key", {"x": 12})
 
+    def test_construct_params_repeated(self):
+        c = (
+            select([table1])
+            .where(
+                and_(
+                    table1.c.myid == bindparam("x", required=True),
+                    table1.c.name == bindparam("y", value="default"),
+                    table1.c.description
+                    == bindparam("z", callable_=lambda: 7),
+                )
+            )
+            .compile()
+        )
+        for i in range(3):
+            eq_(c.construct_params({"x": i}), {"x": i, "y": "default", "z": 7})
+            eq_(
+                c.construct_params({"x": i, "y": "y1", "z": "z1", "q": 5}),
+                {"x": i, "y": "y1", "z": "z1"},
+            )
+            eq_(c.params, {"x": None, "y": "default", "z": 7})
+
+    def test_construct_params_key_precedence(self):
+        # a bound parameter may be given by key or by its compiled
+        # name; the key takes precedence
+        b1 = bindparam("foo", type_=Integer, unique=True)
+        b2 = bindparam("bar", type_=Integer)
+        c = (
+            select([table1])
+            .where(and_(table1.c.myid == b1, table1.c.name == b2))
+            .compile()
+        )
+        key, name = b1.key, c.bind_names[b1]
+        ne_(name, key)
+
+        eq_(c.construct_params({key: 1, "bar": 2}), {name: 1, "bar": 2})
+        eq_(c.construct_params({name: 1, "bar": 2}), {name: 1, "bar": 2})
+        eq_(
+            c.construct_params({name: 1, key: 3, "bar": 2}),
+            {name: 3, "bar": 2},
+        )
+
     def test_bind_params_missing(self):
         assert_raises_message(
             exc.InvalidRequestError,
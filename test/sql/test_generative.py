@@ -23,6 +23,7 @@ from sqlalchemy.sql import table
 from sqlalchemy.sql import util as sql_util
 from sqlalchemy.sql import visitors
 from sqlalchemy.sql.elements import _clone
+from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.expression import _from_objects
 from sqlalchemy.sql.visitors import ClauseVisitor
 from sqlalchemy.sql.visitors import cloned_traverse
@@ -365,6 +366,67 @@ class ClauseTest(fixtures.TestBase, AssertsCompiledSQL):
         assert c1 == str(clause)
         assert str(clause2) == str(t1.join(t2, t1.c.col2 == t2.c.col3))
 
+    def _deep_binary_fixture(self):
+        expr = t1.c.col1
+        for i in range(1500):
+            expr = expr + t2.c.col2
+        return expr
+
+    def _leftmost(self, expr):
+        depth = 0
+        while isinstance(expr, BinaryExpression):
+            expr = expr.left
+            depth += 1
+        return expr, depth
+
+    def test_deep_binary_cloned_traverse(self):
+        expr = self._deep_binary_fixture()
+
+        visited = []
+        clone = cloned_traverse(expr, {}, {"binary": visited.append})
+
+        eq_(len(visited), 1500)
+        is_not_(clone, expr)
+        leftmost, depth = self._leftmost(clone)
+        eq_(depth, 1500)
+        is_(leftmost, t1.c.col1)
+
+        # each nested binary is a distinct copy
+        eq_(len({id(binary) for binary in visited}), 1500)
+        for binary in visited:
+            is_(binary.right, t2.c.col2)
+
+    def test_deep_binary_adapt(self):
+        expr = self._deep_binary_fixture()
+        t1a = t1.alias()
+
+        adapted = sql_util.ClauseAdapter(t1a).traverse(expr)
+
+        leftmost, depth = self._leftmost(adapted)
+        eq_(depth, 1500)
+        is_(leftmost, t1a.c.col1)
+        is_(adapted.right.table, t2)
+
+    def test_deep_binary_replace_once(self):
+        expr = self._deep_binary_fixture()
+        t1a = t1.alias()
+
+        replaced = []
+
+        def replace(elem):
+            replaced.append(elem)
+            if elem is t1.c.col1:
+                return t1a.c.col1
+
+        adapted = visitors.replacement_traverse(expr, {}, replace)
+
+        leftmost, depth = self._leftmost(adapted)
+        eq_(depth, 1500)
+        is_(leftmost, t1a.c.col1)
+
+        # replace() is called once for each distinct element
+        eq_(len(replaced), 1502)
+
     def test_aliased_column_adapt(self):
         t1.select()
 
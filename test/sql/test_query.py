@@ -3,6 +3,7 @@ from sqlalchemy import asc
 from sqlalchemy import bindparam
 from sqlalchemy import cast
 from sqlalchemy import desc
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import except_
 from sqlalchemy import ForeignKey
@@ -604,6 +605,96 @@ class QueryTest(fixtures.TestBase):
                 [{"uname": ["fred"]}, {"uname": ["ed"]}],
             )
 
+    def test_expanding_in_statement_cached(self):
+        stmt = select([users.c.user_id]).where(
+            users.c.user_name.in_(bindparam("uname", expanding=True))
+        )
+        with testing.db.connect() as conn:
+            statements = []
+
+            @event.listens_for(conn, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, statement, parameters, context, executemany
+            ):
+                statements.append((statement, len(parameters)))
+
+            compiled = stmt.compile(dialect=conn.dialect)
+            for values in (["jack", "fred"], ["ed", "wendy"], ["jack"], []):
+                conn.execute(compiled, {"uname": values})
+
+        eq_([count for statement, count in statements], [2, 2, 1, 0])
+        is_(statements[0][0], statements[1][0])
+        eq_(len(compiled._expanded_statements), 3)
+
+    def test_expanding_in_padded(self):
+        testing.db.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+                dict(user_id=9, user_name="ed"),
+            ],
+        )
+
+        stmt = (
+            select([users])
+            .where(users.c.user_name.in_(bindparam("uname", expanding=True)))
+            .order_by(users.c.user_id)
+        )
+        with testing.db.connect() as conn:
+            conn = conn.execution_options(pad_in_lists=True)
+            counts = []
+
+            @event.listens_for(conn, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, statement, parameters, context, executemany
+            ):
+                counts.append(len(parameters))
+
+            eq_(
+                conn.execute(
+                    stmt, {"uname": ["jack", "fred", "ed"]}
+                ).fetchall(),
+                [(7, "jack"), (8, "fred"), (9, "ed")],
+            )
+            eq_(
+                conn.execute(stmt, {"uname": ["fred"]}).fetchall(),
+                [(8, "fred")],
+            )
+            eq_(conn.execute(stmt, {"uname": []}).fetchall(), [])
+
+        eq_(counts, [4, 1, 0])
+
+    @testing.only_on("sqlite")
+    def test_expanding_in_named_paramstyle(self):
+        stmt = (
+            select([users])
+            .where(users.c.user_name.in_(bindparam("uname", expanding=True)))
+            .where(users.c.user_id > bindparam("uid"))
+            .order_by(users.c.user_id)
+        )
+        eng = engines.testing_engine(options={"paramstyle": "named"})
+        with eng.connect() as conn:
+            users.create(conn, checkfirst=True)
+            conn.execute(users.delete())
+            conn.execute(
+                users.insert(),
+                [
+                    dict(user_id=7, user_name="jack"),
+                    dict(user_id=8, user_name="fred"),
+                    dict(user_id=9, user_name="ed"),
+                ],
+            )
+            eq_(
+                conn.execute(
+                    stmt, {"uname": ["jack", "fred", "ed"], "uid": 7}
+                ).fetchall(),
+                [(8, "fred"), (9, "ed")],
+            )
+            eq_(
+                conn.execute(stmt, {"uname": [], "uid": 7}).fetchall(), []
+            )
+
     @testing.requires.no_quoting_special_bind_names
     def test_expanding_in_special_chars(self):
         testing.db.execute(
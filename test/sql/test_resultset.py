@@ -32,6 +32,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
 from sqlalchemy.testing import le_
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing import not_in_
@@ -39,6 +40,7 @@ from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.mock import patch
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
+from sqlalchemy.testing.util import picklers
 
 
 class ResultProxyTest(fixtures.TablesTest):
@@ -1220,6 +1222,166 @@ class ResultProxyTest(fixtures.TablesTest):
             finally:
                 r.close()
 
+    def test_metadata_cached_on_compiled(self):
+        users = self.tables.users
+
+        with testing.db.connect() as conn:
+            compiled = select([users]).compile(conn)
+            r1 = conn.execute(compiled)
+            r2 = conn.execute(compiled)
+            is_(r1._metadata, r2._metadata)
+            eq_(r2.keys(), ["user_id", "user_name"])
+            r1.close()
+            r2.close()
+
+            r3 = conn.execute(select([users]))
+            is_not_(r3._metadata, r1._metadata)
+            r3.close()
+
+    def test_metadata_cache_description_changed(self):
+        users = self.tables.users
+
+        with testing.db.connect() as conn:
+            compiled = text("select * from users").compile(conn)
+            r1 = conn.execute(compiled)
+            r1.close()
+
+            description = [
+                (rec[0] + "_x",) + tuple(rec[1:])
+                for rec in r1._cursor_description()
+            ]
+            with patch.object(
+                _result.ResultProxy,
+                "_cursor_description",
+                Mock(return_value=description),
+            ):
+                r2 = conn.execute(compiled)
+                is_not_(r2._metadata, r1._metadata)
+                eq_(
+                    [k.lower() for k in r2.keys()],
+                    ["%s_x" % c.name for c in users.c],
+                )
+                r2.close()
+
+            r3 = conn.execute(compiled)
+            is_not_(r3._metadata, r2._metadata)
+            eq_([k.lower() for k in r3.keys()], [c.name for c in users.c])
+            r3.close()
+
+    def test_tuple_rows(self):
+        users = self.tables.users
+
+        class MyType(TypeDecorator):
+            impl = String(20)
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        users.insert().execute(
+            {"user_id": 7, "user_name": "jack"},
+            {"user_id": 8, "user_name": "ed"},
+        )
+        stmt = (
+            select(
+                [
+                    users.c.user_id,
+                    type_coerce(users.c.user_name, MyType).label("user_name"),
+                ]
+            )
+            .order_by(users.c.user_id)
+            .execution_options(tuple_rows=True)
+        )
+
+        rows = testing.db.execute(stmt).fetchall()
+        eq_(rows, [(7, "HI jack"), (8, "HI ed")])
+        assert isinstance(rows[0], tuple)
+        eq_(rows[0].user_id, 7)
+        eq_(rows[1].user_name, "HI ed")
+        eq_(rows[0].keys(), ["user_id", "user_name"])
+        eq_(rows[0]._asdict(), {"user_id": 7, "user_name": "HI jack"})
+        is_(type(rows[0]), type(rows[1]))
+
+        result = testing.db.execute(stmt)
+        eq_(result.fetchone(), (7, "HI jack"))
+        eq_(result.fetchmany(5), [(8, "HI ed")])
+        eq_(result.fetchone(), None)
+
+        eq_(list(testing.db.execute(stmt)), [(7, "HI jack"), (8, "HI ed")])
+        eq_(testing.db.execute(stmt).first().user_name, "HI jack")
+        eq_(testing.db.execute(stmt).scalar(), 7)
+
+        with testing.db.connect() as conn:
+            conn = conn.execution_options(tuple_rows=True)
+            row = conn.execute(
+                users.select().order_by(users.c.user_id)
+            ).first()
+            eq_(row, (7, "jack"))
+            eq_(row.user_name, "jack")
+
+    def test_tuple_rows_ambiguous(self):
+        users = self.tables.users
+        addresses = self.tables.addresses
+
+        users.insert().execute(user_id=1, user_name="john")
+        addresses.insert().execute(
+            address_id=1, user_id=1, address="foo@bar.com"
+        )
+
+        row = testing.db.execute(
+            select([users.c.user_id, addresses.c.user_id, users.c.user_name])
+            .select_from(users.join(addresses))
+            .execution_options(tuple_rows=True)
+        ).first()
+        eq_(row, (1, 1, "john"))
+        eq_(row.user_name, "john")
+        assert not hasattr(row, "user_id")
+
+    @testing.requires.full_returning
+    def test_tuple_rows_implicit_returning(self):
+        users = self.tables.users
+
+        with patch.object(
+            testing.db.dialect, "implicit_returning", True
+        ), testing.db.connect() as conn:
+            conn = conn.execution_options(tuple_rows=True)
+
+            result = conn.execute(users.insert(), user_name="jack")
+            eq_(result.inserted_primary_key, [1])
+
+            result = conn.execute(
+                users.insert().return_defaults(), user_name="ed"
+            )
+            eq_(result.inserted_primary_key, [2])
+            eq_(result.returned_defaults[users.c.user_id], 2)
+
+            result = conn.execute(
+                users.update()
+                .where(users.c.user_id == 2)
+                .return_defaults(users.c.user_id),
+                user_name="fred",
+            )
+            eq_(result.returned_defaults[users.c.user_id], 2)
+
+            rows = conn.execute(
+                users.select().order_by(users.c.user_id)
+            ).fetchall()
+            eq_(rows, [(1, "jack"), (2, "fred")])
+            eq_(rows[1].user_name, "fred")
+
+    def test_tuple_rows_pickle(self):
+        users = self.tables.users
+
+        users.insert().execute(user_id=7, user_name="jack")
+        rows = testing.db.execute(
+            users.select().execution_options(tuple_rows=True)
+        ).fetchall()
+
+        for loads, dumps in picklers():
+            unpickled = loads(dumps(rows))
+            eq_(unpickled, [(7, "jack")])
+            eq_(unpickled[0].user_name, "jack")
+            eq_(unpickled[0].keys(), ["user_id", "user_name"])
+
 
 class KeyTargetingTest(fixtures.TablesTest):
     run_inserts = "once"
@@ -1789,6 +1951,9 @@ class AlternateResultProxyTest(fixtures.TablesTest):
                     r = conn.execute(stmt)
                     eq_(r.scalar(), "HI THERE")
 
+                r = conn.execution_options(tuple_rows=True).execute(stmt)
+                eq_(r.fetchall(), [("HI THERE",)])
+
     def test_buffered_row_growth(self):
         with self._proxy_fixture(_result.BufferedRowResultProxy):
             with self.engine.connect() as conn: